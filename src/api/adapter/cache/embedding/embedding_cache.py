@@ -0,0 +1,93 @@
+import asyncio
+import hashlib
+import os
+from typing import Dict, List, Set
+
+import numpy as np
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from src.api.adapter.cache.embedding.memory_embedding_cache import (
+    MemoryEmbeddingCache,
+)
+from src.api.adapter.cache.embedding.mongodb_embedding_cache import (
+    MongoDBEmbeddingCache,
+)
+
+
+class EmbeddingCache:
+    _memory: MemoryEmbeddingCache = None
+    _mongodb: MongoDBEmbeddingCache = None
+    _pending_writes: Set[asyncio.Task] = set()
+    _dtype: np.dtype = np.dtype(np.float64)
+
+    @classmethod
+    def initialize(cls, database: AsyncIOMotorDatabase) -> None:
+        backend_names = {
+            name.strip()
+            for name in os.getenv("EMBEDDING_CACHE_BACKENDS", "").split(",")
+            if name.strip()
+        }
+        cls._dtype = np.dtype(os.getenv("EMBEDDING_CACHE_DTYPE", "float64"))
+
+        cls._memory = (
+            MemoryEmbeddingCache(
+                max_bytes=int(
+                    os.getenv("EMBEDDING_CACHE_MEMORY_MAX_BYTES", "268435456")
+                )
+            )
+            if "memory" in backend_names
+            else None
+        )
+        cls._mongodb = (
+            MongoDBEmbeddingCache(
+                database=database,
+                collection_name=os.getenv(
+                    "EMBEDDING_CACHE_MONGODB_COLLECTION", "embedding_cache"
+                ),
+                ttl_seconds=int(
+                    os.getenv("EMBEDDING_CACHE_MONGODB_TTL_SECONDS", "2592000")
+                ),
+            )
+            if "mongodb" in backend_names
+            else None
+        )
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._pending_writes:
+            await asyncio.gather(*cls._pending_writes, return_exceptions=True)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._memory is not None or cls._mongodb is not None
+
+    @classmethod
+    def get_key(cls, model_name: str, text: str) -> str:
+        return f"{model_name}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+    @classmethod
+    async def get_many(cls, keys: List[str]) -> Dict[str, np.ndarray]:
+        vectors = cls._memory.get_many(keys) if cls._memory else {}
+
+        missing_keys = [key for key in keys if key not in vectors]
+        if cls._mongodb and missing_keys:
+            stored_vectors = await cls._mongodb.get_many(missing_keys)
+            if cls._memory and stored_vectors:
+                cls._memory.set_many(stored_vectors)
+            vectors.update(stored_vectors)
+
+        return vectors
+
+    @classmethod
+    def set_many(cls, vectors: Dict[str, List[float]]) -> None:
+        compact_vectors = {
+            key: np.asarray(vector, dtype=cls._dtype) for key, vector in vectors.items()
+        }
+
+        if cls._memory:
+            cls._memory.set_many(compact_vectors)
+
+        if cls._mongodb:
+            task = asyncio.create_task(cls._mongodb.set_many(compact_vectors))
+            cls._pending_writes.add(task)
+            task.add_done_callback(cls._pending_writes.discard)
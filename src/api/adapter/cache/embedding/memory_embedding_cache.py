@@ -0,0 +1,41 @@
+from collections import OrderedDict
+from typing import Dict, List
+
+import numpy as np
+
+
+class MemoryEmbeddingCache:
+    def __init__(self, max_bytes: int) -> None:
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        vectors = {}
+        for key in keys:
+            vector = self._vectors.get(key)
+            if vector is not None:
+                self._vectors.move_to_end(key)
+                vectors[key] = vector
+        return vectors
+
+    def set_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        for key, vector in vectors.items():
+            size = self._get_size(key, vector)
+            if size > self._max_bytes:
+                continue
+
+            self._remove(key)
+            self._vectors[key] = vector
+            self._bytes += size
+
+        while self._bytes > self._max_bytes:
+            self._remove(next(iter(self._vectors)))
+
+    def _remove(self, key: str) -> None:
+        vector = self._vectors.pop(key, None)
+        if vector is not None:
+            self._bytes -= self._get_size(key, vector)
+
+    def _get_size(self, key: str, vector: np.ndarray) -> int:
+        return len(key) + vector.nbytes
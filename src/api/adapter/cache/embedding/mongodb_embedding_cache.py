@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import numpy as np
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from src.api.core.log.config.log_config import LogConfig
+
+
+class MongoDBEmbeddingCache:
+    def __init__(
+        self, database: AsyncIOMotorDatabase, collection_name: str, ttl_seconds: int
+    ) -> None:
+        self.collection = database[collection_name]
+        self._logconfig = LogConfig()
+        self._ttl_seconds = ttl_seconds
+        self._indexed = False
+
+    async def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        try:
+            documents = await self.collection.find(
+                {"_id": {"$in": keys}}, {"vector": 1, "dtype": 1}
+            ).to_list(length=None)
+        except Exception as exception:
+            self._log_error("find", exception)
+            return {}
+
+        return {
+            document["_id"]: np.frombuffer(
+                document["vector"], dtype=document.get("dtype", "float32")
+            )
+            for document in documents
+        }
+
+    async def set_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        created_at = datetime.now(timezone.utc)
+        try:
+            await self._create_index()
+            await self.collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": key},
+                        {
+                            "$setOnInsert": {
+                                "vector": vector.tobytes(),
+                                "dtype": vector.dtype.name,
+                                "dimensions": int(vector.shape[0]),
+                                "created_at": created_at,
+                            }
+                        },
+                        upsert=True,
+                    )
+                    for key, vector in vectors.items()
+                ],
+                ordered=False,
+            )
+        except Exception as exception:
+            self._log_error("bulk_write", exception)
+
+    async def _create_index(self) -> None:
+        if self._indexed:
+            return
+        await self.collection.create_index(
+            "created_at", expireAfterSeconds=self._ttl_seconds
+        )
+        self._indexed = True
+
+    def _log_error(self, operation_name: str, exception: Exception) -> None:
+        self._logconfig.get_logger().warning(
+            "CACHE LOG: MongoDB embedding cache unavailable",
+            operation=operation_name,
+            exception=str(exception),
+        )
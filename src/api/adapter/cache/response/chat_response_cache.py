@@ -0,0 +1,126 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from typing import List, Optional, Set
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from src.api.adapter.cache.response.response_cache import CacheEntry, ResponseCache
+from src.api.adapter.cache.response.memory_response_cache import (
+    MemoryResponseCache,
+)
+from src.api.adapter.cache.response.mongodb_response_cache import (
+    MongoDBResponseCache,
+)
+from src.api.adapter.http.v1.middleware.header_middleware import get_cache_control
+from src.api.adapter.http.v1.payload.response.chat_response import ChatResponse
+from src.api.adapter.service.provider.azure_openai.domain.chat_completion import (
+    ChatCompletion,
+)
+
+
+class CacheControl:
+    _MAX_AGE_PATTERN = re.compile(r"max-age\s*=\s*(\d+)")
+
+    def __init__(self, header: Optional[str]) -> None:
+        directives = (header or "").lower()
+        self.no_store = "no-store" in directives
+        self.no_cache = "no-cache" in directives
+        max_age = self._MAX_AGE_PATTERN.search(directives)
+        self.max_age: Optional[int] = int(max_age.group(1)) if max_age else None
+
+
+class ChatResponseCache:
+    _backends: List[ResponseCache] = None
+    _pending_writes: Set[asyncio.Task] = set()
+    _ttl: int = int(os.getenv("CHAT_CACHE_TTL_SECONDS", "3600"))
+
+    @classmethod
+    def initialize(cls, database: AsyncIOMotorDatabase) -> None:
+        backend_names = [
+            name.strip()
+            for name in os.getenv("CHAT_CACHE_BACKENDS", "").split(",")
+            if name.strip()
+        ]
+        backends = {
+            "memory": lambda: MemoryResponseCache(
+                max_bytes=int(os.getenv("CHAT_CACHE_MEMORY_MAX_BYTES", "67108864"))
+            ),
+            "mongodb": lambda: MongoDBResponseCache(
+                database=database,
+                collection_name=os.getenv(
+                    "CHAT_CACHE_MONGODB_COLLECTION", "chat_response_cache"
+                ),
+            ),
+        }
+        cls._backends = [backends[name]() for name in backend_names if name in backends]
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._pending_writes:
+            await asyncio.gather(*cls._pending_writes, return_exceptions=True)
+
+    @classmethod
+    def get_key(cls, chat_completion: ChatCompletion) -> Optional[str]:
+        if not cls._backends or chat_completion.temperature != 0:
+            return None
+
+        if CacheControl(get_cache_control()).no_store:
+            return None
+
+        payload = json.dumps(
+            chat_completion.model_dump(exclude_none=True, mode="json"),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @classmethod
+    async def get(cls, key: Optional[str]) -> Optional[ChatResponse]:
+        if key is None:
+            return None
+
+        cache_control = CacheControl(get_cache_control())
+        if cache_control.no_cache:
+            return None
+
+        for index, backend in enumerate(cls._backends):
+            entry = await backend.get(key)
+            if entry is None:
+                continue
+
+            if (
+                cache_control.max_age is not None
+                and time.time() - entry.created_at > cache_control.max_age
+            ):
+                return None
+
+            for upper_backend in cls._backends[:index]:
+                await upper_backend.set(key, entry)
+
+            return ChatResponse.model_validate_json(entry.value)
+
+        return None
+
+    @classmethod
+    async def set(cls, key: Optional[str], chat_response: ChatResponse) -> None:
+        if key is None:
+            return
+
+        now = time.time()
+        entry = CacheEntry(
+            value=chat_response.model_dump_json(
+                exclude_none=True, exclude={"cost"}, by_alias=True
+            ),
+            created_at=now,
+            expires_at=now + cls._ttl,
+        )
+
+        for backend in cls._backends:
+            task = asyncio.create_task(backend.set(key, entry))
+            cls._pending_writes.add(task)
+            task.add_done_callback(cls._pending_writes.discard)
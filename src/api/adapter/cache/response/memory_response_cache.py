@@ -0,0 +1,45 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.api.adapter.cache.response.response_cache import CacheEntry, ResponseCache
+
+
+class MemoryResponseCache(ResponseCache):
+    def __init__(self, max_bytes: int) -> None:
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.time():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        size = self._get_size(key, entry)
+        if size > self._max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = entry
+        self._bytes += size
+
+        while self._bytes > self._max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= self._get_size(key, entry)
+
+    def _get_size(self, key: str, entry: CacheEntry) -> int:
+        return len(key) + len(entry.value)
@@ -0,0 +1,64 @@
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from src.api.adapter.cache.response.response_cache import CacheEntry, ResponseCache
+from src.api.core.log.config.log_config import LogConfig
+
+
+class MongoDBResponseCache(ResponseCache):
+    def __init__(self, database: AsyncIOMotorDatabase, collection_name: str) -> None:
+        self.collection = database[collection_name]
+        self._logconfig = LogConfig()
+        self._indexed = False
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            document = await self.collection.find_one({"_id": key})
+        except Exception as exception:
+            self._log_error("find_one", exception)
+            return None
+
+        if document is None:
+            return None
+
+        entry = CacheEntry(
+            value=document["value"],
+            created_at=document["created_at"].replace(tzinfo=timezone.utc).timestamp(),
+            expires_at=document["expires_at"].replace(tzinfo=timezone.utc).timestamp(),
+        )
+        return entry if entry.expires_at > time.time() else None
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        try:
+            await self._create_index()
+            await self.collection.replace_one(
+                {"_id": key},
+                {
+                    "value": entry.value,
+                    "created_at": datetime.fromtimestamp(
+                        entry.created_at, timezone.utc
+                    ),
+                    "expires_at": datetime.fromtimestamp(
+                        entry.expires_at, timezone.utc
+                    ),
+                },
+                upsert=True,
+            )
+        except Exception as exception:
+            self._log_error("replace_one", exception)
+
+    async def _create_index(self) -> None:
+        if self._indexed:
+            return
+        await self.collection.create_index("expires_at", expireAfterSeconds=0)
+        self._indexed = True
+
+    def _log_error(self, operation_name: str, exception: Exception) -> None:
+        self._logconfig.get_logger().warning(
+            "CACHE LOG: MongoDB response cache unavailable",
+            operation=operation_name,
+            exception=str(exception),
+        )
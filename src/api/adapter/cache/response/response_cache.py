@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from pydantic import BaseModel
+
+
+class CacheEntry(BaseModel):
+    value: str
+    created_at: float
+    expires_at: float
+
+
+class ResponseCache(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        pass
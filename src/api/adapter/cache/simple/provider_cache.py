@@ -1,48 +1,66 @@
-from typing import List, Optional
+import threading
+from typing import FrozenSet, List, Optional, Tuple
 
-from src.api.domain.provider import Provider, GenerationTypeFields
+from src.api.domain.price import Price
+from src.api.domain.provider import (
+    GenerationTypeFields,
+    Model,
+    ProcessType,
+    Provider,
+    ProviderCatalog,
+)
 from src.api.core.business.provider_business import ProviderBusiness
 
 
 class ProviderCache:
-    _providers: List[Provider] = None
+    _catalog: Optional[ProviderCatalog] = None
+    _lock = threading.Lock()
 
     @classmethod
-    def get_valid_provider_names(cls) -> List[str]:
-        providers: List[Provider] = cls.get_providers()
-        return [provider.name for provider in providers]
+    def load(cls, providers: List[Provider]) -> ProviderCatalog:
+        catalog = ProviderCatalog.build(
+            providers, version=cls._catalog.version + 1 if cls._catalog else 1
+        )
+        cls._catalog = catalog
+        return catalog
+
+    @classmethod
+    def get_catalog(cls) -> ProviderCatalog:
+        catalog = cls._catalog
+        if catalog is None:
+            with cls._lock:
+                catalog = cls._catalog or cls.load(ProviderBusiness().find())
+        return catalog
+
+    @classmethod
+    def get_valid_provider_names(cls) -> Tuple[str, ...]:
+        return cls.get_catalog().provider_names
 
     @classmethod
     def get_context_window_for_model(cls, model_name: str) -> Optional[int]:
-        providers: List[Provider] = cls.get_providers()
-        for provider in providers:
-            for model in provider.models:
-                if model.name == model_name:
-                    return model.context_window
-        return 0
-
-    @classmethod
-    def get_providers(cls) -> List[Provider]:
-        if cls._providers is None:
-            cls._providers = ProviderBusiness().find()
-        return cls._providers
-
-    @classmethod
-    def get_provider_model(cls, model_name: str):
-        providers: List[Provider] = cls.get_providers()
-        for provider in providers:
-            for model in provider.models:
-                if model.name == model_name:
-                    return model
-        return None
-
-    @classmethod
-    def get_model_by_type(cls, model_type: GenerationTypeFields) -> List[str]:
-        providers: List[Provider] = cls.get_providers()
-        model_names: List[str] = [
-            model.name
-            for provider in providers
-            for model in provider.models
-            if model.category.generation_type.value.id == model_type.value.id
-        ]
-        return model_names
+        model = cls.get_catalog().models.get(model_name)
+        return model.context_window if model is not None else 0
+
+    @classmethod
+    def get_providers(cls) -> Tuple[Provider, ...]:
+        return cls.get_catalog().providers
+
+    @classmethod
+    def get_provider(cls, provider_name: str) -> Optional[Provider]:
+        return cls.get_catalog().providers_by_name.get(provider_name)
+
+    @classmethod
+    def get_provider_model(cls, model_name: str) -> Optional[Model]:
+        return cls.get_catalog().models.get(model_name)
+
+    @classmethod
+    def get_model_by_type(cls, model_type: GenerationTypeFields) -> FrozenSet[str]:
+        return cls.get_catalog().models_by_generation_type[model_type.value.id]
+
+    @classmethod
+    def get_model_by_process_type(cls, process_type: ProcessType) -> FrozenSet[str]:
+        return cls.get_catalog().models_by_process_type[process_type]
+
+    @classmethod
+    def get_price(cls, model_name: str) -> Optional[Price]:
+        return cls.get_catalog().prices.get(model_name)
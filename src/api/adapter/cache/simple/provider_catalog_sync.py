@@ -0,0 +1,153 @@
+import asyncio
+import os
+from typing import Any, Dict, Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+
+from src.api.adapter.cache.simple.provider_cache import ProviderCache
+from src.api.core.business.provider_business import ProviderBusiness
+from src.api.core.log.config.log_config import LogConfig
+from src.api.domain.provider import Provider
+
+
+class ProviderCatalogSync:
+    _UPSERT_OPERATIONS = ("insert", "replace", "update")
+
+    _collection: Optional[AsyncIOMotorCollection] = None
+    _documents: Optional[Dict[Any, dict]] = None
+    _providers: Dict[Any, Provider] = {}
+    _task: Optional[asyncio.Task] = None
+    _polling = False
+    _backend: str = os.getenv("PROVIDER_CATALOG_BACKEND", "mongodb").lower()
+    _collection_name: str = os.getenv("PROVIDER_CATALOG_COLLECTION", "providers")
+    _poll_seconds: float = float(os.getenv("PROVIDER_CATALOG_POLL_SECONDS", "30"))
+    _load_timeout: float = float(
+        os.getenv("PROVIDER_CATALOG_LOAD_TIMEOUT_SECONDS", "5")
+    )
+
+    @classmethod
+    async def initialize(cls, database: AsyncIOMotorDatabase) -> None:
+        if cls._backend != "mongodb":
+            return
+
+        cls._collection = database[cls._collection_name]
+        try:
+            await asyncio.wait_for(cls._load(seed=True), timeout=cls._load_timeout)
+        except Exception as exception:
+            cls._log("load", exception)
+
+        cls._task = asyncio.create_task(cls._watch())
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            await asyncio.gather(cls._task, return_exceptions=True)
+            cls._task = None
+
+    @classmethod
+    async def _watch(cls) -> None:
+        while True:
+            try:
+                async with cls._collection.watch(
+                    full_document="updateLookup"
+                ) as stream:
+                    await cls._load()
+                    cls._polling = False
+                    async for change in stream:
+                        cls._apply(change)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                if not cls._polling:
+                    cls._log("watch", exception)
+                    cls._polling = True
+
+            await asyncio.sleep(cls._poll_seconds)
+            try:
+                await cls._load()
+            except Exception as exception:
+                cls._log("find", exception)
+
+    @classmethod
+    async def _load(cls, seed: bool = False) -> None:
+        documents = await cls._collection.find().to_list(length=None)
+
+        if not documents and seed:
+            for provider in ProviderBusiness().find():
+                await cls._collection.update_one(
+                    {"_id": provider.name},
+                    {"$setOnInsert": provider.to_dict()},
+                    upsert=True,
+                )
+            documents = await cls._collection.find().to_list(length=None)
+
+        documents = {document["_id"]: document for document in documents}
+        if documents == cls._documents:
+            return
+
+        if not documents:
+            LogConfig().get_logger().warning(
+                "CATALOG LOG: provider catalog collection is empty",
+                collection=cls._collection_name,
+            )
+
+        providers = {}
+        for key, document in documents.items():
+            provider = cls._to_provider(document) or cls._providers.get(key)
+            if provider is not None:
+                providers[key] = provider
+
+        cls._documents = documents
+        cls._providers = providers
+        cls._publish()
+
+    @classmethod
+    def _apply(cls, change: dict) -> None:
+        key = change["documentKey"]["_id"]
+
+        if change["operationType"] == "delete":
+            if cls._providers.pop(key, None) is None:
+                return
+            cls._documents.pop(key, None)
+        elif (
+            change["operationType"] in cls._UPSERT_OPERATIONS
+            and change.get("fullDocument") is not None
+        ):
+            provider = cls._to_provider(change["fullDocument"])
+            if provider is None:
+                return
+            cls._documents[key] = change["fullDocument"]
+            cls._providers[key] = provider
+        else:
+            return
+
+        cls._publish()
+
+    @classmethod
+    def _publish(cls) -> None:
+        catalog = ProviderCache.load(list(cls._providers.values()))
+        LogConfig().get_logger().info(
+            "CATALOG LOG: provider catalog loaded",
+            version=catalog.version,
+            providers=len(catalog.providers),
+            models=len(catalog.models),
+        )
+
+    @classmethod
+    def _to_provider(cls, document: dict) -> Optional[Provider]:
+        try:
+            return Provider.from_dict(document)
+        except Exception as exception:
+            cls._log("validate", exception, document_id=str(document.get("_id")))
+            return None
+
+    @classmethod
+    def _log(cls, operation_name: str, exception: Exception, **kwargs) -> None:
+        LogConfig().get_logger().warning(
+            "CATALOG LOG: MongoDB provider catalog unavailable",
+            operation=operation_name,
+            exception=str(exception) or type(exception).__name__,
+            collection=cls._collection_name,
+            **kwargs,
+        )
@@ -0,0 +1,90 @@
+import hashlib
+from typing import Dict, Optional, Tuple
+
+from src.api.adapter.cache.simple.provider_cache import ProviderCache
+from src.api.adapter.http.v1.mapper.provider_mapper import ProviderMapper
+from src.api.adapter.http.v1.payload.response.wrapper_response import WrapperResponse
+from src.api.core.exception.bad_request_exception import BadRequestException
+from src.api.domain.provider import GenerationType, ProcessType, ProviderCatalog
+
+
+class ProviderResponseCache:
+    _mapper = ProviderMapper()
+    _entries: Tuple[
+        int, Dict[Tuple[Optional[str], Optional[str]], Tuple[bytes, str]]
+    ] = (
+        0,
+        {},
+    )
+
+    @classmethod
+    def get(
+        cls, generation_type: Optional[str] = None, process_type: Optional[str] = None
+    ) -> Tuple[bytes, str]:
+        catalog = ProviderCache.get_catalog()
+        version, entries = cls._entries
+        if version != catalog.version:
+            entries = {}
+            cls._entries = (catalog.version, entries)
+
+        key = (generation_type, process_type)
+        entry = entries.get(key)
+        if entry is None:
+            entry = cls._build(catalog, generation_type, process_type)
+            entries[key] = entry
+        return entry
+
+    @classmethod
+    def _build(
+        cls,
+        catalog: ProviderCatalog,
+        generation_type: Optional[str],
+        process_type: Optional[str],
+    ) -> Tuple[bytes, str]:
+        model_names = set(catalog.models)
+        if generation_type is not None:
+            model_names &= catalog.models_by_generation_type[
+                cls._get_generation_type(generation_type).value.id
+            ]
+        if process_type is not None:
+            model_names &= catalog.models_by_process_type[
+                cls._get_process_type(process_type)
+            ]
+
+        providers = [
+            provider.model_copy(
+                update={
+                    "models": [
+                        model for model in provider.models if model.name in model_names
+                    ]
+                }
+            )
+            for provider in catalog.providers
+        ]
+        body = (
+            WrapperResponse(
+                data=cls._mapper.to_providers(
+                    [provider for provider in providers if provider.models]
+                )
+            )
+            .model_dump_json(by_alias=True, exclude_none=True)
+            .encode("utf-8")
+        )
+        return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+    @classmethod
+    def _get_generation_type(cls, name: str) -> GenerationType:
+        if name not in GenerationType.__members__:
+            raise BadRequestException(
+                params=[
+                    f"generationType must be one of {list(GenerationType.__members__)}"
+                ]
+            )
+        return GenerationType[name]
+
+    @classmethod
+    def _get_process_type(cls, value: str) -> ProcessType:
+        values = [process_type.value for process_type in ProcessType]
+        if value not in values:
+            raise BadRequestException(params=[f"processType must be one of {values}"])
+        return ProcessType(value)
@@ -0,0 +1,195 @@
+import asyncio
+import os
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from src.api.adapter.http.v1.middleware.header_middleware import (
+    set_background_correlation_id,
+)
+from src.api.adapter.http.v1.payload.response.quota_response import QuotaResponse
+from src.api.core.business.quota_business import QuotaBusiness
+from src.api.core.exception.not_found_exception import NotFoundException
+from src.api.core.exception.quota_exceeded_exception import QuotaExceededException
+from src.api.core.log.config.log_config import LogConfig
+
+QuotaKey = Tuple[str, str, str]
+
+
+class QuotaEntry:
+    def __init__(self, quota: Optional[QuotaResponse], balance: int) -> None:
+        self.quota = quota
+        self.balance = balance
+        self.loaded_at = time.monotonic()
+
+
+class QuotaCache:
+    _quota_business: Optional[QuotaBusiness] = None
+    _entries: Dict[QuotaKey, QuotaEntry] = {}
+    _loading: Dict[QuotaKey, asyncio.Task] = {}
+    _debits: Dict[QuotaKey, int] = {}
+    _flushing: Set[QuotaKey] = set()
+    _flush_task: Optional[asyncio.Task] = None
+    _task: Optional[asyncio.Task] = None
+    _wake: Optional[asyncio.Event] = None
+    _events = 0
+    _backend: str = "mongodb"
+    _ttl: float = 2.0
+    _flush_interval: float = 0.5
+    _flush_max_events: int = 1000
+
+    @classmethod
+    def initialize(cls, database: AsyncIOMotorDatabase) -> None:
+        cls._backend = os.getenv("QUOTA_BACKEND", "mongodb").lower()
+        cls._ttl = float(os.getenv("QUOTA_CACHE_TTL_MS", "2000")) / 1000
+        cls._flush_interval = (
+            float(os.getenv("QUOTA_CACHE_FLUSH_INTERVAL_MS", "500")) / 1000
+        )
+        cls._flush_max_events = int(os.getenv("QUOTA_CACHE_FLUSH_MAX_EVENTS", "1000"))
+
+        if not cls.is_enabled():
+            return
+
+        cls._quota_business = QuotaBusiness(database)
+        cls._wake = asyncio.Event()
+        cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            await asyncio.gather(cls._task, return_exceptions=True)
+            cls._task = None
+            set_background_correlation_id()
+            await cls._flush()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._backend == "memory"
+
+    @classmethod
+    def invalidate(cls, use_case_id: str, provider_name: str, model_name: str) -> None:
+        cls._entries.pop((use_case_id, provider_name, model_name), None)
+
+    @classmethod
+    async def reserve(
+        cls, use_case_id: str, provider_name: str, model_name: str, tokens: int
+    ) -> QuotaResponse:
+        key = (use_case_id, provider_name, model_name)
+        entry = cls._entries.get(key)
+        if entry is None or time.monotonic() - entry.loaded_at > cls._ttl:
+            entry = await cls._load(key)
+
+        if entry.quota is None:
+            raise NotFoundException("quotas")
+        if entry.balance < tokens:
+            raise QuotaExceededException(balance=entry.balance)
+
+        entry.balance -= tokens
+        cls._debit(key, tokens)
+        return entry.quota.model_copy(update={"balance": entry.balance})
+
+    @classmethod
+    def settle(cls, quota: QuotaResponse, tokens: int) -> None:
+        if tokens == 0:
+            return
+
+        key = (quota.use_case.id, quota.provider.name, quota.provider.model.name)
+        entry = cls._entries.get(key)
+        if entry is not None:
+            entry.balance += tokens
+        cls._debit(key, -tokens)
+
+    @classmethod
+    def _debit(cls, key: QuotaKey, tokens: int) -> None:
+        cls._debits[key] = cls._debits.get(key, 0) + tokens
+        cls._events += 1
+        if cls._events >= cls._flush_max_events and cls._wake is not None:
+            cls._wake.set()
+
+    @classmethod
+    async def _load(cls, key: QuotaKey) -> QuotaEntry:
+        task = cls._loading.get(key)
+        if task is None:
+            task = asyncio.create_task(cls._fetch(key))
+            cls._loading[key] = task
+            task.add_done_callback(lambda _: cls._loading.pop(key, None))
+        return await asyncio.shield(task)
+
+    @classmethod
+    async def _fetch(cls, key: QuotaKey) -> QuotaEntry:
+        if key in cls._flushing:
+            await asyncio.shield(cls._flush_task)
+
+        try:
+            quotas = await cls._quota_business.retrieve(
+                use_case_id=key[0],
+                provider_name=key[1],
+                model_name=key[2],
+                enabled=True,
+            )
+            quota = quotas[0]
+        except NotFoundException:
+            quota = None
+        except Exception as exception:
+            entry = cls._entries.get(key)
+            LogConfig().get_logger().warning(
+                "QUOTA LOG: failed to refresh quota",
+                exception=str(exception) or type(exception).__name__,
+                use_case_id=key[0],
+                provider_name=key[1],
+                model_name=key[2],
+                stale=entry is not None,
+            )
+            if entry is None:
+                raise
+            entry.loaded_at = time.monotonic()
+            return entry
+
+        entry = QuotaEntry(
+            quota=quota,
+            balance=(quota.balance if quota else 0) - cls._debits.get(key, 0),
+        )
+        cls._entries[key] = entry
+        return entry
+
+    @classmethod
+    async def _run(cls) -> None:
+        set_background_correlation_id()
+        while True:
+            try:
+                await asyncio.wait_for(cls._wake.wait(), timeout=cls._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            cls._wake.clear()
+            cls._flush_task = asyncio.create_task(cls._flush())
+            await asyncio.shield(cls._flush_task)
+
+    @classmethod
+    async def _flush(cls) -> None:
+        debits = {
+            key: tokens
+            for key, tokens in cls._debits.items()
+            if tokens and key not in cls._loading
+        }
+        for key in debits:
+            del cls._debits[key]
+        cls._events = 0
+
+        if not debits:
+            return
+
+        cls._flushing = set(debits)
+        try:
+            await cls._quota_business.debit_many(debits)
+        except Exception as exception:
+            for key, tokens in debits.items():
+                cls._debits[key] = cls._debits.get(key, 0) + tokens
+            LogConfig().get_logger().warning(
+                "QUOTA LOG: failed to flush quota debits",
+                exception=str(exception) or type(exception).__name__,
+                quotas=len(debits),
+            )
+        finally:
+            cls._flushing = set()
@@ -0,0 +1,373 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set, Tuple
+from uuid import uuid4
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from src.api.adapter.http.v1.middleware.header_middleware import (
+    set_background_correlation_id,
+)
+from src.api.adapter.http.v1.payload.response.quota_response import QuotaResponse
+from src.api.core.business.quota_business import QuotaBusiness
+from src.api.core.exception.not_found_exception import NotFoundException
+from src.api.core.exception.quota_exceeded_exception import QuotaExceededException
+from src.api.core.log.config.log_config import LogConfig
+
+QuotaKey = Tuple[str, str, str]
+
+
+class Lease:
+    def __init__(
+        self, quota: Optional[QuotaResponse], remaining: int, ttl: float
+    ) -> None:
+        self.id: Optional[str] = None
+        self.quota = quota
+        self.remaining = remaining
+        self.expires_at = time.monotonic() + ttl
+        self.used_at = time.monotonic()
+        self.retry_at = 0.0
+        self.refill_at = 0.0
+
+
+class QuotaLease:
+    _quota_business: Optional[QuotaBusiness] = None
+    _collection: Optional[AsyncIOMotorCollection] = None
+    _leases: Dict[QuotaKey, Lease] = {}
+    _claiming: Dict[QuotaKey, asyncio.Task] = {}
+    _pending_returns: Set[asyncio.Task] = set()
+    _task: Optional[asyncio.Task] = None
+    _backend: str = "mongodb"
+    _replica: str = os.getenv("HOSTNAME") or str(uuid4())
+    _slice_tokens: int = 10000
+    _refill_ratio: float = 0.25
+    _ttl: float = 30.0
+    _idle: float = 2.0
+    _retry: float = 1.0
+    _swept_at: float = 0.0
+    _indexed: bool = False
+
+    @classmethod
+    def initialize(cls, database: AsyncIOMotorDatabase) -> None:
+        cls._backend = os.getenv("QUOTA_BACKEND", "mongodb").lower()
+        cls._slice_tokens = int(os.getenv("QUOTA_LEASE_SLICE_TOKENS", "10000"))
+        cls._refill_ratio = float(os.getenv("QUOTA_LEASE_REFILL_RATIO", "0.25"))
+        cls._ttl = float(os.getenv("QUOTA_LEASE_TTL_MS", "30000")) / 1000
+        cls._idle = float(os.getenv("QUOTA_LEASE_IDLE_MS", "2000")) / 1000
+        cls._retry = float(os.getenv("QUOTA_LEASE_RETRY_MS", "1000")) / 1000
+
+        if not cls.is_enabled():
+            return
+
+        cls._quota_business = QuotaBusiness(database)
+        cls._collection = database[os.getenv("QUOTA_LEASE_COLLECTION", "quota_leases")]
+        cls._swept_at = 0.0
+        cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._task is None:
+            return
+
+        cls._task.cancel()
+        await asyncio.gather(cls._task, *cls._claiming.values(), return_exceptions=True)
+        cls._task = None
+
+        set_background_correlation_id()
+        for key in list(cls._leases):
+            cls._release(key)
+        if cls._pending_returns:
+            await asyncio.gather(*cls._pending_returns, return_exceptions=True)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._backend == "lease"
+
+    @classmethod
+    def invalidate(cls, use_case_id: str, provider_name: str, model_name: str) -> None:
+        cls._release((use_case_id, provider_name, model_name))
+
+    @classmethod
+    async def reserve(
+        cls, use_case_id: str, provider_name: str, model_name: str, tokens: int
+    ) -> QuotaResponse:
+        key = (use_case_id, provider_name, model_name)
+        lease = cls._leases.get(key)
+        if (
+            lease is None
+            or lease.remaining < tokens
+            or lease.expires_at <= time.monotonic()
+        ):
+            lease = await cls._claim(key, tokens)
+
+        if lease.quota is None:
+            raise NotFoundException("quotas")
+        if lease.remaining < tokens:
+            raise QuotaExceededException(balance=max(lease.remaining, 0))
+
+        lease.remaining -= tokens
+        lease.used_at = time.monotonic()
+        if lease.remaining < cls._slice_tokens * cls._refill_ratio:
+            cls._prefetch(key)
+
+        return lease.quota.model_copy(update={"balance": lease.remaining})
+
+    @classmethod
+    def settle(cls, quota: QuotaResponse, tokens: int) -> None:
+        if tokens == 0:
+            return
+
+        key = (quota.use_case.id, quota.provider.name, quota.provider.model.name)
+        lease = cls._leases.get(key)
+        if (
+            lease is not None
+            and lease.id is not None
+            and lease.quota is not None
+            and lease.quota.id == quota.id
+        ):
+            lease.remaining += tokens
+        else:
+            cls._return(quota, tokens)
+
+    @classmethod
+    def _prefetch(cls, key: QuotaKey) -> None:
+        if key not in cls._claiming:
+            cls._start_claim(key, 0)
+
+    @classmethod
+    async def _claim(cls, key: QuotaKey, tokens: int) -> Lease:
+        while True:
+            task = cls._claiming.get(key)
+            owned = task is None or task.done()
+            if owned:
+                task = cls._start_claim(key, tokens)
+
+            lease = await asyncio.shield(task)
+            if (
+                owned
+                or lease.quota is None
+                or (lease.remaining >= tokens and lease.expires_at > time.monotonic())
+                or time.monotonic() < lease.retry_at
+            ):
+                return lease
+
+    @classmethod
+    def _start_claim(cls, key: QuotaKey, tokens: int) -> asyncio.Task:
+        task = asyncio.create_task(cls._acquire(key, tokens))
+        cls._claiming[key] = task
+        task.add_done_callback(lambda _: cls._claiming.pop(key, None))
+        return task
+
+    @classmethod
+    async def _acquire(cls, key: QuotaKey, tokens: int) -> Lease:
+        lease = cls._leases.get(key)
+        if lease is not None and lease.expires_at <= time.monotonic():
+            await cls._refresh(key, lease)
+            lease = cls._leases.get(key)
+
+        if lease is not None and time.monotonic() < (
+            lease.retry_at if tokens else max(lease.retry_at, lease.refill_at)
+        ):
+            return lease
+
+        needed = max(tokens - (lease.remaining if lease is not None else 0), 0)
+        try:
+            quota, granted = await cls._quota_business.claim(
+                use_case_id=key[0],
+                provider_name=key[1],
+                model_name=key[2],
+                tokens=max(cls._slice_tokens, needed),
+                min_tokens=needed,
+            )
+        except NotFoundException:
+            quota, granted = None, 0
+
+        lease = cls._leases.get(key)
+        if lease is not None and (
+            quota is None or lease.quota is None or lease.quota.id != quota.id
+        ):
+            cls._release(key)
+            lease = None
+
+        if lease is None:
+            lease = Lease(quota=quota, remaining=0, ttl=cls._ttl)
+            cls._leases[key] = lease
+
+        if granted:
+            try:
+                await cls._store(lease, granted)
+            except Exception:
+                cls._return(quota, granted)
+                raise
+            if cls._leases.get(key) is not lease:
+                cls._return_lease(lease)
+        elif tokens:
+            lease.retry_at = time.monotonic() + cls._retry
+        else:
+            lease.refill_at = time.monotonic() + cls._retry
+        return lease
+
+    @classmethod
+    async def _store(cls, lease: Lease, granted: int) -> None:
+        started_at = time.monotonic()
+        if lease.id is not None and await cls._collection.find_one_and_update(
+            {"_id": lease.id},
+            {"$inc": {"tokens": granted}, "$set": {"expires_at": cls._expires_at()}},
+            return_document=ReturnDocument.AFTER,
+        ):
+            lease.remaining += granted
+        else:
+            lease_id = str(uuid4())
+            await cls._collection.insert_one(
+                {
+                    "_id": lease_id,
+                    "quota_id": lease.quota.id,
+                    "use_case_id": lease.quota.use_case.id,
+                    "provider_name": lease.quota.provider.name,
+                    "model_name": lease.quota.provider.model.name,
+                    "replica": cls._replica,
+                    "tokens": granted,
+                    "expires_at": cls._expires_at(),
+                    "created_at": datetime.now(timezone.utc),
+                }
+            )
+            lease.id = lease_id
+            lease.remaining = granted
+        lease.expires_at = started_at + cls._ttl
+
+    @classmethod
+    async def _refresh(cls, key: QuotaKey, lease: Lease) -> None:
+        started_at = time.monotonic()
+        if lease.id is None:
+            lease.expires_at = started_at + cls._ttl
+            return
+
+        if await cls._collection.find_one_and_update(
+            {"_id": lease.id},
+            {"$set": {"tokens": lease.remaining, "expires_at": cls._expires_at()}},
+            return_document=ReturnDocument.AFTER,
+        ):
+            lease.expires_at = max(lease.expires_at, started_at + cls._ttl)
+        elif cls._leases.get(key) is lease:
+            del cls._leases[key]
+
+    @classmethod
+    async def _run(cls) -> None:
+        set_background_correlation_id()
+        while True:
+            await asyncio.sleep(min(cls._ttl / 2, cls._idle, cls._retry))
+            now = time.monotonic()
+            refreshes = []
+            for key, lease in list(cls._leases.items()):
+                if key in cls._claiming:
+                    continue
+                if lease.expires_at <= now or now - lease.used_at >= cls._idle:
+                    cls._release(key)
+                elif lease.expires_at - now <= cls._ttl / 2:
+                    refreshes.append(cls._heartbeat(key, lease))
+
+            await asyncio.gather(*refreshes)
+            if now - cls._swept_at >= cls._ttl:
+                cls._swept_at = now
+                await cls._sweep()
+
+    @classmethod
+    async def _heartbeat(cls, key: QuotaKey, lease: Lease) -> None:
+        try:
+            await cls._refresh(key, lease)
+        except Exception as exception:
+            cls._log("failed to refresh quota lease", exception, lease_id=lease.id)
+
+    @classmethod
+    async def _sweep(cls) -> None:
+        try:
+            if not cls._indexed:
+                await cls._collection.create_index("expires_at")
+                cls._indexed = True
+            documents = await cls._collection.find(
+                {
+                    "expires_at": {
+                        "$lt": datetime.now(timezone.utc) - timedelta(seconds=cls._ttl)
+                    }
+                },
+                {"_id": 1},
+            ).to_list(length=None)
+        except Exception as exception:
+            cls._log("failed to find expired quota leases", exception)
+            return
+
+        for document in documents:
+            await cls._reclaim(document["_id"])
+
+    @classmethod
+    async def _reclaim(cls, lease_id: str, tokens: Optional[int] = None) -> None:
+        try:
+            document = await cls._collection.find_one_and_delete({"_id": lease_id})
+            if document is None:
+                return
+
+            await cls._quota_business.settle(
+                quota_id=document["quota_id"],
+                use_case_id=document["use_case_id"],
+                provider_name=document["provider_name"],
+                model_name=document["model_name"],
+                tokens=document["tokens"] if tokens is None else tokens,
+            )
+        except Exception as exception:
+            cls._log("failed to return quota lease", exception, lease_id=lease_id)
+
+    @classmethod
+    def _release(cls, key: QuotaKey) -> None:
+        lease = cls._leases.pop(key, None)
+        if lease is not None:
+            cls._return_lease(lease)
+
+    @classmethod
+    def _return_lease(cls, lease: Lease) -> None:
+        if lease.id is not None:
+            cls._track(cls._reclaim(lease.id, lease.remaining))
+        elif lease.quota is not None and lease.remaining != 0:
+            cls._return(lease.quota, lease.remaining)
+
+    @classmethod
+    def _return(cls, quota: QuotaResponse, tokens: int) -> None:
+        cls._track(cls._settle(quota, tokens))
+
+    @classmethod
+    def _track(cls, coroutine) -> None:
+        task = asyncio.create_task(coroutine)
+        cls._pending_returns.add(task)
+        task.add_done_callback(cls._pending_returns.discard)
+
+    @classmethod
+    async def _settle(cls, quota: QuotaResponse, tokens: int) -> None:
+        try:
+            await cls._quota_business.settle(
+                quota_id=quota.id,
+                use_case_id=quota.use_case.id,
+                provider_name=quota.provider.name,
+                model_name=quota.provider.model.name,
+                tokens=tokens,
+            )
+        except Exception as exception:
+            cls._log(
+                "failed to return quota lease",
+                exception,
+                quota_id=quota.id,
+                tokens=tokens,
+            )
+
+    @classmethod
+    def _expires_at(cls) -> datetime:
+        return datetime.now(timezone.utc) + timedelta(seconds=cls._ttl)
+
+    @classmethod
+    def _log(cls, message: str, exception: Exception, **kwargs) -> None:
+        LogConfig().get_logger().warning(
+            f"QUOTA LOG: {message}",
+            exception=str(exception) or type(exception).__name__,
+            **kwargs,
+        )
@@ -72,6 +72,32 @@ class MongoDBClient:
                 exception=exception, message="Failed to update single document."
             )
 
+    async def update_one(self, filter: dict, update: dict) -> None:
+        try:
+            start_time = time.time()
+
+            updated_doc = await self.collection.update_one(filter, update)
+
+            self._logger.log(
+                operation_name=inspect.currentframe().f_code.co_name,
+                start_time=start_time,
+                query=filter,
+                update=update,
+                response_update=updated_doc,
+            )
+
+        except Exception as exception:
+            self._logger.log(
+                operation_name=inspect.currentframe().f_code.co_name,
+                start_time=start_time,
+                query=filter,
+                update=update,
+                exception=exception,
+            )
+            raise InternalServerErrorException(
+                exception=exception, message="Failed to update single document."
+            )
+
     async def update_many(self, filter: dict, update: dict) -> None:
         try:
             start_time = time.time()
@@ -98,6 +124,28 @@ class MongoDBClient:
                 exception=exception, message="Failed to update multiple documents."
             )
 
+    async def bulk_write(self, operations: list) -> None:
+        try:
+            start_time = time.time()
+
+            result = await self.collection.bulk_write(operations, ordered=False)
+
+            self._logger.log(
+                operation_name=inspect.currentframe().f_code.co_name,
+                start_time=start_time,
+                response_update=result,
+            )
+
+        except Exception as exception:
+            self._logger.log(
+                operation_name=inspect.currentframe().f_code.co_name,
+                start_time=start_time,
+                exception=exception,
+            )
+            raise InternalServerErrorException(
+                exception=exception, message="Failed to write documents in bulk."
+            )
+
     async def find(self, filter: dict = {}) -> list[dict]:
         try:
             start_time = time.time()
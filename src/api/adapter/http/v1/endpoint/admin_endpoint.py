@@ -0,0 +1,157 @@
+from fastapi import APIRouter, Depends, status
+from src.api.adapter.http.v1.header.quota_header import QuotaHeader
+from src.api.adapter.http.v1.payload.response.wrapper_response import WrapperResponse
+from src.api.adapter.http.v1.payload.response.error_response import ErrorResponse
+from src.api.adapter.service.provider.http.http_client_pool import HttpClientPool
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_circuit_breaker import (
+    AzureOpenAICircuitBreaker,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_concurrency_limiter import (
+    AzureOpenAIConcurrencyLimiter,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_hedge import (
+    AzureOpenAIHedge,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_rate_limiter import (
+    AzureOpenAIRateLimiter,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_retry import (
+    AzureOpenAIRetry,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_router import (
+    AzureOpenAIRouter,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_scheduler import (
+    AzureOpenAIScheduler,
+)
+
+
+admin_router = APIRouter(prefix="/v1/admin")
+
+
+@admin_router.get(
+    "/connection-pools",
+    response_model=WrapperResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "model": ErrorResponse,
+        }
+    },
+)
+async def connection_pools(headers: QuotaHeader = Depends(QuotaHeader.validate)):
+    return WrapperResponse(data=HttpClientPool.get_stats())
+
+
+@admin_router.get(
+    "/deployments",
+    response_model=WrapperResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "model": ErrorResponse,
+        }
+    },
+)
+async def deployments(headers: QuotaHeader = Depends(QuotaHeader.validate)):
+    return WrapperResponse(data=AzureOpenAIRouter.get_stats())
+
+
+@admin_router.get(
+    "/circuit-breakers",
+    response_model=WrapperResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "model": ErrorResponse,
+        }
+    },
+)
+async def circuit_breakers(headers: QuotaHeader = Depends(QuotaHeader.validate)):
+    return WrapperResponse(data=AzureOpenAICircuitBreaker.get_stats())
+
+
+@admin_router.get(
+    "/retries",
+    response_model=WrapperResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "model": ErrorResponse,
+        }
+    },
+)
+async def retries(headers: QuotaHeader = Depends(QuotaHeader.validate)):
+    return WrapperResponse(data=[AzureOpenAIRetry.get_stats()])
+
+
+@admin_router.get(
+    "/hedges",
+    response_model=WrapperResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "model": ErrorResponse,
+        }
+    },
+)
+async def hedges(headers: QuotaHeader = Depends(QuotaHeader.validate)):
+    return WrapperResponse(data=AzureOpenAIHedge.get_stats())
+
+
+@admin_router.get(
+    "/rate-limits",
+    response_model=WrapperResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "model": ErrorResponse,
+        }
+    },
+)
+async def rate_limits(headers: QuotaHeader = Depends(QuotaHeader.validate)):
+    return WrapperResponse(data=AzureOpenAIRateLimiter.get_stats())
+
+
+@admin_router.get(
+    "/schedulers",
+    response_model=WrapperResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "model": ErrorResponse,
+        }
+    },
+)
+async def schedulers(headers: QuotaHeader = Depends(QuotaHeader.validate)):
+    return WrapperResponse(data=AzureOpenAIScheduler.get_stats())
+
+
+@admin_router.get(
+    "/concurrency-limits",
+    response_model=WrapperResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "model": ErrorResponse,
+        }
+    },
+)
+async def concurrency_limits(headers: QuotaHeader = Depends(QuotaHeader.validate)):
+    return WrapperResponse(data=AzureOpenAIConcurrencyLimiter.get_stats())
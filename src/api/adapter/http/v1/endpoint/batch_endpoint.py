@@ -25,11 +25,11 @@ batch_business = BatchBusiness()
         }
     },
 )
-def batch(
+async def batch(
     batch_request: BatchRequest,
     headers: BaseHeader = Depends(BaseHeader.validate),
 ) -> BatchRequest:
-    return batch_business.generate_batch(batch_request)
+    return await batch_business.generate_batch(batch_request)
 
 
 @batch_router.get(
@@ -44,10 +44,10 @@ def batch(
         }
     },
 )
-def get_batch(
+async def get_batch(
     batch_id: str = Path(..., alias="batchId"),
     provider_name: str = Depends(ProviderValidation.validate_provider_existence),
     model_name: str = Depends(ModelValidation.validate_model_existence),
     headers: BaseHeader = Depends(BaseHeader.validate),
 ) -> BatchRequest:
-    return batch_business.get_batch(provider_name, model_name, batch_id)
+    return await batch_business.get_batch(provider_name, model_name, batch_id)
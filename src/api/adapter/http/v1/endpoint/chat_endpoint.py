@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, status
 from fastapi.responses import StreamingResponse
 from src.api.adapter.http.v1.header.base_header import BaseHeader
 from src.api.adapter.http.v1.payload.request.chat_request import ChatRequest
+from src.api.adapter.validation.quota_validation import QuotaValidation
 from src.api.adapter.http.v1.payload.response.chat_response import ChatResponse
 from src.api.core.business.chat_business import ChatBusiness
 from src.api.adapter.http.v1.payload.response.error_response import ErrorResponse
@@ -22,11 +23,11 @@ chat_business = ChatBusiness()
         }
     },
 )
-def chat(
-    chat_request: ChatRequest = Depends(ChatRequest.validate),
+async def chat(
+    chat_request: ChatRequest = Depends(QuotaValidation.reserve_chat),
     headers: BaseHeader = Depends(BaseHeader.validate),
 ) -> ChatRequest:
-    return chat_business.generate_text(chat_request)
+    return await chat_business.generate_text(chat_request)
 
 
 @chat_router.post(
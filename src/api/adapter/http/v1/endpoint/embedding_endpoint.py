@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, status
 from src.api.adapter.http.v1.header.base_header import BaseHeader
 from src.api.adapter.http.v1.payload.request.embedding_request import EmbeddingRequest
+from src.api.adapter.validation.quota_validation import QuotaValidation
 from src.api.adapter.http.v1.payload.response.embedding_response import (
     EmbeddingResponse,
 )
@@ -23,8 +24,8 @@ embedding_business = EmbeddingBusiness()
         }
     },
 )
-def embedding(
-    embedding_request: EmbeddingRequest,
+async def embedding(
+    embedding_request: EmbeddingRequest = Depends(QuotaValidation.reserve_embedding),
     headers: BaseHeader = Depends(BaseHeader.validate),
 ) -> EmbeddingRequest:
-    return embedding_business.generate_embedding(embedding_request)
+    return await embedding_business.generate_embedding(embedding_request)
@@ -25,11 +25,11 @@ file_business = FileBusiness()
         }
     },
 )
-def create_file(
+async def create_file(
     file_request: FileRequest,
     headers: BaseHeader = Depends(BaseHeader.validate),
 ) -> FileRequest:
-    return file_business.generate_file(file_request)
+    return await file_business.generate_file(file_request)
 
 
 @file_router.get(
@@ -44,10 +44,10 @@ def create_file(
         }
     },
 )
-def get_file(
+async def get_file(
     file_id: str = Path(..., alias="fileId"),
     provider_name: str = Depends(ProviderValidation.validate_provider_existence),
     model_name: str = Depends(ModelValidation.validate_model_existence),
     headers: BaseHeader = Depends(BaseHeader.validate),
 ) -> FileRequest:
-    return file_business.get_file(provider_name, model_name, file_id)
+    return await file_business.get_file(provider_name, model_name, file_id)
@@ -22,8 +22,8 @@ chat_business = ChatBusiness()
         }
     },
 )
-def images_generations(
+async def images_generations(
     image_request: ImageRequest = Depends(ImageRequest.validate),
     headers: BaseHeader = Depends(BaseHeader.validate),
 ) -> ImageRequest:
-    return chat_business.generate_image(image_request)
+    return await chat_business.generate_image(image_request)
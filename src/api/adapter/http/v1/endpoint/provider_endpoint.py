@@ -1,13 +1,16 @@
-from fastapi import APIRouter, Depends, status
+import os
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from src.api.adapter.http.v1.header.base_header import BaseHeader
 from src.api.adapter.http.v1.payload.response.wrapper_response import WrapperResponse
-from src.api.adapter.http.v1.mapper.provider_mapper import ProviderMapper
 from src.api.adapter.http.v1.payload.response.error_response import ErrorResponse
-from src.api.adapter.cache.simple.provider_cache import ProviderCache
+from src.api.adapter.cache.simple.provider_response_cache import (
+    ProviderResponseCache,
+)
 
 
 provider_router = APIRouter(prefix="/v1")
-provider_mapper = ProviderMapper()
+cache_control = f"private, max-age={os.getenv('PROVIDERS_CACHE_MAX_AGE_SECONDS', '60')}"
 
 
 @provider_router.get(
@@ -16,13 +19,32 @@ provider_mapper = ProviderMapper()
     response_model_exclude_none=True,
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"},
         status.HTTP_400_BAD_REQUEST: {
             "description": "Bad Request",
             "model": ErrorResponse,
-        }
+        },
     },
 )
-def provider(headers: BaseHeader = Depends(BaseHeader.validate)):
-    providers = ProviderCache.get_providers()
-    providers_response = provider_mapper.to_providers(providers)
-    return WrapperResponse(data=providers_response)
+async def provider(
+    generation_type: Optional[str] = Query(None, alias="generationType"),
+    process_type: Optional[str] = Query(None, alias="processType"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    headers: BaseHeader = Depends(BaseHeader.validate),
+):
+    body, etag = ProviderResponseCache.get(
+        generation_type=generation_type, process_type=process_type
+    )
+    response_headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if if_none_match is not None and (
+        if_none_match.strip() == "*"
+        or etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    ):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=response_headers
+        )
+
+    return Response(
+        content=body, media_type="application/json", headers=response_headers
+    )
@@ -16,6 +16,8 @@ from src.api.adapter.http.v1.payload.response.quota_response import (
     QuotaResponse,
 )
 from src.api.core.business.quota_business import QuotaBusiness
+from src.api.adapter.cache.simple.quota_cache import QuotaCache
+from src.api.adapter.cache.simple.quota_lease import QuotaLease
 from fastapi import Request
 
 quota_router = APIRouter()
@@ -33,7 +35,18 @@ async def create(
     quota_request: QuotaRequest,
     headers: QuotaHeader = Depends(QuotaHeader.validate),
 ) -> QuotaResponse:
-    return await QuotaBusiness(request.app.state.db).create(quota_request)
+    quota = await QuotaBusiness(request.app.state.db).create(quota_request)
+    QuotaCache.invalidate(
+        use_case_id=quota.use_case.id,
+        provider_name=quota.provider.name,
+        model_name=quota.provider.model.name,
+    )
+    QuotaLease.invalidate(
+        use_case_id=quota.use_case.id,
+        provider_name=quota.provider.name,
+        model_name=quota.provider.model.name,
+    )
+    return quota
 
 
 @quota_router.get(
@@ -77,10 +90,21 @@ async def update(
     model_name: str = Depends(ModelValidation.validate_model_existence),
     headers: QuotaHeader = Depends(QuotaHeader.validate),
 ) -> QuotaResponse:
-    return await QuotaBusiness(request.app.state.db).update(
+    quota = await QuotaBusiness(request.app.state.db).update(
         use_case_id=use_case_id,
         provider_name=provider_name,
         model_name=model_name,
         quota_request=quota_request,
         enabled=enabled,
     )
+    QuotaCache.invalidate(
+        use_case_id=use_case_id,
+        provider_name=provider_name,
+        model_name=model_name,
+    )
+    QuotaLease.invalidate(
+        use_case_id=use_case_id,
+        provider_name=provider_name,
+        model_name=model_name,
+    )
+    return quota
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, status
 from src.api.adapter.http.v1.header.base_header import BaseHeader
 from src.api.adapter.http.v1.payload.request.similarity_request import SimilarityRequest
+from src.api.adapter.validation.quota_validation import QuotaValidation
 from src.api.adapter.http.v1.payload.response.similarity_response import (
     SimilarityResponse,
 )
@@ -23,8 +24,8 @@ similarity_business = SimilarityBusiness()
         }
     },
 )
-def generate_similarity(
-    similarity_request: SimilarityRequest,
+async def generate_similarity(
+    similarity_request: SimilarityRequest = Depends(QuotaValidation.reserve_similarity),
     headers: BaseHeader = Depends(BaseHeader.validate),
 ) -> SimilarityRequest:
-    return similarity_business.generate_similarity(similarity_request)
+    return await similarity_business.generate_similarity(similarity_request)
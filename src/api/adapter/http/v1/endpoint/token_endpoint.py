@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, status
+from src.api.adapter.http.v1.header.base_header import BaseHeader
+from src.api.adapter.http.v1.payload.request.token_request import TokenRequest
+from src.api.adapter.http.v1.payload.response.token_response import TokenResponse
+from src.api.core.business.token_business import TokenBusiness
+from src.api.adapter.http.v1.payload.response.error_response import ErrorResponse
+
+token_router = APIRouter()
+token_business = TokenBusiness()
+
+
+@token_router.post(
+    "/v1/tokens",
+    response_model=TokenResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Bad Request",
+            "model": ErrorResponse,
+        }
+    },
+)
+async def count_tokens(
+    token_request: TokenRequest,
+    headers: BaseHeader = Depends(BaseHeader.validate),
+) -> TokenResponse:
+    return await token_business.count_tokens(token_request)
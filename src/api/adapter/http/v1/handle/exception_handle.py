@@ -18,6 +18,9 @@ from src.api.core.exception.rate_limit_exeception import (
     RateLimitException,
 )
 from src.api.core.exception.not_found_exception import NotFoundException
+from src.api.core.exception.service_unavailable_exception import (
+    ServiceUnavailableException,
+)
 from src.api.core.exception.unauthorized_exception import UnauthorizedException
 
 
@@ -141,3 +144,29 @@ async def unauthorized_exception(request: Request, exception: UnauthorizedExcept
             exclude_none=True,
         ),
     )
+
+
+async def service_unavailable_exception(
+    request: Request, exception: ServiceUnavailableException
+):
+    ErrorLog.handler(request, exception.message)
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers=(
+            {"Retry-After": str(exception.retry_after)}
+            if exception.retry_after
+            else None
+        ),
+        content=jsonable_encoder(
+            ErrorResponse(
+                errorDetails=[
+                    ErrorDetails(
+                        statusCode="ERROR_503",
+                        message="Service temporarily unavailable, please retry later",
+                    )
+                ]
+            ),
+            exclude_none=True,
+        ),
+    )
@@ -7,10 +7,12 @@ from src.api.adapter.http.v1.endpoint.chat_endpoint import chat_router
 from src.api.adapter.http.v1.endpoint.embedding_endpoint import embedding_router
 from src.api.adapter.http.v1.endpoint.file_endpoint import file_router
 from src.api.adapter.http.v1.endpoint.similarity_endpoint import similarity_router
+from src.api.adapter.http.v1.endpoint.token_endpoint import token_router
 from src.api.adapter.http.v1.endpoint.image_endpoint import image_router
 from src.api.adapter.http.v1.endpoint.provider_endpoint import provider_router
 from src.api.adapter.http.v1.endpoint.quota_endpoint import quota_router
 from src.api.adapter.http.v1.endpoint.swagger_endpoint import swagger_router
+from src.api.adapter.http.v1.endpoint.admin_endpoint import admin_router
 
 
 def router():
@@ -51,6 +53,12 @@ def router():
         tags=["similarity"],
     )
 
+    api_router.include_router(
+        token_router,
+        prefix=path,
+        tags=["tokens"],
+    )
+
     api_router.include_router(
         image_router,
         prefix=path,
@@ -69,6 +77,12 @@ def router():
         tags=["quotas"],
     )
 
+    api_router.include_router(
+        admin_router,
+        prefix=path,
+        tags=["admin"],
+    )
+
     api_router.include_router(
         swagger_router,
         prefix=path,
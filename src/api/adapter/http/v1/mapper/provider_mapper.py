@@ -3,13 +3,18 @@ from typing import List, Optional
 from src.api.adapter.http.v1.payload.response.provider_response import (
     ProviderResponse,
     Model,
+    Fallback,
     Pixel,
     Price,
     Token,
     CategoryResponse,
 )
 
-from src.api.domain.provider import Provider as ProviderDomain, Category
+from src.api.domain.provider import (
+    Provider as ProviderDomain,
+    Category,
+    Fallback as FallbackDomain,
+)
 
 
 class ProviderMapper:
@@ -17,11 +22,13 @@ class ProviderMapper:
     def to_providers(self, providers: List[ProviderDomain]) -> List[ProviderResponse]:
         return [
             ProviderResponse(
+                id=provider.id,
                 name=provider.name,
                 label=provider.label,
                 description=provider.description,
                 models=[
                     Model(
+                        id=model.id,
                         name=model.name,
                         label=model.label,
                         description=model.description,
@@ -32,6 +39,7 @@ class ProviderMapper:
                         enabled=model.enabled,
                         category=self.get_category(model.category),
                         process_type=model.process_type,
+                        fallback=self.get_fallback(model.fallback),
                     )
                     for model in provider.models
                 ],
@@ -44,6 +52,11 @@ class ProviderMapper:
             generation_type=category.generation_type, modal_type=category.modal_type
         )
 
+    def get_fallback(self, fallback: Optional[FallbackDomain]) -> Optional[Fallback]:
+        if fallback:
+            return Fallback(models=fallback.models, max_wait_ms=fallback.max_wait_ms)
+        return None
+
     def get_token(self, token: Optional[Token]) -> Optional[Token]:
         if token:
             return Token(
@@ -67,6 +80,7 @@ class ProviderMapper:
         if prices:
             return [
                 Price(
+                    id=price.id,
                     token=self.get_token(price.token),
                     pixel=self.get_pixel(price.pixel),
                     unit_of_measure=(
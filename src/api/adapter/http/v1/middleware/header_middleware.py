@@ -1,4 +1,5 @@
 import contextvars
+import uuid
 from fastapi import FastAPI
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
@@ -8,6 +9,9 @@ from src.api.core.exception.internal_server_error_exception import (
 )
 
 correlation_id_var = contextvars.ContextVar("correlation_id", default=None)
+cache_control_var = contextvars.ContextVar("cache_control", default=None)
+client_id_var = contextvars.ContextVar("client_id", default=None)
+priority_var = contextvars.ContextVar("priority", default=None)
 
 
 class HeaderMiddleware(BaseHTTPMiddleware):
@@ -18,6 +22,9 @@ class HeaderMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: Callable):
         correlation_id = request.headers.get("X-Correlation-ID")
         correlation_id_var.set(correlation_id)
+        cache_control_var.set(request.headers.get("Cache-Control"))
+        client_id_var.set(request.headers.get("client_id"))
+        priority_var.set(request.headers.get("X-Priority"))
         return await call_next(request)
 
 
@@ -29,3 +36,26 @@ def get_correlation_id():
         raise InternalServerErrorException(
             exception=error, message="Unable to get the correlation id"
         )
+
+
+def set_background_correlation_id():
+    if correlation_id_var.get() is None:
+        correlation_id_var.set(str(uuid.uuid4()))
+
+
+def set_background_client(client_id: str, priority: str):
+    set_background_correlation_id()
+    client_id_var.set(client_id)
+    priority_var.set(priority)
+
+
+def get_cache_control():
+    return cache_control_var.get()
+
+
+def get_client_id():
+    return client_id_var.get()
+
+
+def get_priority():
+    return priority_var.get()
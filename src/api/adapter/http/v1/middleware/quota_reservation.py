@@ -0,0 +1,137 @@
+import asyncio
+from typing import Optional, Set
+
+from src.api.adapter.cache.simple.quota_cache import QuotaCache
+from src.api.adapter.cache.simple.quota_lease import QuotaLease
+from src.api.adapter.http.v1.payload.response.quota_response import QuotaResponse
+from src.api.core.business.quota_business import QuotaBusiness
+from src.api.core.exception.not_found_exception import NotFoundException
+from src.api.core.exception.quota_exceeded_exception import QuotaExceededException
+from src.api.core.exception.quota_not_found_exception import (
+    QuotaNotFoundException,
+)
+from src.api.core.log.config.log_config import LogConfig
+
+
+class QuotaReservation:
+    _pending_settlements: Set[asyncio.Task] = set()
+
+    def __init__(self, quota_business: QuotaBusiness, client_id: str) -> None:
+        self.quota_business = quota_business
+        self.client_id = client_id
+        self.quota: Optional[QuotaResponse] = None
+        self.tokens = 0
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._pending_settlements:
+            await asyncio.gather(*cls._pending_settlements, return_exceptions=True)
+
+    async def reserve(self, provider_name: str, model_name: str, tokens: int) -> None:
+        try:
+            self.quota = await self.__reserve(
+                provider_name=provider_name, model_name=model_name, tokens=tokens
+            )
+        except NotFoundException as exception:
+            raise QuotaNotFoundException(exception.get_entity())
+        self.tokens = tokens
+
+    def settle(self, tokens: int) -> None:
+        if self.quota is not None:
+            self.__settle(quota=self.quota, tokens=tokens)
+
+    def settle_usage(self, model_name: Optional[str], tokens: int) -> None:
+        if self.quota is None:
+            return
+
+        if model_name is None or model_name == self.quota.provider.model.name:
+            self.settle(tokens=self.tokens - tokens)
+            return
+
+        self.__track(self.__settle_fallback(model_name=model_name, tokens=tokens))
+
+    async def __settle_fallback(self, model_name: str, tokens: int) -> None:
+        try:
+            quotas = await self.quota_business.retrieve(
+                use_case_id=self.client_id,
+                provider_name=self.quota.provider.name,
+                model_name=model_name,
+                enabled=True,
+            )
+        except NotFoundException:
+            self.settle(tokens=self.tokens - tokens)
+            return
+        except Exception as exception:
+            LogConfig().get_logger().warning(
+                "QUOTA LOG: failed to load fallback model quota",
+                exception=str(exception) or type(exception).__name__,
+                model_name=model_name,
+            )
+            self.settle(tokens=self.tokens - tokens)
+            return
+
+        self.settle(tokens=self.tokens)
+        self.__settle(quota=quotas[0], tokens=-tokens)
+
+    def __settle(self, quota: QuotaResponse, tokens: int) -> None:
+        if tokens == 0:
+            return
+
+        if QuotaLease.is_enabled():
+            QuotaLease.settle(quota=quota, tokens=tokens)
+            return
+
+        if QuotaCache.is_enabled():
+            QuotaCache.settle(quota=quota, tokens=tokens)
+            return
+
+        self.__track(
+            self.quota_business.settle(
+                quota_id=quota.id,
+                use_case_id=quota.use_case.id,
+                provider_name=quota.provider.name,
+                model_name=quota.provider.model.name,
+                tokens=tokens,
+            )
+        )
+
+    def __track(self, coroutine) -> None:
+        task = asyncio.create_task(coroutine)
+        self._pending_settlements.add(task)
+        task.add_done_callback(self._pending_settlements.discard)
+
+    async def __reserve(
+        self, provider_name: str, model_name: str, tokens: int
+    ) -> QuotaResponse:
+        if QuotaLease.is_enabled():
+            return await QuotaLease.reserve(
+                use_case_id=self.client_id,
+                provider_name=provider_name,
+                model_name=model_name,
+                tokens=tokens,
+            )
+
+        if QuotaCache.is_enabled():
+            return await QuotaCache.reserve(
+                use_case_id=self.client_id,
+                provider_name=provider_name,
+                model_name=model_name,
+                tokens=tokens,
+            )
+
+        quota = await self.quota_business.reserve(
+            use_case_id=self.client_id,
+            provider_name=provider_name,
+            model_name=model_name,
+            tokens=tokens,
+        )
+        if quota is not None:
+            return quota
+
+        quotas = await self.quota_business.retrieve(
+            use_case_id=self.client_id,
+            provider_name=provider_name,
+            model_name=model_name,
+            enabled=True,
+        )
+        raise QuotaExceededException(balance=quotas[0].balance)
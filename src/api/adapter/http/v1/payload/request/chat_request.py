@@ -1,6 +1,7 @@
 import base64
 from urllib.parse import urlparse
-from pydantic import BaseModel, field_validator
+from fastapi import Body
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Dict, Optional, Union
 from src.api.core.exception.bad_request_exception import (
     BadRequestException,
@@ -14,6 +15,8 @@ from .common_request import Provider
 from src.api.adapter.constant.base64_constant import Extension
 from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
 from src.api.adapter.validation.model_validation import ModelValidation
+from src.api.adapter.service.tokenizer.chat_token_counter import ChatTokenCounter
+from src.api.adapter.service.tokenizer.prompt_truncation import PromptTruncation
 
 
 class PromptParameter(BasePayload):
@@ -93,9 +96,24 @@ class Message(BasePayload):
     tool: Optional[ToolMessage] = None
 
 
+class Truncation(BasePayload):
+    enabled: bool = True
+    max_prompt_tokens: Optional[int] = None
+    max_tool_output_tokens: Optional[int] = None
+
+    @field_validator("max_prompt_tokens", "max_tool_output_tokens")
+    def validate_tokens(cls, value, context):
+        if value is not None and value <= 0:
+            raise BadRequestException(
+                params=[f"The {context.field_name} field must be greater than 0"]
+            )
+        return value
+
+
 class Prompt(BasePayload):
     parameter: Optional[PromptParameter] = None
     messages: List[Message]
+    truncation: Optional[Truncation] = None
 
 
 class Properties(BasePayload):
@@ -125,11 +143,28 @@ class ToolChoice(BasePayload):
     function: Optional[FunctionSpecification] = None
 
 
+class Fallback(BasePayload):
+    enabled: bool = True
+    max_wait_ms: Optional[int] = None
+
+    @field_validator("max_wait_ms")
+    def validate_max_wait_ms(cls, value, context):
+        if value is not None and value <= 0:
+            raise BadRequestException(
+                params=[f"The {context.field_name} field must be greater than 0"]
+            )
+        return value
+
+
 class ChatRequest(BasePayload):
     provider: Provider
     prompt: Prompt
     tools: Optional[List[Tool]] = None
     tool_choice: Optional[Union[str, ToolChoice]] = None
+    hedge: Optional[bool] = None
+    fallback: Optional[Fallback] = None
+    prompt_tokens: Optional[int] = Field(None, exclude=True)
+    dropped_messages: Optional[List[int]] = Field(None, exclude=True)
 
     @classmethod
     def validate(
@@ -138,6 +173,8 @@ class ChatRequest(BasePayload):
         prompt: Prompt,
         tools: Optional[List[Tool]] = None,
         toolChoice: Optional[Union[str, ToolChoice]] = None,
+        hedge: Optional[bool] = Body(None),
+        fallback: Optional[Fallback] = None,
     ) -> "ChatRequest":
         try:
             model_name = provider.model.name
@@ -158,12 +195,44 @@ class ChatRequest(BasePayload):
                 model_name=model_name,
             )
 
+            dropped_messages = None
+            if prompt.truncation is not None and prompt.truncation.enabled:
+                prompt.messages, dropped_messages, prompt_tokens = (
+                    PromptTruncation.truncate(
+                        model_name=model_name,
+                        messages=prompt.messages,
+                        tools=tools,
+                        max_prompt_tokens=min(
+                            prompt.truncation.max_prompt_tokens or context_window,
+                            context_window - (max_tokens or 0),
+                        ),
+                        max_tool_output_tokens=prompt.truncation.max_tool_output_tokens,
+                    )
+                )
+            else:
+                prompt_tokens = ChatTokenCounter.count(
+                    model_name=model_name, messages=prompt.messages, tools=tools
+                )
+
+            ModelValidation.validate_prompt_tokens(
+                prompt_tokens=prompt_tokens,
+                max_tokens=max_tokens,
+                context_window=context_window,
+                model_name=model_name,
+            )
+
             return cls(
                 provider=provider,
                 prompt=prompt,
                 tools=tools,
                 toolChoice=toolChoice,
+                hedge=hedge,
+                fallback=fallback,
+                promptTokens=prompt_tokens,
+                droppedMessages=dropped_messages,
             )
+        except BadRequestException:
+            raise
         except Exception as exception:
             raise InternalServerErrorException(
                 exception=exception, message="Error on the chat request validation!"
@@ -22,7 +22,7 @@ class Provider(BaseModel):
         if value not in valid_names:
             raise BadRequestException(
                 params=[
-                    f"Provider name '{value}' is not valid. Valid names are {valid_names}"
+                    f"Provider name '{value}' is not valid. Valid names are {list(valid_names)}"
                 ]
             )
         return value
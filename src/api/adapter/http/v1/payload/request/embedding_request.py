@@ -1,7 +1,10 @@
-from typing import List
-from pydantic import field_validator
+import asyncio
+from typing import List, Optional
+from pydantic import Field, field_validator
+from src.api.adapter.cache.simple.provider_cache import ProviderCache
 from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
 from src.api.adapter.http.v1.payload.request.common_request import Provider
+from src.api.adapter.service.tokenizer.tokenizer_service import TokenizerService
 from src.api.adapter.validation.model_validation import ModelValidation
 from src.api.domain.provider import GenerationType
 
@@ -13,6 +16,7 @@ class Content(BasePayload):
 class EmbeddingRequest(BasePayload):
     content: Content
     provider: Provider
+    token_counts: Optional[List[int]] = Field(None, exclude=True)
 
     @field_validator("provider", mode="after")
     def is_valid_embedding_model(cls, value):
@@ -20,3 +24,23 @@ class EmbeddingRequest(BasePayload):
             model_name=value.model.name, generation_type=GenerationType.embedding
         )
         return value
+
+    @classmethod
+    async def validate(cls, content: Content, provider: Provider) -> "EmbeddingRequest":
+        embedding_request = cls(content=content, provider=provider)
+        embedding_request.token_counts = await cls.count_tokens(
+            provider=provider, texts=content.texts
+        )
+        return embedding_request
+
+    @staticmethod
+    async def count_tokens(provider: Provider, texts: List[str]) -> List[int]:
+        model_name = provider.model.name
+        token_counts = await asyncio.to_thread(
+            TokenizerService.count_many, model_name, texts
+        )
+        ModelValidation.validate_input_tokens(
+            token_counts=token_counts,
+            max_input=ProviderCache.get_provider_model(model_name).max_input,
+        )
+        return token_counts
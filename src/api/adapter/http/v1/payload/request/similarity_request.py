@@ -1,9 +1,10 @@
 from enum import Enum
-from pydantic import field_validator
+from pydantic import Field, field_validator
 from typing import List, Optional
 from src.api.core.exception.bad_request_exception import BadRequestException
 from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
 from src.api.adapter.http.v1.payload.request.common_request import Provider
+from src.api.adapter.http.v1.payload.request.embedding_request import EmbeddingRequest
 from src.api.adapter.validation.model_validation import ModelValidation
 from src.api.domain.provider import GenerationType
 
@@ -32,6 +33,7 @@ class EvaluationRequest(BasePayload):
 class SimilarityRequest(BasePayload):
     provider: Provider
     evaluation: EvaluationRequest
+    token_counts: Optional[List[int]] = Field(None, exclude=True)
 
     @field_validator("provider", mode="after")
     def is_valid_embedding_model(cls, value):
@@ -39,3 +41,13 @@ class SimilarityRequest(BasePayload):
             model_name=value.model.name, generation_type=GenerationType.embedding
         )
         return value
+
+    @classmethod
+    async def validate(
+        cls, provider: Provider, evaluation: EvaluationRequest
+    ) -> "SimilarityRequest":
+        similarity_request = cls(provider=provider, evaluation=evaluation)
+        similarity_request.token_counts = await EmbeddingRequest.count_tokens(
+            provider=provider, texts=evaluation.texts
+        )
+        return similarity_request
@@ -0,0 +1,37 @@
+from pydantic import field_validator, model_validator
+from typing import List, Optional
+from src.api.core.exception.bad_request_exception import BadRequestException
+from src.api.adapter.cache.simple.provider_cache import ProviderCache
+from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
+from src.api.adapter.http.v1.payload.request.common_request import Provider
+from src.api.adapter.http.v1.payload.request.chat_request import Prompt
+from src.api.domain.provider import GenerationType
+
+
+class TokenRequest(BasePayload):
+    provider: Provider
+    texts: Optional[List[str]] = None
+    prompts: Optional[List[Prompt]] = None
+    jsonl: Optional[str] = None
+
+    @field_validator("provider", mode="after")
+    def is_valid_token_model(cls, value):
+        generation_types = [GenerationType.text, GenerationType.embedding]
+        if not any(
+            value.model.name in ProviderCache.get_model_by_type(generation_type)
+            for generation_type in generation_types
+        ):
+            raise BadRequestException(
+                params=[
+                    f"Model name '{value.model.name}' is not a valid text or embedding generation model type"
+                ]
+            )
+        return value
+
+    @model_validator(mode="after")
+    def validate_content(self):
+        if not self.texts and not self.prompts and not self.jsonl:
+            raise BadRequestException(
+                params=["Ensure that you provided texts, prompts or jsonl to count!"]
+            )
+        return self
@@ -18,11 +18,18 @@ class Message(BasePayload):
     tool: Optional[Tool] = None
 
 
+class Truncation(BasePayload):
+    dropped_messages: List[int]
+    prompt_tokens: int
+
+
 class ChatResponse(BasePayload):
+    model: Optional[str] = None
     usage: Optional[Usage] = None
     cost: Optional[Cost] = None
     messages: List[Message]
     guardrail: Optional[GuardrailResponse] = None
+    truncation: Optional[Truncation] = None
 
 
 class MessageStreamResponse(BasePayload):
@@ -31,7 +38,9 @@ class MessageStreamResponse(BasePayload):
 
 
 class ChatStreamResponse(BasePayload):
+    model: Optional[str] = None
     usage: Optional[Usage] = None
     cost: Optional[Cost] = None
     message: Optional[MessageStreamResponse] = None
     guardrail: Optional[GuardrailResponse] = None
+    truncation: Optional[Truncation] = None
@@ -0,0 +1,12 @@
+from typing import Optional
+from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
+
+
+class CircuitBreakerResponse(BasePayload):
+    provider: str
+    deployment: str
+    state: str
+    calls: int
+    failures: int
+    failure_rate: float
+    retry_after_seconds: Optional[int] = None
@@ -0,0 +1,12 @@
+from typing import Optional
+from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
+
+
+class ConcurrencyLimitResponse(BasePayload):
+    deployment: str
+    limit: int
+    max_limit: int
+    latency_ms: Optional[float] = None
+    latency_ratio: Optional[float] = None
+    increases: int
+    decreases: int
@@ -0,0 +1,12 @@
+from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
+
+
+class ConnectionPoolResponse(BasePayload):
+    endpoint: str
+    http2: bool
+    max_connections: int
+    max_keepalive_connections: int
+    connections: int
+    active_connections: int
+    idle_connections: int
+    queued_requests: int
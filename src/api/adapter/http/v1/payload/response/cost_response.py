@@ -36,12 +36,21 @@ class Token(BasePayload):
         return round(value, 6)
 
 
+class Hedge(BasePayload):
+    requests: int
+    winner: str
+    estimated_extra_total: Optional[float] = None
+
+
 class Cost(BasePayload):
     pixel: Optional[Pixel] = None
     token: Optional[Token] = None
+    hedge: Optional[Hedge] = None
+    cached: Optional[bool] = None
 
 
 class Usage(BasePayload):
     completion_tokens: Optional[int] = None
     prompt_tokens: int
     total_tokens: int
+    cached: Optional[bool] = None
@@ -0,0 +1,13 @@
+from typing import Optional
+from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
+
+
+class DeploymentRouteResponse(BasePayload):
+    name: str
+    model: str
+    region: str
+    latency_ms: Optional[float] = None
+    error_rate: float
+    in_flight: int
+    requests: int
+    errors: int
@@ -0,0 +1,12 @@
+from typing import Optional
+from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
+
+
+class HedgeStatsResponse(BasePayload):
+    model: str
+    threshold_ms: Optional[float] = None
+    samples: int
+    requests: int
+    hedges: int
+    hedge_wins: int
+    hedge_rate: float
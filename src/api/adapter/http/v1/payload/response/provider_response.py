@@ -78,6 +78,11 @@ class CategoryResponse(BasePayload):
         return serialize_enum(value.value)
 
 
+class Fallback(BasePayload):
+    models: List[str]
+    max_wait_ms: Optional[int] = None
+
+
 class Model(BasePayload):
     id: UUID = Field(default_factory=uuid4)
     name: str
@@ -90,6 +95,7 @@ class Model(BasePayload):
     enabled: bool
     category: CategoryResponse
     process_type: Optional[List[ProcessType]] = None
+    fallback: Optional[Fallback] = None
 
 
 class ProviderResponse(BasePayload):
@@ -0,0 +1,13 @@
+from typing import Optional
+from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
+
+
+class RateLimitResponse(BasePayload):
+    deployment: str
+    tokens_per_minute: Optional[int] = None
+    requests_per_minute: Optional[int] = None
+    tokens_available: Optional[float] = None
+    requests_available: Optional[float] = None
+    admitted: int
+    queued: int
+    rejected: int
@@ -0,0 +1,11 @@
+from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
+
+
+class RetryStatsResponse(BasePayload):
+    requests: int
+    retries: int
+    retry_ratio: float
+    budget_tokens: float
+    budget_exhausted: int
+    deadline_exceeded: int
+    attempts_exhausted: int
@@ -0,0 +1,13 @@
+from typing import Optional
+from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
+
+
+class SchedulerResponse(BasePayload):
+    deployment: str
+    client_id: str
+    max_concurrency: Optional[int] = None
+    in_flight: int
+    queued: int
+    served: int
+    avg_wait_ms: float
+    max_wait_ms: float
@@ -0,0 +1,19 @@
+from typing import List, Optional
+from src.api.adapter.http.v1.payload.common.base_payload import BasePayload
+from src.api.adapter.http.v1.payload.response.cost_response import Cost, Usage
+
+
+class TokenItem(BasePayload):
+    index: int
+    type: str
+    custom_id: Optional[str] = None
+    prompt_tokens: int
+    completion_tokens: Optional[int] = None
+    error: Optional[str] = None
+
+
+class TokenResponse(BasePayload):
+    model: str
+    items: List[TokenItem]
+    usage: Usage
+    cost: Optional[Cost] = None
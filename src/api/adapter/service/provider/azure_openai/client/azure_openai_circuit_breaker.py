@@ -0,0 +1,151 @@
+import math
+import os
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, List, Optional
+
+from src.api.adapter.service.provider.azure_openai.domain.azure_openai import (
+    AzureOpenAIDeployment,
+)
+from src.api.adapter.http.v1.payload.response.circuit_breaker_response import (
+    CircuitBreakerResponse,
+)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class Circuit:
+    def __init__(self, window_size: int) -> None:
+        self.state = CircuitState.CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window_size)
+        self.opened_at: Optional[float] = None
+        self.probes = 0
+        self.probe_successes = 0
+
+
+class AzureOpenAICircuitBreaker:
+    _PROVIDER = "azure_openai"
+
+    _circuits: Dict[str, Circuit] = {}
+    _window_size: int = int(os.getenv("CIRCUIT_BREAKER_WINDOW_SIZE", "20"))
+    _min_calls: int = int(os.getenv("CIRCUIT_BREAKER_MIN_CALLS", "5"))
+    _failure_rate: float = float(os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", "0.5"))
+    _slow_call_ms: float = float(os.getenv("CIRCUIT_BREAKER_SLOW_CALL_MS", "30000"))
+    _open_seconds: float = float(os.getenv("CIRCUIT_BREAKER_OPEN_SECONDS", "30"))
+    _half_open_max_calls: int = int(
+        os.getenv("CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS", "1")
+    )
+
+    @classmethod
+    def allow(cls, deployment: AzureOpenAIDeployment) -> bool:
+        circuit = cls._get_circuit(deployment)
+
+        if circuit.state == CircuitState.OPEN:
+            if time.monotonic() - circuit.opened_at < cls._open_seconds:
+                return False
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probes = 0
+            circuit.probe_successes = 0
+
+        if circuit.state == CircuitState.HALF_OPEN:
+            if circuit.probes >= cls._half_open_max_calls:
+                return False
+            circuit.probes += 1
+
+        return True
+
+    @classmethod
+    def record(
+        cls, deployment: AzureOpenAIDeployment, latency_ms: float, failed: bool
+    ) -> None:
+        circuit = cls._get_circuit(deployment)
+        failed = failed or latency_ms > cls._slow_call_ms
+
+        if circuit.state == CircuitState.HALF_OPEN:
+            if failed:
+                cls._open(circuit)
+                return
+            circuit.probe_successes += 1
+            if circuit.probe_successes >= cls._half_open_max_calls:
+                cls._close(circuit)
+            return
+
+        if circuit.state == CircuitState.OPEN:
+            return
+
+        circuit.outcomes.append(failed)
+        if (
+            len(circuit.outcomes) >= cls._min_calls
+            and cls._get_failure_rate(circuit) >= cls._failure_rate
+        ):
+            cls._open(circuit)
+
+    @classmethod
+    def release(cls, deployment: AzureOpenAIDeployment) -> None:
+        circuit = cls._get_circuit(deployment)
+        if circuit.state == CircuitState.HALF_OPEN and circuit.probes > 0:
+            circuit.probes -= 1
+
+    @classmethod
+    def get_retry_after(cls, deployments: List[AzureOpenAIDeployment]) -> int:
+        now = time.monotonic()
+        remaining = [
+            circuit.opened_at + cls._open_seconds - now
+            for circuit in (cls._get_circuit(deployment) for deployment in deployments)
+            if circuit.state == CircuitState.OPEN
+        ]
+        return max(math.ceil(min(remaining)), 1) if remaining else 1
+
+    @classmethod
+    def get_stats(cls) -> List[CircuitBreakerResponse]:
+        now = time.monotonic()
+        return [
+            CircuitBreakerResponse(
+                provider=cls._PROVIDER,
+                deployment=name,
+                state=circuit.state.value,
+                calls=len(circuit.outcomes),
+                failures=sum(circuit.outcomes),
+                failure_rate=round(cls._get_failure_rate(circuit), 4),
+                retry_after_seconds=(
+                    max(math.ceil(circuit.opened_at + cls._open_seconds - now), 0)
+                    if circuit.state == CircuitState.OPEN
+                    else None
+                ),
+            )
+            for name, circuit in cls._circuits.items()
+        ]
+
+    @classmethod
+    def _get_circuit(cls, deployment: AzureOpenAIDeployment) -> Circuit:
+        circuit = cls._circuits.get(deployment.name)
+        if circuit is None:
+            circuit = Circuit(cls._window_size)
+            cls._circuits[deployment.name] = circuit
+        return circuit
+
+    @classmethod
+    def _get_failure_rate(cls, circuit: Circuit) -> float:
+        if not circuit.outcomes:
+            return 0.0
+        return sum(circuit.outcomes) / len(circuit.outcomes)
+
+    @classmethod
+    def _open(cls, circuit: Circuit) -> None:
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.probes = 0
+        circuit.probe_successes = 0
+
+    @classmethod
+    def _close(cls, circuit: Circuit) -> None:
+        circuit.state = CircuitState.CLOSED
+        circuit.opened_at = None
+        circuit.outcomes.clear()
+        circuit.probes = 0
+        circuit.probe_successes = 0
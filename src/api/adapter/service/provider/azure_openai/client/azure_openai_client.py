@@ -1,11 +1,16 @@
+import asyncio
 import time
 import openai
+from typing import Any, Awaitable, Callable, Optional
 from fastapi import status
-from openai import AzureOpenAI, OpenAI
+from openai import AsyncAzureOpenAI
 from dotenv import load_dotenv
 from src.api.adapter.service.provider.azure_openai.domain.chat_completion import (
     ChatCompletion,
 )
+from src.api.adapter.service.provider.azure_openai.domain.azure_openai import (
+    AzureOpenAIDeployment,
+)
 from src.api.adapter.service.provider.azure_openai.domain.batch import Batch
 from src.api.adapter.service.provider.azure_openai.domain.embedding import Embedding
 from src.api.adapter.service.provider.azure_openai.domain.file import File
@@ -16,6 +21,31 @@ from src.api.adapter.service.provider.azure_openai.domain.image_generate import
 from src.api.adapter.service.provider.azure_openai.client.azure_openai_factory_client import (
     AzureOpenAIFactoryClient,
 )
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_circuit_breaker import (
+    AzureOpenAICircuitBreaker,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_concurrency_limiter import (
+    AzureOpenAIConcurrencyLimiter,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_rate_limiter import (
+    AzureOpenAIRateLimiter,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_retry import (
+    AzureOpenAIRetry,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_router import (
+    AzureOpenAIRouter,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_scheduler import (
+    AzureOpenAIScheduler,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_stream import (
+    AzureOpenAIStream,
+)
+from src.api.adapter.http.v1.middleware.header_middleware import (
+    get_client_id,
+    get_priority,
+)
 from src.api.adapter.service.provider.azure_openai.log.azure_openai_logger import (
     AzureOpenAILogger,
 )
@@ -23,6 +53,10 @@ from src.api.core.log.config.log_config import LogConfig
 from src.api.core.exception.internal_server_error_exception import (
     InternalServerErrorException,
 )
+from src.api.core.exception.rate_limit_exeception import RateLimitException
+from src.api.core.exception.service_unavailable_exception import (
+    ServiceUnavailableException,
+)
 from src.api.adapter.service.provider.azure_openai.exception.azure_openai_exception_handler import (
     AzureOpenAIExceptionHandler,
 )
@@ -30,11 +64,16 @@ from src.api.adapter.service.provider.azure_openai.exception.azure_openai_except
 
 class AzureOpenAIClient:
 
+    _FAILOVER_EXCEPTIONS = (
+        openai.RateLimitError,
+        openai.InternalServerError,
+        openai.APIConnectionError,
+    )
+
     def __init__(self):
         load_dotenv()
 
-        self.client = OpenAI()
-        # self.client = AzureOpenAIFactoryClient()
+        self.client = AzureOpenAIFactoryClient()
         self._logger = AzureOpenAILogger()
         self._exception_handler = AzureOpenAIExceptionHandler(self._logger)
         self._logconfig = LogConfig()
@@ -47,13 +86,174 @@ class AzureOpenAIClient:
             f"AzureOpenAIAdapter.{operation_desc}",
         )
 
-    def image_generate(self, image_generate: ImageGenerate):
-        try:
+    async def _route(
+        self,
+        model_name: str,
+        operation: Callable[[AsyncAzureOpenAI], Awaitable[Any]],
+        estimate_tokens: Callable[[], int] = None,
+    ):
+        tokens = (
+            await asyncio.to_thread(estimate_tokens)
+            if estimate_tokens
+            and AzureOpenAIRateLimiter.is_token_limited(
+                self.client.get_deployments(model_name)
+            )
+            else 0
+        )
+
+        return await AzureOpenAIRetry.execute(
+            lambda deadline: self._failover(model_name, operation, deadline, tokens)
+        )
+
+    async def _failover(
+        self,
+        model_name: str,
+        operation: Callable[[AsyncAzureOpenAI], Awaitable[Any]],
+        deadline: float,
+        tokens: int,
+    ):
+        deployments = AzureOpenAIRouter.rank(self.client.get_deployments(model_name))
+        failover_exception = None
+        rate_limited = False
+
+        for deployment in deployments:
+            if failover_exception and time.monotonic() >= deadline:
+                break
+
+            if not AzureOpenAICircuitBreaker.allow(deployment):
+                continue
+
+            wait = AzureOpenAIRateLimiter.reserve(deployment, tokens)
+            if wait is None:
+                AzureOpenAICircuitBreaker.release(deployment)
+                rate_limited = True
+                continue
+
+            try:
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                AzureOpenAIConcurrencyLimiter.attach(deployment)
+                scheduled = await AzureOpenAIScheduler.acquire(
+                    deployment,
+                    client_id=get_client_id(),
+                    priority=get_priority(),
+                    timeout=max(deadline - time.monotonic(), 0),
+                )
+            except BaseException:
+                AzureOpenAIRateLimiter.refund(deployment, tokens)
+                AzureOpenAICircuitBreaker.release(deployment)
+                raise
+
+            if not scheduled:
+                AzureOpenAIRateLimiter.refund(deployment, tokens)
+                AzureOpenAICircuitBreaker.release(deployment)
+                rate_limited = True
+                continue
+
             start_time = time.time()
-            # azure_openai: AzureOpenAI = self.client.get_client(image_generate.model)
+            AzureOpenAIRouter.start(deployment)
+
+            try:
+                result = await operation(
+                    deployment.client.with_options(
+                        timeout=AzureOpenAIRetry.get_timeout(
+                            deployment.client.timeout, deadline
+                        )
+                    )
+                )
+            except self._FAILOVER_EXCEPTIONS as exception:
+                latency_ms = (time.time() - start_time) * 1000
+                AzureOpenAIConcurrencyLimiter.record(deployment, latency_ms, exception)
+                AzureOpenAIScheduler.release(deployment)
+                AzureOpenAIRouter.finish(deployment, latency_ms, failed=True)
+                AzureOpenAICircuitBreaker.record(deployment, latency_ms, failed=True)
+                failover_exception = exception
+                continue
+            except BaseException:
+                AzureOpenAIRateLimiter.refund(deployment, tokens)
+                AzureOpenAIScheduler.release(deployment)
+                AzureOpenAIRouter.finish(deployment, None)
+                AzureOpenAICircuitBreaker.release(deployment)
+                raise
+
+            latency_ms = (time.time() - start_time) * 1000
+            AzureOpenAICircuitBreaker.record(deployment, latency_ms, failed=False)
+
+            if isinstance(result, openai.AsyncStream):
+                return AzureOpenAIStream(
+                    result,
+                    on_close=lambda completed, exception, usage: self._close_stream(
+                        deployment=deployment,
+                        tokens=tokens,
+                        start_time=start_time,
+                        latency_ms=latency_ms,
+                        completed=completed,
+                        exception=exception,
+                        usage=usage,
+                    ),
+                )
+
+            usage = getattr(result, "usage", None)
+            AzureOpenAIConcurrencyLimiter.record(
+                deployment,
+                latency_ms,
+                output_tokens=getattr(usage, "completion_tokens", None),
+            )
+            AzureOpenAIScheduler.release(deployment)
+            AzureOpenAIRouter.finish(deployment, latency_ms)
+            self._settle_tokens(deployment, tokens, usage)
+
+            return result
 
-            result = self.client.images.generate(
-                **image_generate.model_dump(exclude_none=True)
+        if failover_exception:
+            raise failover_exception
+
+        if rate_limited:
+            raise RateLimitException()
+
+        raise ServiceUnavailableException(
+            message=f"No healthy deployment available for model {model_name}",
+            retry_after=AzureOpenAICircuitBreaker.get_retry_after(deployments),
+        )
+
+    def _close_stream(
+        self,
+        deployment: AzureOpenAIDeployment,
+        tokens: int,
+        start_time: float,
+        latency_ms: float,
+        completed: bool,
+        exception: Optional[BaseException],
+        usage: Any,
+    ) -> None:
+        if completed or exception is not None:
+            AzureOpenAIConcurrencyLimiter.record(
+                deployment,
+                (time.time() - start_time) * 1000,
+                exception,
+                output_tokens=getattr(usage, "completion_tokens", None),
+            )
+
+        AzureOpenAIScheduler.release(deployment)
+        AzureOpenAIRouter.finish(
+            deployment, latency_ms, failed=isinstance(exception, openai.APIError)
+        )
+        self._settle_tokens(deployment, tokens, usage)
+
+    def _settle_tokens(
+        self, deployment: AzureOpenAIDeployment, tokens: int, usage: Any
+    ) -> None:
+        if tokens and getattr(usage, "total_tokens", None) is not None:
+            AzureOpenAIRateLimiter.settle(deployment, tokens, usage.total_tokens)
+
+    async def image_generate(self, image_generate: ImageGenerate):
+        try:
+            start_time = time.time()
+            result = await self._route(
+                image_generate.model,
+                lambda azure_openai: azure_openai.images.generate(
+                    **image_generate.model_dump(exclude_none=True)
+                ),
             )
 
             self.trace_operation(
@@ -77,16 +277,20 @@ class AzureOpenAIClient:
             #     model_name=image_generate.model,
             #     azure_openai=azure_openai,
             #     status_code=exception.status_code,
-            #     start_time=start_time,                
+            #     start_time=start_time,
             # )
 
-    def chat_completion(self, chat_completion: ChatCompletion):
+    async def chat_completion(self, chat_completion: ChatCompletion):
         try:
             start_time = time.time()
-            # azure_openai: AzureOpenAI = self.client.get_client(chat_completion.model)
-
-            result = self.client.chat.completions.create(
-                **chat_completion.model_dump(exclude_none=True)
+            result = await self._route(
+                chat_completion.model,
+                lambda azure_openai: azure_openai.chat.completions.create(
+                    **chat_completion.model_dump(exclude_none=True)
+                ),
+                estimate_tokens=lambda: AzureOpenAIRateLimiter.estimate_chat_tokens(
+                    chat_completion
+                ),
             )
 
             self.trace_operation(
@@ -110,16 +314,20 @@ class AzureOpenAIClient:
             #     model_name=chat_completion.model,
             #     azure_openai=azure_openai,
             #     status_code=exception.status_code,
-            #     start_time=start_time,                
+            #     start_time=start_time,
             # )
 
-    def embedding(self, embedding: Embedding):
+    async def embedding(self, embedding: Embedding):
         try:
             start_time = time.time()
-            # azure_openai: AzureOpenAI = self.client.get_client(embedding.model)
-
-            result = self.client.embeddings.create(
-                **embedding.model_dump(exclude_none=True)
+            result = await self._route(
+                embedding.model,
+                lambda azure_openai: azure_openai.embeddings.create(
+                    **embedding.model_dump(exclude_none=True)
+                ),
+                estimate_tokens=lambda: AzureOpenAIRateLimiter.estimate_embedding_tokens(
+                    embedding
+                ),
             )
 
             self.trace_operation(
@@ -143,17 +351,18 @@ class AzureOpenAIClient:
             #     model_name=embedding.model,
             #     azure_openai=azure_openai,
             #     status_code=exception.status_code,
-            #     start_time=start_time,                
+            #     start_time=start_time,
             # )
 
-    def create_file(self, new_file: File):
+    async def create_file(self, new_file: File):
         try:
             start_time = time.time()
-            # azure_openai: AzureOpenAI = self.client.get_client(new_file.model)
+            azure_openai: AsyncAzureOpenAI = self.client.get_client(new_file.model)
 
-            result = self.client.files.create(
-                file=open(new_file.file, "rb"), purpose=new_file.purpose.value
-            )
+            with open(new_file.file, "rb") as file:
+                result = await azure_openai.files.create(
+                    file=file, purpose=new_file.purpose.value
+                )
 
             self.trace_operation(
                 new_file.model,
@@ -176,15 +385,15 @@ class AzureOpenAIClient:
             #     model_name=new_file.model,
             #     azure_openai=azure_openai,
             #     status_code=exception.status_code,
-            #     start_time=start_time,                
+            #     start_time=start_time,
             # )
 
-    def batch(self, batch: Batch):
+    async def batch(self, batch: Batch):
         try:
             start_time = time.time()
-            # azure_openai: AzureOpenAI = self.client.get_client(batch.model)
+            azure_openai: AsyncAzureOpenAI = self.client.get_client(batch.model)
 
-            result = self.client.batches.create(
+            result = await azure_openai.batches.create(
                 **batch.model_dump(exclude_none=True, exclude={"model"})
             )
 
@@ -217,12 +426,12 @@ class AzureOpenAIClient:
             #     message=f"File: {batch.input_file_id}",
             # )
 
-    def get_file(self, model_name: str, file_id: str):
+    async def get_file(self, model_name: str, file_id: str):
         try:
             start_time = time.time()
 
-            # azure_openai: AzureOpenAI = self.client.get_client(model_name)
-            retrieved_file = self.client.files.retrieve(file_id=file_id)
+            azure_openai: AsyncAzureOpenAI = self.client.get_client(model_name)
+            retrieved_file = await azure_openai.files.retrieve(file_id=file_id)
 
             # self._logger.log(
             #     model_name=model_name,
@@ -247,12 +456,12 @@ class AzureOpenAIClient:
             #     message=f"File: {file_id}",
             # )
 
-    def get_file_content(self, model_name: str, file_id: str):
+    async def get_file_content(self, model_name: str, file_id: str):
         try:
             start_time = time.time()
 
-            # azure_openai: AzureOpenAI = self.client.get_client(model_name)
-            file_content = self.client.files.content(file_id)
+            azure_openai: AsyncAzureOpenAI = self.client.get_client(model_name)
+            file_content = await azure_openai.files.content(file_id)
 
             # self._logger.log(
             #     model_name=model_name,
@@ -277,12 +486,12 @@ class AzureOpenAIClient:
             #     message=f"File: {file_id}",
             # )
 
-    def get_batch(self, model_name: str, batch_id: str):
+    async def get_batch(self, model_name: str, batch_id: str):
         try:
             start_time = time.time()
 
-            # azure_openai: AzureOpenAI = self.client.get_client(model_name)
-            batch = self.client.batches.retrieve(batch_id=batch_id)
+            azure_openai: AsyncAzureOpenAI = self.client.get_client(model_name)
+            batch = await azure_openai.batches.retrieve(batch_id=batch_id)
 
             # self._logger.log(
             #     model_name=model_name,
@@ -306,4 +515,3 @@ class AzureOpenAIClient:
             #     start_time=start_time,
             #     message=f"Batch: {batch_id}",
             # )
-
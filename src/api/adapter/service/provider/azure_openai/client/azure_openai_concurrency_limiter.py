@@ -0,0 +1,144 @@
+import math
+import os
+import time
+from typing import Dict, List, Optional
+
+import openai
+
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_scheduler import (
+    AzureOpenAIScheduler,
+)
+from src.api.adapter.service.provider.azure_openai.domain.azure_openai import (
+    AzureOpenAIDeployment,
+)
+from src.api.adapter.http.v1.payload.response.concurrency_limit_response import (
+    ConcurrencyLimitResponse,
+)
+
+
+class ConcurrencyLimit:
+    def __init__(self, limit: float, max_limit: int) -> None:
+        self.limit = min(limit, max_limit)
+        self.max_limit = max_limit
+        self.latency_ms: Optional[float] = None
+        self.latency_ratio: Optional[float] = None
+        self.baselines: Dict[int, float] = {}
+        self.decreased_at = 0.0
+        self.increases = 0
+        self.decreases = 0
+
+
+class AzureOpenAIConcurrencyLimiter:
+    _DROP_EXCEPTIONS = (openai.RateLimitError, openai.APITimeoutError)
+    _SHORT_ALPHA = 0.2
+    _LONG_ALPHA = 0.02
+
+    _limits: Dict[str, ConcurrencyLimit] = {}
+    _enabled: bool = (
+        os.getenv("ADAPTIVE_CONCURRENCY_ENABLED", "false").lower() == "true"
+    )
+    _initial_limit: int = int(os.getenv("ADAPTIVE_CONCURRENCY_INITIAL_LIMIT", "20"))
+    _min_limit: int = int(os.getenv("ADAPTIVE_CONCURRENCY_MIN_LIMIT", "1"))
+    _max_limit: int = int(os.getenv("ADAPTIVE_CONCURRENCY_MAX_LIMIT", "200"))
+    _backoff_ratio: float = float(
+        os.getenv("ADAPTIVE_CONCURRENCY_BACKOFF_RATIO", "0.9")
+    )
+    _latency_tolerance: float = float(
+        os.getenv("ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE", "2.0")
+    )
+
+    @classmethod
+    def attach(cls, deployment: AzureOpenAIDeployment) -> None:
+        if cls._enabled and deployment.name not in cls._limits:
+            cls._limits[deployment.name] = ConcurrencyLimit(
+                limit=deployment.max_concurrency or cls._initial_limit,
+                max_limit=min(
+                    deployment.max_concurrency or cls._max_limit, cls._max_limit
+                ),
+            )
+            cls._apply(deployment, cls._limits[deployment.name])
+
+    @classmethod
+    def record(
+        cls,
+        deployment: AzureOpenAIDeployment,
+        latency_ms: float,
+        exception: Optional[BaseException] = None,
+        output_tokens: Optional[int] = None,
+    ) -> None:
+        limit = cls._limits.get(deployment.name)
+        if limit is None:
+            return
+
+        if isinstance(exception, cls._DROP_EXCEPTIONS):
+            cls._decrease(deployment, limit, latency_ms)
+            return
+        if exception is not None:
+            return
+
+        bucket = (output_tokens or 0).bit_length()
+        baseline_ms = limit.baselines.get(bucket)
+        limit.baselines[bucket] = cls._ewma(baseline_ms, latency_ms, cls._LONG_ALPHA)
+        limit.latency_ms = cls._ewma(limit.latency_ms, latency_ms, cls._SHORT_ALPHA)
+        if baseline_ms is None:
+            return
+
+        limit.latency_ratio = cls._ewma(
+            limit.latency_ratio, latency_ms / max(baseline_ms, 1.0), cls._SHORT_ALPHA
+        )
+        if limit.latency_ratio > cls._latency_tolerance:
+            cls._decrease(deployment, limit, latency_ms)
+            return
+
+        if (
+            limit.limit < limit.max_limit
+            and AzureOpenAIScheduler.get_in_flight(deployment) * 2 >= limit.limit
+        ):
+            limit.limit = min(limit.limit + 1 / limit.limit, limit.max_limit)
+            limit.increases += 1
+            cls._apply(deployment, limit)
+
+    @classmethod
+    def get_stats(cls) -> List[ConcurrencyLimitResponse]:
+        return [
+            ConcurrencyLimitResponse(
+                deployment=name,
+                limit=math.floor(limit.limit),
+                max_limit=limit.max_limit,
+                latency_ms=(
+                    round(limit.latency_ms, 2) if limit.latency_ms is not None else None
+                ),
+                latency_ratio=(
+                    round(limit.latency_ratio, 4)
+                    if limit.latency_ratio is not None
+                    else None
+                ),
+                increases=limit.increases,
+                decreases=limit.decreases,
+            )
+            for name, limit in cls._limits.items()
+        ]
+
+    @classmethod
+    def _decrease(
+        cls,
+        deployment: AzureOpenAIDeployment,
+        limit: ConcurrencyLimit,
+        latency_ms: float,
+    ) -> None:
+        now = time.monotonic()
+        if (now - limit.decreased_at) * 1000 < (limit.latency_ms or latency_ms):
+            return
+
+        limit.limit = max(limit.limit * cls._backoff_ratio, cls._min_limit)
+        limit.decreased_at = now
+        limit.decreases += 1
+        cls._apply(deployment, limit)
+
+    @classmethod
+    def _apply(cls, deployment: AzureOpenAIDeployment, limit: ConcurrencyLimit) -> None:
+        AzureOpenAIScheduler.set_adaptive_limit(deployment, math.floor(limit.limit))
+
+    @classmethod
+    def _ewma(cls, average: Optional[float], value: float, alpha: float) -> float:
+        return value if average is None else alpha * value + (1 - alpha) * average
@@ -0,0 +1,224 @@
+import asyncio
+import contextvars
+import math
+import os
+from typing import Dict, List, Optional, Set, Tuple
+
+BatchKey = Tuple[str, Optional[str], Optional[str]]
+
+import openai
+
+from src.api.adapter.http.v1.middleware.header_middleware import (
+    get_client_id,
+    get_priority,
+    set_background_client,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_client import (
+    AzureOpenAIClient,
+)
+from src.api.adapter.service.provider.azure_openai.domain.embedding import Embedding
+from src.api.adapter.http.v1.payload.response.cost_response import Usage
+
+
+class EmbeddingBatchRequest:
+    def __init__(
+        self,
+        texts: List[str],
+        tokens: int,
+        token_counts: Optional[List[int]],
+        future: asyncio.Future,
+    ) -> None:
+        self.texts = texts
+        self.tokens = tokens
+        self.token_counts = token_counts
+        self.future = future
+
+
+class EmbeddingBatch:
+    def __init__(self) -> None:
+        self.requests: List[EmbeddingBatchRequest] = []
+        self.inputs = 0
+        self.tokens = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def add(self, request: EmbeddingBatchRequest) -> None:
+        self.requests.append(request)
+        self.inputs += len(request.texts)
+        self.tokens += request.tokens
+
+
+class AzureOpenAIEmbeddingBatcher:
+    def __init__(self, client: AzureOpenAIClient) -> None:
+        self.client = client
+        self._batches: Dict[BatchKey, EmbeddingBatch] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._linger = float(os.getenv("EMBEDDING_BATCH_LINGER_MS", "5")) / 1000
+        self._max_inputs = int(os.getenv("EMBEDDING_BATCH_MAX_INPUTS", "256"))
+        self._max_tokens = int(os.getenv("EMBEDDING_BATCH_MAX_TOKENS", "50000"))
+
+    async def embed(
+        self,
+        model_name: str,
+        texts: List[str],
+        token_counts: Optional[List[int]] = None,
+    ) -> Tuple[List[list], Usage]:
+        if self._linger <= 0:
+            return await self._embed(model_name, texts, token_counts)
+
+        tokens = (
+            sum(token_counts)
+            if token_counts is not None
+            else sum(self._estimate_tokens(text) for text in texts)
+        )
+        key = (model_name, get_client_id(), get_priority())
+        batch = self._batches.get(key)
+
+        if batch and (
+            batch.inputs + len(texts) > self._max_inputs
+            or batch.tokens + tokens > self._max_tokens
+        ):
+            self._flush(key, batch)
+            batch = None
+
+        loop = asyncio.get_running_loop()
+        if batch is None:
+            batch = EmbeddingBatch()
+            batch.timer = loop.call_later(self._linger, self._flush, key, batch)
+            self._batches[key] = batch
+
+        future = loop.create_future()
+        batch.add(
+            EmbeddingBatchRequest(
+                texts=texts, tokens=tokens, token_counts=token_counts, future=future
+            )
+        )
+
+        if batch.inputs >= self._max_inputs or batch.tokens >= self._max_tokens:
+            self._flush(key, batch)
+
+        return await future
+
+    def _flush(self, key: BatchKey, batch: EmbeddingBatch) -> None:
+        if self._batches.get(key) is not batch:
+            return
+
+        del self._batches[key]
+        batch.timer.cancel()
+
+        task = asyncio.create_task(
+            self._execute_batch(key, batch), context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute_batch(self, key: BatchKey, batch: EmbeddingBatch) -> None:
+        model_name, client_id, priority = key
+        set_background_client(client_id, priority)
+        await self._execute(model_name, batch)
+
+    async def _execute(self, model_name: str, batch: EmbeddingBatch) -> None:
+        requests = [request for request in batch.requests if not request.future.done()]
+        if not requests:
+            return
+
+        try:
+            vectors, usage = await self._embed(
+                model_name,
+                [text for request in requests for text in request.texts],
+                (
+                    [count for request in requests for count in request.token_counts]
+                    if all(request.token_counts is not None for request in requests)
+                    else None
+                ),
+            )
+        except openai.BadRequestError as exception:
+            if len(requests) == 1:
+                self._set_exception(requests[0], exception)
+                return
+            await asyncio.gather(
+                *[self._execute_alone(model_name, request) for request in requests]
+            )
+            return
+        except Exception as exception:
+            for request in requests:
+                self._set_exception(request, exception)
+            return
+
+        prompt_tokens = self._split(
+            usage.prompt_tokens, [request.tokens for request in requests]
+        )
+        total_tokens = self._split(
+            usage.total_tokens, [request.tokens for request in requests]
+        )
+
+        offset = 0
+        for index, request in enumerate(requests):
+            request_vectors = vectors[offset : offset + len(request.texts)]
+            offset += len(request.texts)
+
+            if not request.future.done():
+                request.future.set_result(
+                    (
+                        request_vectors,
+                        Usage(
+                            prompt_tokens=prompt_tokens[index],
+                            total_tokens=total_tokens[index],
+                        ),
+                    )
+                )
+
+    async def _execute_alone(
+        self, model_name: str, request: EmbeddingBatchRequest
+    ) -> None:
+        try:
+            result = await self._embed(model_name, request.texts, request.token_counts)
+        except Exception as exception:
+            self._set_exception(request, exception)
+            return
+
+        if not request.future.done():
+            request.future.set_result(result)
+
+    async def _embed(
+        self, model_name: str, texts: List[str], token_counts: Optional[List[int]]
+    ) -> Tuple[List[list], Usage]:
+        response = await self.client.embedding(
+            Embedding(
+                input=texts,
+                model=model_name,
+                input_tokens=None if token_counts is None else sum(token_counts),
+            )
+        )
+
+        return (
+            [data.embedding for data in sorted(response.data, key=lambda d: d.index)],
+            Usage(
+                prompt_tokens=response.usage.prompt_tokens,
+                total_tokens=response.usage.total_tokens,
+            ),
+        )
+
+    def _set_exception(self, request: EmbeddingBatchRequest, exception: Exception):
+        if not request.future.done():
+            request.future.set_exception(exception)
+
+    def _split(self, total: int, weights: List[int]) -> List[int]:
+        weight_sum = sum(weights)
+        if weight_sum == 0:
+            weights, weight_sum = [1] * len(weights), len(weights)
+
+        shares = [total * weight / weight_sum for weight in weights]
+        split = [math.floor(share) for share in shares]
+
+        remainders = sorted(
+            range(len(shares)),
+            key=lambda index: shares[index] - split[index],
+            reverse=True,
+        )
+        for index in remainders[: total - sum(split)]:
+            split[index] += 1
+
+        return split
+
+    def _estimate_tokens(self, text: str) -> int:
+        return max(math.ceil(len(text) / 4), 1)
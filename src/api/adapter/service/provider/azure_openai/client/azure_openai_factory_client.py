@@ -1,38 +1,53 @@
 import os
-import httpx
-from openai import AzureOpenAI
+from typing import Dict, List, Optional, Tuple
+from openai import AsyncAzureOpenAI
 from src.api.adapter.service.provider.azure_openai.constant.api_version import (
     APIVersion,
 )
+from src.api.adapter.service.provider.azure_openai.domain.azure_openai import (
+    AzureOpenAIDeployment,
+)
+from src.api.adapter.service.provider.http.http_client_pool import HttpClientPool
+from src.api.adapter.cache.simple.provider_cache import ProviderCache
+from src.api.core.business.provider_business import ProviderBusiness
 from src.api.core.exception.internal_server_error_exception import (
     InternalServerErrorException,
 )
+from src.api.domain.provider import Model, ModelDeployment, ProviderCatalog
+
+
+DeploymentConfig = Tuple[Optional[str], str, str]
 
 
 class AzureOpenAIFactoryClient:
 
+    _PROVIDER = "azure_openai"
+
     def __init__(self) -> None:
-        self._api_key_west_us = os.getenv("AZURE_OPENAI_WEST_US_API_KEY")
-        self._endpoint_west_us = os.getenv("AZURE_OPENAI_WEST_US_ENDPOINT")
-        self._api_key_east_us = os.getenv("AZURE_OPENAI_EAST_US_API_KEY")
-        self._endpoint_east_us = os.getenv("AZURE_OPENAI_EAST_US_ENDPOINT")
-        self._http_client = httpx.Client(
-            verify=os.getenv("HTTPX_CLIENT_VERIFY", "False") == "True"
+        self._default_api_version = os.getenv(
+            "AZURE_OPENAI_API_VERSION", APIVersion.VERSION_2024_10_21.value
         )
-
-        self._clients = {
-            "gpt-4o": self._get_gpt_4o_pg_client(),
-            "text-embedding-ada-002": self._get_text_embedding_ada_002_client(),
-            "gpt-4o-batch": self._get_gpt_4o_batch_client(),
-            "gpt-4o-mini-batch": self._get_gpt_4o_batch_client(),
-            "gpt-4o-mini": self._get_gpt_4o_mini_client(),
-            "dall-e-2": self.get_dall_e_2_client(),
-            "dall-e-3": self.get_dall_e_3_client(),
+        self._default_region = os.getenv("AZURE_OPENAI_DEFAULT_REGION", "west_us")
+        self._static_deployments: Dict[str, Optional[ModelDeployment]] = {
+            model.name: model.deployment
+            for provider in ProviderBusiness().find()
+            if provider.name == self._PROVIDER
+            for model in provider.models
         }
+        self._version: Optional[int] = None
+        self._configs: Dict[str, DeploymentConfig] = {}
+        self._deployments: Dict[str, List[AzureOpenAIDeployment]] = {}
 
-    def get_client(self, model_name: str):
+    def get_client(self, model_name: str) -> AsyncAzureOpenAI:
+        return self.get_deployments(model_name)[0].client
+
+    def get_deployments(self, model_name: str) -> List[AzureOpenAIDeployment]:
         try:
-            return self._clients[model_name]
+            catalog = ProviderCache.get_catalog()
+            if catalog.version != self._version:
+                self._load(catalog)
+
+            return self._deployments[model_name]
         except KeyError as exception:
             raise InternalServerErrorException(
                 message="Invalid model type",
@@ -43,57 +58,87 @@ class AzureOpenAIFactoryClient:
                 exception=exception,
             )
 
-    def _get_gpt_4o_pg_client(self) -> AzureOpenAI:
-        return AzureOpenAI(
-            api_key=self._api_key_west_us,
-            azure_endpoint=self._endpoint_west_us,
-            api_version=APIVersion.VERSION_2024_10_21.value,
-            azure_deployment="gpt-4o-pg",
-            http_client=httpx.Client(
-                verify=os.getenv("HTTPX_CLIENT_VERIFY", "False") == "True"
-            ),
-        )
+    def _load(self, catalog: ProviderCatalog) -> None:
+        provider = catalog.providers_by_name.get(self._PROVIDER)
+        configs: Dict[str, DeploymentConfig] = {}
+        deployments: Dict[str, List[AzureOpenAIDeployment]] = {}
 
-    def _get_text_embedding_ada_002_client(self) -> AzureOpenAI:
-        return AzureOpenAI(
-            api_key=self._api_key_west_us,
-            azure_endpoint=self._endpoint_west_us,
-            api_version=APIVersion.VERSION_2023_03_15_PREVIEW.value,
-            azure_deployment="text-embedding-ada-002",
-            http_client=self._http_client,
-        )
+        for model in provider.models if provider else []:
+            config = self._get_config(model)
+            configs[model.name] = config
+            deployments[model.name] = (
+                self._deployments[model.name]
+                if self._configs.get(model.name) == config
+                else self._get_deployments(model.name, config)
+            )
 
-    def _get_gpt_4o_batch_client(self) -> AzureOpenAI:
-        return AzureOpenAI(
-            api_key=self._api_key_west_us,
-            azure_endpoint=self._endpoint_west_us,
-            api_version=APIVersion.VERSION_2024_07_01_PREVIEW.value,
-            http_client=self._http_client,
-        )
+        self._configs = configs
+        self._deployments = deployments
+        self._version = catalog.version
 
-    def _get_gpt_4o_mini_client(self) -> AzureOpenAI:
-        return AzureOpenAI(
-            api_key=self._api_key_east_us,
-            azure_endpoint=self._endpoint_east_us,
-            api_version="2024-10-01-preview",
-            azure_deployment="gpt-4o-mini",
-            http_client=self._http_client,
+    def _get_config(self, model: Model) -> DeploymentConfig:
+        deployment = (
+            model.deployment
+            or self._static_deployments.get(model.name)
+            or ModelDeployment()
         )
 
-    def get_dall_e_2_client(self) -> AzureOpenAI:
-        return AzureOpenAI(
-            api_key=self._api_key_east_us,
-            azure_endpoint=self._endpoint_east_us,
-            api_version=APIVersion.VERSION_2024_05_01_PREVIEW.value,
-            azure_deployment="dalle2",
-            http_client=self._http_client,
+        return (
+            deployment.name,
+            deployment.api_version or self._default_api_version,
+            deployment.region or self._default_region,
         )
 
-    def get_dall_e_3_client(self) -> AzureOpenAI:
-        return AzureOpenAI(
-            api_key=self._api_key_east_us,
-            azure_endpoint=self._endpoint_east_us,
-            api_version=APIVersion.VERSION_2024_02_01.value,
-            azure_deployment="dalle3",
-            http_client=self._http_client,
+    def _get_deployments(
+        self, model_name: str, config: DeploymentConfig
+    ) -> List[AzureOpenAIDeployment]:
+        azure_deployment, api_version, primary_region = config
+
+        model_env = self._get_model_env(model_name)
+        tokens_per_minute = os.getenv(f"AZURE_OPENAI_{model_env}_TPM")
+        requests_per_minute = os.getenv(f"AZURE_OPENAI_{model_env}_RPM")
+        max_concurrency = os.getenv(f"AZURE_OPENAI_{model_env}_MAX_CONCURRENCY")
+
+        return [
+            AzureOpenAIDeployment(
+                name=f"{region}/{azure_deployment or model_name}",
+                model=model_name,
+                region=region,
+                client=self._get_client(
+                    region=region,
+                    api_version=api_version,
+                    azure_deployment=azure_deployment,
+                ),
+                tokens_per_minute=int(tokens_per_minute) if tokens_per_minute else None,
+                requests_per_minute=(
+                    int(requests_per_minute) if requests_per_minute else None
+                ),
+                max_concurrency=int(max_concurrency) if max_concurrency else None,
+            )
+            for region in self._get_regions(model_name, primary_region)
+        ]
+
+    def _get_regions(self, model_name: str, primary_region: str) -> List[str]:
+        model_env = self._get_model_env(model_name)
+        regions = os.getenv(f"AZURE_OPENAI_{model_env}_REGIONS", primary_region)
+
+        return [region.strip() for region in regions.split(",") if region.strip()]
+
+    def _get_model_env(self, model_name: str) -> str:
+        return model_name.upper().replace("-", "_").replace(".", "_")
+
+    def _get_client(
+        self, region: str, api_version: str, azure_deployment: Optional[str]
+    ) -> AsyncAzureOpenAI:
+        region_env = region.upper()
+        api_key = os.getenv(f"AZURE_OPENAI_{region_env}_API_KEY")
+        endpoint = os.getenv(f"AZURE_OPENAI_{region_env}_ENDPOINT")
+
+        return AsyncAzureOpenAI(
+            api_key=api_key,
+            azure_endpoint=endpoint,
+            api_version=api_version,
+            azure_deployment=azure_deployment,
+            http_client=HttpClientPool.get_client(endpoint),
+            max_retries=0,
         )
@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional
+
+import openai
+
+from src.api.adapter.service.provider.azure_openai.domain.azure_openai import (
+    AzureOpenAIFallbackResult,
+)
+from src.api.core.exception.rate_limit_exeception import RateLimitException
+from src.api.core.exception.service_unavailable_exception import (
+    ServiceUnavailableException,
+)
+
+
+class AzureOpenAIFallback:
+    _FALLBACK_EXCEPTIONS = (
+        RateLimitException,
+        ServiceUnavailableException,
+        openai.RateLimitError,
+        openai.InternalServerError,
+        openai.APIConnectionError,
+        asyncio.TimeoutError,
+    )
+
+    @classmethod
+    async def execute(
+        cls,
+        models: List[str],
+        max_wait_ms: Optional[int],
+        operation: Callable[[str], Awaitable[Any]],
+    ) -> AzureOpenAIFallbackResult:
+        for index, model_name in enumerate(models):
+            is_last = index == len(models) - 1
+
+            try:
+                result = (
+                    await operation(model_name)
+                    if is_last or not max_wait_ms
+                    else await asyncio.wait_for(
+                        operation(model_name), timeout=max_wait_ms / 1000
+                    )
+                )
+            except cls._FALLBACK_EXCEPTIONS:
+                if is_last:
+                    raise
+                continue
+
+            return AzureOpenAIFallbackResult(
+                result=result, model=model_name, fallback=index > 0
+            )
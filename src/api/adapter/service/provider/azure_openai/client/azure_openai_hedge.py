@@ -0,0 +1,154 @@
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from src.api.adapter.service.provider.azure_openai.domain.azure_openai import (
+    AzureOpenAIHedgeResult,
+)
+from src.api.adapter.http.v1.payload.response.hedge_stats_response import (
+    HedgeStatsResponse,
+)
+
+
+class HedgeStats:
+    def __init__(self, window_size: int) -> None:
+        self.latencies: Deque[float] = deque(maxlen=window_size)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+
+class AzureOpenAIHedge:
+    _PRIMARY = "primary"
+    _HEDGE = "hedge"
+
+    _stats: Dict[str, HedgeStats] = {}
+    _percentile: float = float(os.getenv("HEDGE_PERCENTILE", "95"))
+    _window_size: int = int(os.getenv("HEDGE_WINDOW_SIZE", "200"))
+    _min_samples: int = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+    _min_threshold_ms: float = float(os.getenv("HEDGE_MIN_THRESHOLD_MS", "250"))
+    _budget_ratio: float = float(os.getenv("HEDGE_BUDGET_RATIO", "0.05"))
+    _budget_max_tokens: float = float(os.getenv("HEDGE_BUDGET_MAX_TOKENS", "5"))
+
+    _budget_tokens: float = _budget_max_tokens
+
+    @classmethod
+    async def observe(cls, model_name: str, operation: Callable[[], Awaitable[Any]]):
+        stats = cls._get_stats(model_name)
+        start_time = time.time()
+
+        try:
+            result = await operation()
+        except asyncio.CancelledError:
+            cls._record(stats, start_time)
+            raise
+
+        cls._record(stats, start_time)
+        return result
+
+    @classmethod
+    async def execute(
+        cls, model_name: str, operation: Callable[[], Awaitable[Any]]
+    ) -> AzureOpenAIHedgeResult:
+        stats = cls._get_stats(model_name)
+        stats.requests += 1
+        cls._budget_tokens = min(
+            cls._budget_tokens + cls._budget_ratio, cls._budget_max_tokens
+        )
+
+        primary = asyncio.ensure_future(cls.observe(model_name, operation))
+        threshold_ms = cls._get_threshold(stats)
+
+        if threshold_ms is None:
+            result = await primary
+            return AzureOpenAIHedgeResult(
+                result=result, hedged=False, winner=cls._PRIMARY
+            )
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=threshold_ms / 1000)
+            if done or cls._budget_tokens < 1:
+                result = await primary
+                return AzureOpenAIHedgeResult(
+                    result=result, hedged=False, winner=cls._PRIMARY
+                )
+        except BaseException:
+            primary.cancel()
+            raise
+
+        cls._budget_tokens -= 1
+        stats.hedges += 1
+        hedge = asyncio.ensure_future(cls.observe(model_name, operation))
+        winner = await cls._race(primary=primary, hedge=hedge)
+
+        if winner is hedge:
+            stats.hedge_wins += 1
+
+        return AzureOpenAIHedgeResult(
+            result=winner.result(),
+            hedged=True,
+            winner=cls._HEDGE if winner is hedge else cls._PRIMARY,
+        )
+
+    @classmethod
+    def get_stats(cls) -> List[HedgeStatsResponse]:
+        return [
+            HedgeStatsResponse(
+                model=model_name,
+                threshold_ms=cls._get_threshold(stats),
+                samples=len(stats.latencies),
+                requests=stats.requests,
+                hedges=stats.hedges,
+                hedge_wins=stats.hedge_wins,
+                hedge_rate=(
+                    round(stats.hedges / stats.requests, 4) if stats.requests else 0
+                ),
+            )
+            for model_name, stats in cls._stats.items()
+        ]
+
+    @classmethod
+    async def _race(cls, primary: asyncio.Future, hedge: asyncio.Future):
+        pending = {primary, hedge}
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in (primary, hedge):
+                    if task in done and task.exception() is None:
+                        return task
+
+            raise primary.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    @classmethod
+    def _get_threshold(cls, stats: HedgeStats) -> Optional[float]:
+        if len(stats.latencies) < cls._min_samples:
+            return None
+
+        latencies = sorted(stats.latencies)
+        index = min(
+            math.ceil(cls._percentile / 100 * len(latencies)) - 1, len(latencies) - 1
+        )
+        return round(max(latencies[max(index, 0)], cls._min_threshold_ms), 2)
+
+    @classmethod
+    def _record(cls, stats: HedgeStats, start_time: float) -> None:
+        stats.latencies.append((time.time() - start_time) * 1000)
+
+    @classmethod
+    def _get_stats(cls, model_name: str) -> HedgeStats:
+        stats = cls._stats.get(model_name)
+        if stats is None:
+            stats = HedgeStats(cls._window_size)
+            cls._stats[model_name] = stats
+        return stats
@@ -0,0 +1,205 @@
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+from src.api.adapter.service.provider.azure_openai.domain.azure_openai import (
+    AzureOpenAIDeployment,
+)
+from src.api.adapter.service.provider.azure_openai.domain.chat_completion import (
+    ChatCompletion,
+)
+from src.api.adapter.service.provider.azure_openai.domain.embedding import Embedding
+from src.api.adapter.http.v1.payload.response.rate_limit_response import (
+    RateLimitResponse,
+)
+from src.api.adapter.service.tokenizer.tokenizer_service import TokenizerService
+
+
+class TokenBucket:
+    def __init__(self, per_minute: int, burst_seconds: float) -> None:
+        self.rate = per_minute / 60
+        self.capacity = max(self.rate * burst_seconds, 1)
+        self.available = self.capacity
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.available = min(
+            self.available + (now - self.updated_at) * self.rate, self.capacity
+        )
+        self.updated_at = now
+
+    def get_wait(self, cost: float) -> float:
+        deficit = min(cost, self.capacity) - self.available
+        return deficit / self.rate if deficit > 0 else 0.0
+
+    def debit(self, cost: float) -> None:
+        self.available -= min(cost, self.capacity)
+
+
+class DeploymentLimit:
+    def __init__(
+        self,
+        deployment: AzureOpenAIDeployment,
+        burst_seconds: float,
+    ) -> None:
+        self.tokens = (
+            TokenBucket(deployment.tokens_per_minute, burst_seconds)
+            if deployment.tokens_per_minute
+            else None
+        )
+        self.requests = (
+            TokenBucket(deployment.requests_per_minute, burst_seconds)
+            if deployment.requests_per_minute
+            else None
+        )
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+
+
+class AzureOpenAIRateLimiter:
+    _IMAGE_TOKENS = 85
+    _MESSAGE_TOKENS = 4
+
+    _limits: Dict[str, DeploymentLimit] = {}
+    _max_wait: float = float(os.getenv("RATE_LIMIT_MAX_WAIT_MS", "2000")) / 1000
+    _burst_seconds: float = float(os.getenv("RATE_LIMIT_BURST_SECONDS", "10"))
+    _default_completion_tokens: int = int(
+        os.getenv("RATE_LIMIT_DEFAULT_COMPLETION_TOKENS", "1024")
+    )
+
+    @classmethod
+    def reserve(cls, deployment: AzureOpenAIDeployment, tokens: int) -> Optional[float]:
+        limit = cls._get_limit(deployment)
+        buckets = [
+            (bucket, cost)
+            for bucket, cost in ((limit.tokens, tokens), (limit.requests, 1))
+            if bucket is not None
+        ]
+        if not buckets:
+            limit.admitted += 1
+            return 0.0
+
+        now = time.monotonic()
+        for bucket, _ in buckets:
+            bucket.refill(now)
+
+        wait = max(bucket.get_wait(cost) for bucket, cost in buckets)
+        if wait > cls._max_wait:
+            limit.rejected += 1
+            return None
+
+        for bucket, cost in buckets:
+            bucket.debit(cost)
+
+        limit.admitted += 1
+        if wait > 0:
+            limit.queued += 1
+        return wait
+
+    @classmethod
+    def settle(
+        cls, deployment: AzureOpenAIDeployment, reserved: int, actual: int
+    ) -> None:
+        bucket = cls._get_limit(deployment).tokens
+        if bucket is None:
+            return
+
+        bucket.refill(time.monotonic())
+        bucket.available = min(
+            bucket.available + min(reserved, bucket.capacity) - actual,
+            bucket.capacity,
+        )
+
+    @classmethod
+    def refund(cls, deployment: AzureOpenAIDeployment, reserved: int) -> None:
+        limit = cls._get_limit(deployment)
+        cls.settle(deployment, reserved=reserved, actual=0)
+        if limit.requests is not None:
+            limit.requests.available = min(
+                limit.requests.available + 1, limit.requests.capacity
+            )
+
+    @classmethod
+    def is_token_limited(cls, deployments: List[AzureOpenAIDeployment]) -> bool:
+        return any(deployment.tokens_per_minute for deployment in deployments)
+
+    @classmethod
+    def estimate_chat_tokens(cls, chat_completion: ChatCompletion) -> int:
+        completion_tokens = chat_completion.max_tokens or cls._default_completion_tokens
+        if chat_completion.prompt_tokens is not None:
+            return chat_completion.prompt_tokens + completion_tokens
+
+        tokens = 0
+
+        for message in chat_completion.messages:
+            tokens += cls._MESSAGE_TOKENS
+            if isinstance(message.content, str):
+                tokens += TokenizerService.count(chat_completion.model, message.content)
+                continue
+            for content in message.content:
+                if content.type == "image_url":
+                    tokens += cls._IMAGE_TOKENS
+                elif content.text:
+                    tokens += TokenizerService.count(
+                        chat_completion.model, content.text
+                    )
+
+        if chat_completion.tools:
+            tokens += TokenizerService.count(
+                chat_completion.model,
+                json.dumps(
+                    [
+                        tool.model_dump(exclude_none=True)
+                        for tool in chat_completion.tools
+                    ]
+                ),
+            )
+
+        return tokens + completion_tokens
+
+    @classmethod
+    def estimate_embedding_tokens(cls, embedding: Embedding) -> int:
+        if embedding.input_tokens is not None:
+            return embedding.input_tokens
+
+        return sum(TokenizerService.count_many(embedding.model, embedding.input))
+
+    @classmethod
+    def get_stats(cls) -> List[RateLimitResponse]:
+        now = time.monotonic()
+        for limit in cls._limits.values():
+            for bucket in (limit.tokens, limit.requests):
+                if bucket is not None:
+                    bucket.refill(now)
+
+        return [
+            RateLimitResponse(
+                deployment=name,
+                tokens_per_minute=(
+                    round(limit.tokens.rate * 60) if limit.tokens else None
+                ),
+                requests_per_minute=(
+                    round(limit.requests.rate * 60) if limit.requests else None
+                ),
+                tokens_available=(
+                    round(limit.tokens.available, 2) if limit.tokens else None
+                ),
+                requests_available=(
+                    round(limit.requests.available, 2) if limit.requests else None
+                ),
+                admitted=limit.admitted,
+                queued=limit.queued,
+                rejected=limit.rejected,
+            )
+            for name, limit in cls._limits.items()
+        ]
+
+    @classmethod
+    def _get_limit(cls, deployment: AzureOpenAIDeployment) -> DeploymentLimit:
+        limit = cls._limits.get(deployment.name)
+        if limit is None:
+            limit = DeploymentLimit(deployment, cls._burst_seconds)
+            cls._limits[deployment.name] = limit
+        return limit
@@ -0,0 +1,181 @@
+import asyncio
+import os
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+import openai
+
+from src.api.adapter.http.v1.payload.response.retry_stats_response import (
+    RetryStatsResponse,
+)
+
+
+class AzureOpenAIRetry:
+    _RETRYABLE_EXCEPTIONS = (
+        openai.RateLimitError,
+        openai.InternalServerError,
+        openai.APIConnectionError,
+    )
+    _RESET_HEADERS = (
+        ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+        ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+    )
+    _DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+    _DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+    _max_attempts: int = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
+    _base_delay: float = float(os.getenv("RETRY_BASE_DELAY_MS", "250")) / 1000
+    _max_delay: float = float(os.getenv("RETRY_MAX_DELAY_MS", "8000")) / 1000
+    _deadline: float = float(os.getenv("RETRY_DEADLINE_SECONDS", "120"))
+    _budget_ratio: float = float(os.getenv("RETRY_BUDGET_RATIO", "0.1"))
+    _budget_max_tokens: float = float(os.getenv("RETRY_BUDGET_MAX_TOKENS", "10"))
+
+    _budget_tokens: float = _budget_max_tokens
+    _requests: int = 0
+    _retries: int = 0
+    _budget_exhausted: int = 0
+    _deadline_exceeded: int = 0
+    _attempts_exhausted: int = 0
+
+    @classmethod
+    async def execute(cls, operation: Callable[[float], Awaitable[Any]]):
+        deadline = time.monotonic() + cls._deadline
+        cls._deposit()
+        attempt = 1
+
+        while True:
+            try:
+                return await operation(deadline)
+            except cls._RETRYABLE_EXCEPTIONS as exception:
+                delay = cls._get_delay(exception, attempt)
+
+                if attempt >= cls._max_attempts:
+                    cls._attempts_exhausted += 1
+                    raise
+                if time.monotonic() + delay >= deadline:
+                    cls._deadline_exceeded += 1
+                    raise
+                if not cls._withdraw():
+                    cls._budget_exhausted += 1
+                    raise
+
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    @classmethod
+    def get_timeout(cls, timeout: Any, deadline: float) -> httpx.Timeout:
+        remaining = max(deadline - time.monotonic(), 0.001)
+
+        if not isinstance(timeout, httpx.Timeout):
+            return httpx.Timeout(
+                min(timeout, remaining) if timeout is not None else remaining
+            )
+
+        return httpx.Timeout(
+            connect=cls._clip(timeout.connect, remaining),
+            read=cls._clip(timeout.read, remaining),
+            write=cls._clip(timeout.write, remaining),
+            pool=cls._clip(timeout.pool, remaining),
+        )
+
+    @classmethod
+    def get_stats(cls) -> RetryStatsResponse:
+        return RetryStatsResponse(
+            requests=cls._requests,
+            retries=cls._retries,
+            retry_ratio=round(cls._retries / cls._requests, 4) if cls._requests else 0,
+            budget_tokens=round(cls._budget_tokens, 2),
+            budget_exhausted=cls._budget_exhausted,
+            deadline_exceeded=cls._deadline_exceeded,
+            attempts_exhausted=cls._attempts_exhausted,
+        )
+
+    @classmethod
+    def _deposit(cls) -> None:
+        cls._requests += 1
+        cls._budget_tokens = min(
+            cls._budget_tokens + cls._budget_ratio, cls._budget_max_tokens
+        )
+
+    @classmethod
+    def _withdraw(cls) -> bool:
+        if cls._budget_tokens < 1:
+            return False
+        cls._budget_tokens -= 1
+        cls._retries += 1
+        return True
+
+    @classmethod
+    def _get_delay(cls, exception: Exception, attempt: int) -> float:
+        backoff = min(cls._max_delay, cls._base_delay * 2 ** (attempt - 1))
+        response: Optional[httpx.Response] = getattr(exception, "response", None)
+        server_delay = cls._get_server_delay(response) if response else None
+
+        if server_delay is None:
+            return random.uniform(0, backoff)
+
+        return server_delay + random.uniform(0, cls._base_delay)
+
+    @classmethod
+    def _get_server_delay(cls, response: httpx.Response) -> Optional[float]:
+        headers = response.headers
+
+        retry_after_ms = cls._parse_float(headers.get("retry-after-ms"))
+        if retry_after_ms is not None:
+            return retry_after_ms / 1000
+
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            seconds = cls._parse_float(retry_after)
+            if seconds is not None:
+                return seconds
+            try:
+                return max(
+                    parsedate_to_datetime(retry_after).timestamp() - time.time(), 0
+                )
+            except (TypeError, ValueError):
+                pass
+
+        resets = [
+            cls._parse_duration(headers.get(reset_header))
+            for remaining_header, reset_header in cls._RESET_HEADERS
+            if headers.get(remaining_header) == "0"
+        ] or [
+            cls._parse_duration(headers.get(reset_header))
+            for _, reset_header in cls._RESET_HEADERS
+        ]
+        resets = [reset for reset in resets if reset is not None]
+
+        return max(resets) if resets else None
+
+    @classmethod
+    def _parse_duration(cls, value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+
+        seconds = cls._parse_float(value)
+        if seconds is not None:
+            return seconds
+
+        matches = cls._DURATION_PATTERN.findall(value)
+        if not matches:
+            return None
+
+        return sum(
+            float(amount) * cls._DURATION_UNITS[unit] for amount, unit in matches
+        )
+
+    @classmethod
+    def _parse_float(cls, value: Optional[str]) -> Optional[float]:
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+    @classmethod
+    def _clip(cls, timeout: Optional[float], remaining: float) -> float:
+        return min(timeout, remaining) if timeout is not None else remaining
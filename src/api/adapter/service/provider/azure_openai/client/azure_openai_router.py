@@ -0,0 +1,113 @@
+import os
+from typing import Dict, List, Optional
+
+from src.api.adapter.service.provider.azure_openai.domain.azure_openai import (
+    AzureOpenAIDeployment,
+)
+from src.api.adapter.http.v1.payload.response.deployment_route_response import (
+    DeploymentRouteResponse,
+)
+
+
+class DeploymentStats:
+    def __init__(self, deployment: AzureOpenAIDeployment) -> None:
+        self.name = deployment.name
+        self.model = deployment.model
+        self.region = deployment.region
+        self.latency_ms: Optional[float] = None
+        self.error_rate = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+
+
+class AzureOpenAIRouter:
+    _stats: Dict[str, DeploymentStats] = {}
+    _alpha: float = float(os.getenv("AZURE_OPENAI_ROUTER_EWMA_ALPHA", "0.3"))
+    _max_error_rate: float = 0.95
+
+    @classmethod
+    def rank(
+        cls, deployments: List[AzureOpenAIDeployment]
+    ) -> List[AzureOpenAIDeployment]:
+        if len(deployments) < 2:
+            return deployments
+
+        stats = [cls._get_stats(deployment) for deployment in deployments]
+        known_latencies = [
+            item.latency_ms for item in stats if item.latency_ms is not None
+        ]
+        default_latency = min(known_latencies) if known_latencies else 1.0
+
+        scores = {
+            item.name: cls._score(item, default_latency=default_latency)
+            for item in stats
+        }
+        return sorted(deployments, key=lambda deployment: scores[deployment.name])
+
+    @classmethod
+    def start(cls, deployment: AzureOpenAIDeployment) -> None:
+        stats = cls._get_stats(deployment)
+        stats.in_flight += 1
+        stats.requests += 1
+
+    @classmethod
+    def finish(
+        cls,
+        deployment: AzureOpenAIDeployment,
+        latency_ms: Optional[float],
+        failed: bool = False,
+    ) -> None:
+        stats = cls._get_stats(deployment)
+        stats.in_flight = max(stats.in_flight - 1, 0)
+
+        if failed:
+            stats.errors += 1
+            stats.error_rate = cls._ewma(stats.error_rate, 1.0)
+            return
+
+        if latency_ms is None:
+            return
+
+        stats.error_rate = cls._ewma(stats.error_rate, 0.0)
+        stats.latency_ms = (
+            latency_ms
+            if stats.latency_ms is None
+            else cls._ewma(stats.latency_ms, latency_ms)
+        )
+
+    @classmethod
+    def get_stats(cls) -> List[DeploymentRouteResponse]:
+        return [
+            DeploymentRouteResponse(
+                name=stats.name,
+                model=stats.model,
+                region=stats.region,
+                latency_ms=(
+                    round(stats.latency_ms, 2) if stats.latency_ms is not None else None
+                ),
+                error_rate=round(stats.error_rate, 4),
+                in_flight=stats.in_flight,
+                requests=stats.requests,
+                errors=stats.errors,
+            )
+            for stats in cls._stats.values()
+        ]
+
+    @classmethod
+    def _get_stats(cls, deployment: AzureOpenAIDeployment) -> DeploymentStats:
+        stats = cls._stats.get(deployment.name)
+        if stats is None:
+            stats = DeploymentStats(deployment)
+            cls._stats[deployment.name] = stats
+        return stats
+
+    @classmethod
+    def _score(cls, stats: DeploymentStats, default_latency: float) -> float:
+        latency = stats.latency_ms if stats.latency_ms is not None else default_latency
+        error_rate = min(stats.error_rate, cls._max_error_rate)
+        return latency * (stats.in_flight + 1) / (1.0 - error_rate)
+
+    @classmethod
+    def _ewma(cls, current: float, value: float) -> float:
+        return cls._alpha * value + (1.0 - cls._alpha) * current
@@ -0,0 +1,186 @@
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from typing import Dict, List, Optional
+
+from src.api.adapter.service.provider.azure_openai.domain.azure_openai import (
+    AzureOpenAIDeployment,
+)
+from src.api.adapter.http.v1.payload.response.scheduler_response import (
+    SchedulerResponse,
+)
+
+
+def _parse_weights(value: str) -> Dict[str, float]:
+    weights = {}
+    for item in value.split(","):
+        key, _, weight = item.partition(":")
+        if key.strip() and weight.strip():
+            weights[key.strip()] = max(float(weight), 0.001)
+    return weights
+
+
+class ClientQueue:
+    def __init__(self) -> None:
+        self.finish_tag = 0.0
+        self.queued = 0
+        self.served = 0
+        self.waited = 0
+        self.wait_ms_total = 0.0
+        self.max_wait_ms = 0.0
+
+
+class DeploymentQueue:
+    def __init__(self, max_concurrency: int) -> None:
+        self.max_concurrency = max_concurrency
+        self.adaptive_limit: Optional[int] = None
+        self.in_flight = 0
+        self.virtual_time = 0.0
+        self.waiters: List[tuple] = []
+        self.clients: Dict[str, ClientQueue] = {}
+        self.sequence = itertools.count()
+
+    def get_limit(self) -> int:
+        limits = [
+            limit for limit in (self.max_concurrency, self.adaptive_limit) if limit
+        ]
+        return min(limits) if limits else 0
+
+    def has_capacity(self) -> bool:
+        limit = self.get_limit()
+        return not limit or self.in_flight < limit
+
+
+class AzureOpenAIScheduler:
+    _ANONYMOUS_CLIENT = "anonymous"
+
+    _queues: Dict[str, DeploymentQueue] = {}
+    _max_concurrency: int = int(os.getenv("SCHEDULER_MAX_CONCURRENCY", "0"))
+    _max_queue: float = float(os.getenv("SCHEDULER_MAX_QUEUE_MS", "30000")) / 1000
+    _default_priority: str = os.getenv("SCHEDULER_DEFAULT_PRIORITY", "interactive")
+    _priority_weights: Dict[str, float] = _parse_weights(
+        os.getenv("SCHEDULER_PRIORITY_WEIGHTS", "interactive:4,bulk:1")
+    )
+    _client_weights: Dict[str, float] = _parse_weights(
+        os.getenv("SCHEDULER_CLIENT_WEIGHTS", "")
+    )
+
+    @classmethod
+    async def acquire(
+        cls,
+        deployment: AzureOpenAIDeployment,
+        client_id: Optional[str],
+        priority: Optional[str],
+        timeout: float,
+    ) -> bool:
+        queue = cls._get_queue(deployment)
+        client_id = client_id or cls._ANONYMOUS_CLIENT
+        client = queue.clients.setdefault(client_id, ClientQueue())
+
+        if queue.has_capacity() and not queue.waiters:
+            queue.in_flight += 1
+            client.served += 1
+            return True
+
+        start_tag = max(queue.virtual_time, client.finish_tag)
+        client.finish_tag = start_tag + 1 / cls._get_weight(client_id, priority)
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            queue.waiters,
+            (client.finish_tag, next(queue.sequence), start_tag, client, future),
+        )
+        client.queued += 1
+        started_at = time.monotonic()
+
+        try:
+            await asyncio.wait_for(future, timeout=min(timeout, cls._max_queue))
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                cls.release(deployment)
+            else:
+                client.queued -= 1
+            return False
+        except BaseException:
+            if future.done() and not future.cancelled():
+                cls.release(deployment)
+            else:
+                client.queued -= 1
+            raise
+
+        wait_ms = (time.monotonic() - started_at) * 1000
+        client.waited += 1
+        client.wait_ms_total += wait_ms
+        client.max_wait_ms = max(client.max_wait_ms, wait_ms)
+        return True
+
+    @classmethod
+    def release(cls, deployment: AzureOpenAIDeployment) -> None:
+        queue = cls._get_queue(deployment)
+        queue.in_flight -= 1
+        cls._dispatch(queue)
+
+    @classmethod
+    def set_adaptive_limit(cls, deployment: AzureOpenAIDeployment, limit: int) -> None:
+        queue = cls._get_queue(deployment)
+        queue.adaptive_limit = limit
+        cls._dispatch(queue)
+
+    @classmethod
+    def get_in_flight(cls, deployment: AzureOpenAIDeployment) -> int:
+        return cls._get_queue(deployment).in_flight
+
+    @classmethod
+    def get_stats(cls) -> List[SchedulerResponse]:
+        return [
+            SchedulerResponse(
+                deployment=name,
+                client_id=client_id,
+                max_concurrency=queue.max_concurrency or None,
+                in_flight=queue.in_flight,
+                queued=client.queued,
+                served=client.served,
+                avg_wait_ms=(
+                    round(client.wait_ms_total / client.waited, 2)
+                    if client.waited
+                    else 0.0
+                ),
+                max_wait_ms=round(client.max_wait_ms, 2),
+            )
+            for name, queue in cls._queues.items()
+            for client_id, client in queue.clients.items()
+        ]
+
+    @classmethod
+    def _dispatch(cls, queue: DeploymentQueue) -> None:
+        while queue.waiters and queue.has_capacity():
+            _, _, start_tag, client, future = heapq.heappop(queue.waiters)
+            if future.done():
+                continue
+
+            queue.virtual_time = max(queue.virtual_time, start_tag)
+            queue.in_flight += 1
+            client.queued -= 1
+            client.served += 1
+            future.set_result(None)
+
+    @classmethod
+    def _get_weight(cls, client_id: str, priority: Optional[str]) -> float:
+        priority_weight = cls._priority_weights.get(
+            priority or cls._default_priority,
+            cls._priority_weights.get(cls._default_priority, 1.0),
+        )
+        return cls._client_weights.get(client_id, 1.0) * priority_weight
+
+    @classmethod
+    def _get_queue(cls, deployment: AzureOpenAIDeployment) -> DeploymentQueue:
+        queue = cls._queues.get(deployment.name)
+        if queue is None:
+            queue = DeploymentQueue(
+                deployment.max_concurrency
+                if deployment.max_concurrency is not None
+                else cls._max_concurrency
+            )
+            cls._queues[deployment.name] = queue
+        return queue
@@ -0,0 +1,46 @@
+from typing import Any, AsyncIterator, Callable, Optional
+
+from openai import AsyncStream
+
+
+class AzureOpenAIStream:
+    def __init__(
+        self,
+        stream: AsyncStream,
+        on_close: Callable[[bool, Optional[BaseException], Any], None],
+    ) -> None:
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+        self.usage = None
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+
+    async def close(self) -> None:
+        try:
+            await self._stream.close()
+        finally:
+            self._finish(completed=False, exception=None)
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        try:
+            async for chunk in self._stream:
+                if getattr(chunk, "usage", None) is not None:
+                    self.usage = chunk.usage
+                yield chunk
+        except Exception as exception:
+            self._finish(completed=False, exception=exception)
+            raise
+        except BaseException:
+            self._finish(completed=False, exception=None)
+            raise
+
+        self._finish(completed=True, exception=None)
+
+    def _finish(self, completed: bool, exception: Optional[BaseException]) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._on_close(completed, exception, self.usage)
@@ -1,4 +1,6 @@
 import httpx
+from typing import Any, Optional
+from openai import AsyncAzureOpenAI
 from pydantic import BaseModel, ConfigDict
 
 
@@ -7,9 +9,36 @@ class AzureOpenAIConnection(BaseModel):
     api_key: str
     api_version: str
     azure_deployment: str
-    http_client: httpx.Client
+    http_client: httpx.AsyncClient
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         extra="forbid",
     )
+
+
+class AzureOpenAIDeployment(BaseModel):
+    name: str
+    model: str
+    region: str
+    client: AsyncAzureOpenAI
+    tokens_per_minute: Optional[int] = None
+    requests_per_minute: Optional[int] = None
+    max_concurrency: Optional[int] = None
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        frozen=True,
+    )
+
+
+class AzureOpenAIHedgeResult(BaseModel):
+    result: Any
+    hedged: bool
+    winner: str
+
+
+class AzureOpenAIFallbackResult(BaseModel):
+    result: Any
+    model: str
+    fallback: bool
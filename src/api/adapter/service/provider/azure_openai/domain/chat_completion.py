@@ -108,6 +108,7 @@ class ChatCompletion(BaseModel):
     )
     stream: Optional[bool] = None
     stream_options: Optional[dict] = None
+    prompt_tokens: Optional[int] = Field(None, exclude=True)
 
     @field_validator("temperature", "top_p")
     def check_probability(cls, value, ctx):
@@ -1,7 +1,8 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
 
 class Embedding(BaseModel):
     input: List[str]
     model: str
+    input_tokens: Optional[int] = Field(None, exclude=True)
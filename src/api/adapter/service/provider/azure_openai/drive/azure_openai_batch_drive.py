@@ -33,21 +33,23 @@ class AzureOpenAIBatchDrive(BatchPort):
     def __init__(self, client: "AzureOpenAIClient"):
         self.client = client
 
-    def generate(self, batch_request: BatchRequest) -> BatchResponse:
+    async def generate(self, batch_request: BatchRequest) -> BatchResponse:
         batch = Batch(
             input_file_id=batch_request.file.id,
             endpoint=batch_request.endpoint.name,
             model=batch_request.provider.model.name,
             completion_window=batch_request.completion_window.name.value,
         )
-        return self.__build_batch_response(
-            model_name=batch.model, response=self.client.batch(batch)
+        return await self.__build_batch_response(
+            model_name=batch.model, response=await self.client.batch(batch)
         )
 
-    def get(self, model_name: str, batch_id: str) -> BatchResponse:
-        return self.__build_batch_response(
+    async def get(self, model_name: str, batch_id: str) -> BatchResponse:
+        return await self.__build_batch_response(
             model_name=model_name,
-            response=self.client.get_batch(model_name=model_name, batch_id=batch_id),
+            response=await self.client.get_batch(
+                model_name=model_name, batch_id=batch_id
+            ),
         )
 
     def __build_batch_result_response(self, file: str):
@@ -74,8 +76,8 @@ class AzureOpenAIBatchDrive(BatchPort):
                 exception=error, message="Error serializing the file result."
             )
 
-    def __get_content(self, model_name: str, file_id: str) -> str:
-        return self.client.get_file_content(model_name, file_id).text
+    async def __get_content(self, model_name: str, file_id: str) -> str:
+        return (await self.client.get_file_content(model_name, file_id)).text
 
     def __parse_and_sort_responses(self, file: str) -> List[Dict]:
         return sorted(
@@ -133,11 +135,11 @@ class AzureOpenAIBatchDrive(BatchPort):
             for err in errors.data
         ]
 
-    def __build_batch_response(self, model_name: str, response) -> BatchResponse:
+    async def __build_batch_response(self, model_name: str, response) -> BatchResponse:
 
         result, usage_tokens = (
             self.__build_batch_result_response(
-                self.__get_content(model_name, response.output_file_id)
+                await self.__get_content(model_name, response.output_file_id)
             )
             if response.status == "completed"
             else (None, None)
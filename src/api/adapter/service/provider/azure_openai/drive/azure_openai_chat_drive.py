@@ -1,5 +1,7 @@
+import asyncio
 import json
-from typing import AsyncGenerator, Optional
+import os
+from typing import AsyncGenerator, List, Optional, Tuple
 from src.api.adapter.service.provider.port.chat_port import ChatPort
 from src.api.adapter.http.v1.payload.request.chat_request import (
     Message as MessageRequest,
@@ -11,8 +13,10 @@ from src.api.adapter.http.v1.payload.response.chat_response import (
     Tool as ToolResponse,
     Message,
     MessageStreamResponse,
+    Truncation,
     Usage,
 )
+from src.api.adapter.http.v1.payload.response.cost_response import Hedge
 from src.api.adapter.service.provider.azure_openai.domain.chat_completion import (
     ChatCompletion,
     Tool as ToolRequest,
@@ -30,17 +34,28 @@ from src.api.adapter.http.v1.payload.response.guardrail_response import (
 from src.api.adapter.service.provider.azure_openai.client.azure_openai_client import (
     AzureOpenAIClient,
 )
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_fallback import (
+    AzureOpenAIFallback,
+)
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_hedge import (
+    AzureOpenAIHedge,
+)
+from src.api.adapter.cache.response.chat_response_cache import ChatResponseCache
+from src.api.adapter.cache.simple.provider_cache import ProviderCache
 
 from src.api.core.cost.cost_client import CostClient, CostType
 
 
 class AzureOpenAIChatDrive(ChatPort):
 
+    _STREAM_END = object()
+
     def __init__(self, client: AzureOpenAIClient):
         self.client = client
         self.cost_client = CostClient()
+        self._stream_buffer_size = int(os.getenv("CHAT_STREAM_BUFFER_SIZE", "32"))
 
-    def generate(self, chat_request: ChatRequest) -> ChatResponse:
+    async def generate(self, chat_request: ChatRequest) -> ChatResponse:
         chat_completion = ChatCompletion(
             model=chat_request.provider.model.name,
             messages=[
@@ -51,12 +66,35 @@ class AzureOpenAIChatDrive(ChatPort):
                 if chat_request.prompt.parameter.json_mode
                 else {"type": "text"}
             ),
+            prompt_tokens=chat_request.prompt_tokens,
         )
         self._set_parameters(chat_request=chat_request, chat_completion=chat_completion)
 
         self._set_tools(chat_request=chat_request, chat_completion=chat_completion)
 
-        response = self.client.chat_completion(chat_completion)
+        cache_key = ChatResponseCache.get_key(chat_completion)
+        cached_response = await ChatResponseCache.get(cache_key)
+        if cached_response is not None:
+            chat_response = self.__cached_response(
+                model_name=chat_request.provider.model.name,
+                chat_response=cached_response,
+            )
+            chat_response.truncation = self.__get_truncation(chat_request)
+            return chat_response
+
+        models, max_wait_ms = self.__get_fallback(chat_request)
+        fallback_result = await AzureOpenAIFallback.execute(
+            models=models,
+            max_wait_ms=max_wait_ms,
+            operation=lambda model_name: self.__complete(
+                chat_request=chat_request,
+                chat_completion=chat_completion.model_copy(
+                    update={"model": model_name}
+                ),
+            ),
+        )
+        hedge_result = fallback_result.result if chat_request.hedge else None
+        response = hedge_result.result if hedge_result else fallback_result.result
         chat_response = (
             self._response_message_with_tools(
                 response=response, tool_calls=response.choices[0].message.tool_calls
@@ -65,11 +103,95 @@ class AzureOpenAIChatDrive(ChatPort):
             else self.__response_message(response)
         )
 
+        chat_response.model = fallback_result.model
+        chat_response.cost = self.cost_client.add(
+            model_name=fallback_result.model,
+            usage=chat_response.usage,
+            cost_type=CostType.TEXT,
+        )
+
+        if not fallback_result.fallback:
+            await ChatResponseCache.set(cache_key, chat_response)
+
+        chat_response.truncation = self.__get_truncation(chat_request)
+
+        if hedge_result and hedge_result.hedged and chat_response.cost:
+            chat_response.cost.hedge = Hedge(
+                requests=2,
+                winner=hedge_result.winner,
+                estimated_extra_total=(
+                    chat_response.cost.token.total if chat_response.cost.token else None
+                ),
+            )
+
+        return chat_response
+
+    async def __complete(
+        self, chat_request: ChatRequest, chat_completion: ChatCompletion
+    ):
+        if chat_request.hedge:
+            return await AzureOpenAIHedge.execute(
+                model_name=chat_completion.model,
+                operation=lambda: self.client.chat_completion(chat_completion),
+            )
+        return await AzureOpenAIHedge.observe(
+            model_name=chat_completion.model,
+            operation=lambda: self.client.chat_completion(chat_completion),
+        )
+
+    def __get_fallback(
+        self, chat_request: ChatRequest
+    ) -> Tuple[List[str], Optional[int]]:
+        model_name = chat_request.provider.model.name
+        model = ProviderCache.get_provider_model(model_name)
+
+        if (
+            chat_request.fallback is None
+            or not chat_request.fallback.enabled
+            or model is None
+            or model.fallback is None
+        ):
+            return [model_name], None
+
+        max_tokens = (
+            chat_request.prompt.parameter.max_tokens
+            if chat_request.prompt.parameter is not None
+            else None
+        )
+        tokens = (chat_request.prompt_tokens or 0) + (max_tokens or 0)
+        return [
+            model_name,
+            *[
+                fallback_model
+                for fallback_model in model.fallback.models
+                if self.__fits_context_window(fallback_model, tokens)
+            ],
+        ], (chat_request.fallback.max_wait_ms or model.fallback.max_wait_ms)
+
+    def __fits_context_window(self, model_name: str, tokens: int) -> bool:
+        context_window = ProviderCache.get_context_window_for_model(model_name)
+        return not context_window or tokens <= context_window
+
+    def __get_truncation(self, chat_request: ChatRequest) -> Optional[Truncation]:
+        if chat_request.dropped_messages is None:
+            return None
+
+        return Truncation(
+            droppedMessages=chat_request.dropped_messages,
+            promptTokens=chat_request.prompt_tokens,
+        )
+
+    def __cached_response(
+        self, model_name: str, chat_response: ChatResponse
+    ) -> ChatResponse:
+        chat_response.usage.cached = True
         chat_response.cost = self.cost_client.add(
-            model_name=chat_request.provider.model.name,
+            model_name=model_name,
             usage=chat_response.usage,
             cost_type=CostType.TEXT,
         )
+        if chat_response.cost:
+            chat_response.cost.cached = True
 
         return chat_response
 
@@ -85,19 +207,68 @@ class AzureOpenAIChatDrive(ChatPort):
             stream=True,
             n=1,
             stream_options={"include_usage": True},
+            prompt_tokens=chat_request.prompt_tokens,
         )
 
         self._set_parameters(chat_request=chat_request, chat_completion=chat_completion)
 
-        stream = self.client.chat_completion(chat_completion)
-
-        for chunk in stream:
-            response = await self.__extract_response_from_chunk(
-                chat_request.provider.model.name, chunk
+        models, max_wait_ms = self.__get_fallback(chat_request)
+        fallback_result = await AzureOpenAIFallback.execute(
+            models=models,
+            max_wait_ms=max_wait_ms,
+            operation=lambda model_name: self.client.chat_completion(
+                chat_completion.model_copy(update={"model": model_name})
+            ),
+        )
+        stream = fallback_result.result
+
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=self._stream_buffer_size)
+        producer = asyncio.create_task(
+            self.__produce_stream(
+                model=fallback_result.model,
+                truncation=self.__get_truncation(chat_request),
+                stream=stream,
+                buffer=buffer,
             )
+        )
+
+        try:
+            while True:
+                item = await buffer.get()
+
+                if item is self._STREAM_END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
 
-            if response is not None:
-                yield response.model_dump_json(exclude_none=True)
+                yield item
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            await stream.close()
+
+    async def __produce_stream(
+        self,
+        model: str,
+        truncation: Optional[Truncation],
+        stream,
+        buffer: asyncio.Queue,
+    ):
+        try:
+            async for chunk in stream:
+                response = await self.__extract_response_from_chunk(model, chunk)
+
+                if response is not None and response.usage is not None:
+                    response.truncation = truncation
+
+                if response is not None:
+                    await buffer.put(response.model_dump_json(exclude_none=True))
+
+            await buffer.put(self._STREAM_END)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            await buffer.put(exception)
 
     def _set_parameters(
         self, chat_request: ChatRequest, chat_completion: ChatCompletion
@@ -308,6 +479,7 @@ class AzureOpenAIChatDrive(ChatPort):
             chat_stream_response = await self.__response_chat_stream_message(
                 usage=chunk.usage
             )
+            chat_stream_response.model = model
             chat_stream_response.cost = self.cost_client.add(
                 model_name=model,
                 usage=chat_stream_response.usage,
@@ -54,30 +54,30 @@ class AzureOpenAIDrive:
         self.file_drive = AzureOpenAIFileDrive(self.client)
         self.batch_drive = AzureOpenAIBatchDrive(self.client)
 
-    def generate_text(self, chat_request: ChatRequest) -> ChatResponse:
-        return self.chat_drive.generate(chat_request)
+    async def generate_text(self, chat_request: ChatRequest) -> ChatResponse:
+        return await self.chat_drive.generate(chat_request)
 
     def generate_text_stream(
         self, chat_request: ChatRequest
     ) -> AsyncGenerator[ChatStreamResponse, None]:
         return self.chat_drive.generate_stream(chat_request)
 
-    def generate_image(self, image_request: ImageRequest) -> ImageResponse:
-        return self.image_drive.generate(image_request)
+    async def generate_image(self, image_request: ImageRequest) -> ImageResponse:
+        return await self.image_drive.generate(image_request)
 
-    def generate_embedding(
+    async def generate_embedding(
         self, embedding_request: EmbeddingRequest
     ) -> EmbeddingResponse:
-        return self.embedding_drive.generate(embedding_request)
+        return await self.embedding_drive.generate(embedding_request)
 
-    def generate_file(self, file_object: File) -> FileResponse:
-        return self.file_drive.generate(file_object)
+    async def generate_file(self, file_object: File) -> FileResponse:
+        return await self.file_drive.generate(file_object)
 
-    def generate_batch(self, batch_request: BatchRequest) -> BatchResponse:
-        return self.batch_drive.generate(batch_request)
+    async def generate_batch(self, batch_request: BatchRequest) -> BatchResponse:
+        return await self.batch_drive.generate(batch_request)
 
-    def get_file(self, model_name: str, file_id: File) -> FileResponse:
-        return self.file_drive.get(model_name, file_id)
+    async def get_file(self, model_name: str, file_id: File) -> FileResponse:
+        return await self.file_drive.get(model_name, file_id)
 
-    def get_batch(self, model_name: str, batch_id: str) -> BatchResponse:
-        return self.batch_drive.get(model_name, batch_id)
+    async def get_batch(self, model_name: str, batch_id: str) -> BatchResponse:
+        return await self.batch_drive.get(model_name, batch_id)
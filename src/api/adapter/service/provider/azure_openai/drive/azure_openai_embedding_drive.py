@@ -1,8 +1,10 @@
 from src.api.adapter.service.provider.port.embedding_port import EmbeddingPort
-from src.api.adapter.service.provider.azure_openai.domain.embedding import Embedding
 from src.api.adapter.service.provider.azure_openai.client.azure_openai_client import (
     AzureOpenAIClient,
 )
+from src.api.adapter.service.provider.azure_openai.client.azure_openai_embedding_batcher import (
+    AzureOpenAIEmbeddingBatcher,
+)
 
 from src.api.adapter.http.v1.payload.response.embedding_response import (
     EmbeddingResponse,
@@ -13,16 +15,17 @@ from src.api.adapter.http.v1.payload.request.embedding_request import EmbeddingR
 class AzureOpenAIEmbeddingDrive(EmbeddingPort):
     def __init__(self, client: "AzureOpenAIClient"):
         self.client = client
+        self.batcher = AzureOpenAIEmbeddingBatcher(client)
 
-    def generate(self, embedding_request: EmbeddingRequest) -> EmbeddingResponse:
+    async def generate(self, embedding_request: EmbeddingRequest) -> EmbeddingResponse:
         # FIXME check if the input is text, image or another type
-        embedding = Embedding(
-            input=embedding_request.content.texts,
-            model=embedding_request.provider.model.name,
+        vectors, usage = await self.batcher.embed(
+            model_name=embedding_request.provider.model.name,
+            texts=embedding_request.content.texts,
+            token_counts=embedding_request.token_counts,
         )
-        response = self.client.embedding(embedding)
 
         return EmbeddingResponse(
-            data=[data.embedding for data in response.data],
-            usage=response.usage,
+            data=vectors,
+            usage=usage,
         )
@@ -20,17 +20,17 @@ class AzureOpenAIFileDrive(FilePort):
     def __init__(self, client: "AzureOpenAIClient"):
         self.client = client
 
-    def generate(self, file_object: File) -> FileResponse:
+    async def generate(self, file_object: File) -> FileResponse:
         new_file = AzureFile(
             file=file_object.file_path,
             purpose=file_object.purpose.name.value,
             model=file_object.provider.models[0].name,
         )
-        return self.__build_file_response(self.client.create_file(new_file))
+        return self.__build_file_response(await self.client.create_file(new_file))
 
-    def get(self, model_name: str, file_id: str) -> FileResponse:
+    async def get(self, model_name: str, file_id: str) -> FileResponse:
         return self.__build_file_response(
-            response=self.client.get_file(model_name, file_id)
+            response=await self.client.get_file(model_name, file_id)
         )
 
     def __build_file_response(self, response) -> FileResponse:
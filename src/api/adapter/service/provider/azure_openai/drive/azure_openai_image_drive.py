@@ -18,7 +18,7 @@ class AzureOpenAIImageDrive(ImagePort):
     def __init__(self, client: AzureOpenAIClient):
         self.client = client
 
-    def generate(self, image_request: ImageRequest) -> ImageResponse:
+    async def generate(self, image_request: ImageRequest) -> ImageResponse:
         image_generate = ImageGenerate(
             prompt=image_request.prompt.message,
             model=image_request.provider.model.name,
@@ -29,7 +29,7 @@ class AzureOpenAIImageDrive(ImagePort):
             style=image_request.prompt.parameter.style,
         )
 
-        response = self.client.image_generate(image_generate)
+        response = await self.client.image_generate(image_generate)
 
         images = []
 
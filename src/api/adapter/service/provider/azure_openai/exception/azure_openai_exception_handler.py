@@ -1,6 +1,6 @@
 import openai
 from typing import Optional
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI
 from src.api.adapter.service.provider.azure_openai.log.azure_openai_logger import (
     AzureOpenAILogger,
 )
@@ -21,7 +21,7 @@ class AzureOpenAIExceptionHandler:
         self,
         exception: Exception,
         model_name: str,
-        azure_openai: AzureOpenAI,
+        azure_openai: AsyncAzureOpenAI,
         status_code: int,
         start_time: float,
         message: Optional[str] = None,
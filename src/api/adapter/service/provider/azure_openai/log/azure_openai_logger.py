@@ -2,7 +2,7 @@ import os
 import time
 from typing import Optional
 from datetime import datetime
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI
 from src.api.core.log.config.log_config import LogConfig
 from src.api.adapter.http.v1.middleware.header_middleware import (
     get_correlation_id,
@@ -26,7 +26,7 @@ class AzureOpenAILogger:
     def log(
         self,
         model_name: str,
-        azure_openai: AzureOpenAI,
+        azure_openai: AsyncAzureOpenAI,
         status_code: int,
         start_time: time,
         exception: Optional[Exception] = None,
@@ -0,0 +1,107 @@
+import importlib.util
+import os
+from typing import Dict, List
+from urllib.parse import urlparse
+
+import httpx
+
+from src.api.adapter.http.v1.payload.response.connection_pool_response import (
+    ConnectionPoolResponse,
+)
+
+
+class HttpClientPool:
+    _clients: Dict[str, httpx.AsyncClient] = {}
+
+    @classmethod
+    def get_client(cls, endpoint: str) -> httpx.AsyncClient:
+        key = cls._get_key(endpoint)
+        client = cls._clients.get(key)
+
+        if client is None or client.is_closed:
+            client = cls._build_client()
+            cls._clients[key] = client
+
+        return client
+
+    @classmethod
+    def get_stats(cls) -> List[ConnectionPoolResponse]:
+        return [
+            cls._build_stats(key=key, client=client)
+            for key, client in cls._clients.items()
+        ]
+
+    @classmethod
+    async def close(cls) -> None:
+        clients, cls._clients = cls._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    @classmethod
+    def _get_key(cls, endpoint: str) -> str:
+        parsed_endpoint = urlparse(endpoint or "")
+        return parsed_endpoint.netloc or endpoint or "default"
+
+    @classmethod
+    def _build_client(cls) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            verify=os.getenv("HTTPX_CLIENT_VERIFY", "False") == "True",
+            http2=cls._is_http2_enabled(),
+            limits=cls._get_limits(),
+            timeout=httpx.Timeout(
+                connect=float(os.getenv("HTTPX_CONNECT_TIMEOUT", "5")),
+                read=float(os.getenv("HTTPX_READ_TIMEOUT", "120")),
+                write=float(os.getenv("HTTPX_WRITE_TIMEOUT", "30")),
+                pool=float(os.getenv("HTTPX_POOL_TIMEOUT", "10")),
+            ),
+        )
+
+    @classmethod
+    def _get_limits(cls) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=int(os.getenv("HTTPX_MAX_CONNECTIONS", "200")),
+            max_keepalive_connections=int(
+                os.getenv("HTTPX_MAX_KEEPALIVE_CONNECTIONS", "50")
+            ),
+            keepalive_expiry=float(os.getenv("HTTPX_KEEPALIVE_EXPIRY", "60")),
+        )
+
+    @classmethod
+    def _is_http2_enabled(cls) -> bool:
+        return (
+            os.getenv("HTTPX_HTTP2", "True") == "True"
+            and importlib.util.find_spec("h2") is not None
+        )
+
+    @classmethod
+    def _build_stats(
+        cls, key: str, client: httpx.AsyncClient
+    ) -> ConnectionPoolResponse:
+        limits = cls._get_limits()
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", None) or [])
+        requests = list(getattr(pool, "_requests", None) or [])
+        idle_connections = len(
+            [
+                connection
+                for connection in connections
+                if getattr(connection, "is_idle", lambda: False)()
+            ]
+        )
+
+        return ConnectionPoolResponse(
+            endpoint=key,
+            http2=cls._is_http2_enabled(),
+            max_connections=limits.max_connections or 0,
+            max_keepalive_connections=limits.max_keepalive_connections or 0,
+            connections=len(connections),
+            active_connections=len(connections) - idle_connections,
+            idle_connections=idle_connections,
+            queued_requests=len(
+                [
+                    request
+                    for request in requests
+                    if getattr(request, "connection", None) is None
+                ]
+            ),
+        )
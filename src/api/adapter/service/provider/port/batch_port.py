@@ -5,9 +5,9 @@ from src.api.adapter.http.v1.payload.response.batch_response import BatchRespons
 
 class BatchPort(ABC):
     @abstractmethod
-    def generate(self, batch_request: BatchRequest) -> BatchResponse:
+    async def generate(self, batch_request: BatchRequest) -> BatchResponse:
         pass
 
     @abstractmethod
-    def get(self, model_name: str, batch_id: str) -> BatchResponse:
+    async def get(self, model_name: str, batch_id: str) -> BatchResponse:
         pass
@@ -5,7 +5,7 @@ from src.api.adapter.http.v1.payload.response.chat_response import ChatResponse
 
 class ChatPort(ABC):
     @abstractmethod
-    def generate(self, chat_request: ChatRequest) -> ChatResponse:
+    async def generate(self, chat_request: ChatRequest) -> ChatResponse:
         pass
 
     @abstractmethod
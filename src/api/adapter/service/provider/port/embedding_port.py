@@ -7,5 +7,5 @@ from src.api.adapter.http.v1.payload.response.embedding_response import (
 
 class EmbeddingPort(ABC):
     @abstractmethod
-    def generate(self, embedding_request: EmbeddingRequest) -> EmbeddingResponse:
+    async def generate(self, embedding_request: EmbeddingRequest) -> EmbeddingResponse:
         pass
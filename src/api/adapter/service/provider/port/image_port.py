@@ -5,5 +5,5 @@ from src.api.adapter.http.v1.payload.response.image_response import ImageRespons
 
 class ImagePort(ABC):
     @abstractmethod
-    def generate(self, image_request: ImageRequest) -> ImageResponse:
+    async def generate(self, image_request: ImageRequest) -> ImageResponse:
         pass
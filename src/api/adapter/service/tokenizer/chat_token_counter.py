@@ -0,0 +1,169 @@
+import base64
+import binascii
+import math
+import struct
+from typing import Optional, Tuple
+
+from src.api.adapter.service.tokenizer.tokenizer_service import TokenizerService
+
+
+class ChatTokenCounter:
+    _MESSAGE_TOKENS = 3
+    _NAME_TOKENS = 1
+    _REPLY_TOKENS = 3
+
+    _IMAGE_BASE_TOKENS = 85
+    _IMAGE_TILE_TOKENS = 170
+    _IMAGE_TILE_SIZE = 512
+    _IMAGE_MAX_SIDE = 2048
+    _IMAGE_SHORT_SIDE = 768
+    _IMAGE_DEFAULT_SIZE = (2048, 2048)
+    _IMAGE_HEADER_BYTES = 30
+
+    _FUNCTION_TOKENS = {"o200k_base": 7}
+    _DEFAULT_FUNCTION_TOKENS = 10
+    _PROPERTIES_TOKENS = 3
+    _PROPERTY_TOKENS = 3
+    _ENUM_TOKENS = -3
+    _ENUM_ITEM_TOKENS = 3
+    _FUNCTIONS_END_TOKENS = 12
+
+    @classmethod
+    def count(cls, model_name: str, messages: list, tools: Optional[list]) -> int:
+        return cls.count_overhead(model_name, tools) + sum(
+            cls.count_message(model_name, message) for message in messages
+        )
+
+    @classmethod
+    def count_overhead(cls, model_name: str, tools: Optional[list]) -> int:
+        return cls._REPLY_TOKENS + (cls._count_tools(model_name, tools) if tools else 0)
+
+    @classmethod
+    def count_message(cls, model_name: str, message) -> int:
+        tokens = cls._MESSAGE_TOKENS + TokenizerService.count(model_name, message.role)
+        tokens += cls._count_content(model_name, message.content)
+
+        if message.tool is not None:
+            tokens += cls._NAME_TOKENS + TokenizerService.count(
+                model_name, message.tool.name
+            )
+            if message.tool.arguments:
+                tokens += TokenizerService.count(model_name, message.tool.arguments)
+
+        return tokens
+
+    @classmethod
+    def _count_content(cls, model_name: str, content) -> int:
+        if isinstance(content, str):
+            return TokenizerService.count(model_name, content)
+
+        tokens = 0
+        for item in content:
+            if item.type == "image_url" and item.image_url is not None:
+                tokens += cls._count_image(item.image_url.url, item.detail)
+            elif item.text:
+                tokens += TokenizerService.count(model_name, item.text)
+        return tokens
+
+    @classmethod
+    def _count_image(cls, url: str, detail: Optional[str]) -> int:
+        if detail == "low":
+            return cls._IMAGE_BASE_TOKENS
+
+        size = cls._get_image_size(url)
+        width, height = size if size and all(size) else cls._IMAGE_DEFAULT_SIZE
+
+        scale = min(1.0, cls._IMAGE_MAX_SIDE / max(width, height))
+        width, height = width * scale, height * scale
+        scale = min(1.0, cls._IMAGE_SHORT_SIDE / min(width, height))
+        width, height = width * scale, height * scale
+
+        tiles = math.ceil(width / cls._IMAGE_TILE_SIZE) * math.ceil(
+            height / cls._IMAGE_TILE_SIZE
+        )
+        return cls._IMAGE_BASE_TOKENS + cls._IMAGE_TILE_TOKENS * tiles
+
+    @classmethod
+    def _count_tools(cls, model_name: str, tools: list) -> int:
+        encoding = TokenizerService.get_encoding(model_name)
+        function_tokens = cls._FUNCTION_TOKENS.get(
+            encoding.name if encoding else None, cls._DEFAULT_FUNCTION_TOKENS
+        )
+        tokens = 0
+
+        for tool in tools:
+            tokens += function_tokens + TokenizerService.count(
+                model_name, f"{tool.name}:{tool.description.rstrip('.')}"
+            )
+            if tool.parameters is None or not tool.parameters.properties:
+                continue
+
+            tokens += cls._PROPERTIES_TOKENS
+            for key, prop in tool.parameters.properties.items():
+                tokens += cls._PROPERTY_TOKENS
+                if prop.enum:
+                    tokens += cls._ENUM_TOKENS
+                    for item in prop.enum:
+                        tokens += cls._ENUM_ITEM_TOKENS + TokenizerService.count(
+                            model_name, str(item)
+                        )
+                tokens += TokenizerService.count(
+                    model_name,
+                    f"{key}:{prop.type}:{(prop.description or '').rstrip('.')}",
+                )
+
+        return tokens + cls._FUNCTIONS_END_TOKENS
+
+    @classmethod
+    def _get_image_size(cls, url: str) -> Optional[Tuple[int, int]]:
+        try:
+            header = cls._read_base64(url, 0, cls._IMAGE_HEADER_BYTES)
+            if header.startswith(b"\x89PNG"):
+                return struct.unpack(">II", header[16:24])
+            if header.startswith(b"GIF8"):
+                return struct.unpack("<HH", header[6:10])
+            if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+                return cls._get_webp_size(header)
+            if header.startswith(b"\xff\xd8"):
+                return cls._get_jpeg_size(url)
+        except (binascii.Error, ValueError, struct.error):
+            return None
+        return None
+
+    @classmethod
+    def _read_base64(cls, url: str, start: int, length: int) -> bytes:
+        first_block = start // 3
+        last_block = (start + length + 2) // 3
+        data = base64.b64decode(url[first_block * 4 : last_block * 4], validate=True)
+        offset = start - first_block * 3
+        return data[offset : offset + length]
+
+    @classmethod
+    def _get_webp_size(cls, data: bytes) -> Optional[Tuple[int, int]]:
+        chunk = data[12:16]
+        if chunk == b"VP8X":
+            return (
+                int.from_bytes(data[24:27], "little") + 1,
+                int.from_bytes(data[27:30], "little") + 1,
+            )
+        if chunk == b"VP8 ":
+            width, height = struct.unpack("<HH", data[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b"VP8L":
+            bits = int.from_bytes(data[21:25], "little")
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        return None
+
+    @classmethod
+    def _get_jpeg_size(cls, url: str) -> Optional[Tuple[int, int]]:
+        offset = 2
+        while True:
+            segment = cls._read_base64(url, offset, 9)
+            if len(segment) < 9 or segment[0] != 0xFF:
+                return None
+            marker = segment[1]
+            length = struct.unpack(">H", segment[2:4])[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", segment[5:9])
+                return width, height
+            offset += 2 + length
@@ -0,0 +1,64 @@
+from typing import List, Optional, Tuple
+
+from src.api.adapter.constant.chat_completion import MessageRole
+from src.api.adapter.service.tokenizer.chat_token_counter import ChatTokenCounter
+
+
+class PromptTruncation:
+    @classmethod
+    def truncate(
+        cls,
+        model_name: str,
+        messages: list,
+        tools: Optional[list],
+        max_prompt_tokens: int,
+        max_tool_output_tokens: Optional[int] = None,
+    ) -> Tuple[list, List[int], int]:
+        counts = [
+            ChatTokenCounter.count_message(model_name, message) for message in messages
+        ]
+        dropped = set()
+
+        if max_tool_output_tokens is not None:
+            dropped.update(
+                index
+                for index, message in enumerate(messages)
+                if message.role == MessageRole.FUNCTION.value
+                and counts[index] > max_tool_output_tokens
+            )
+
+        tokens = ChatTokenCounter.count_overhead(model_name, tools) + sum(
+            counts[index]
+            for index, message in enumerate(messages)
+            if message.role == MessageRole.SYSTEM.value and index not in dropped
+        )
+
+        turns = cls._get_turns(messages)
+        for position, turn in enumerate(reversed(turns)):
+            turn_tokens = sum(counts[index] for index in turn if index not in dropped)
+
+            if position > 0 and tokens + turn_tokens > max_prompt_tokens:
+                for older_turn in turns[: len(turns) - position]:
+                    dropped.update(older_turn)
+                break
+
+            tokens += turn_tokens
+
+        return (
+            [message for index, message in enumerate(messages) if index not in dropped],
+            sorted(dropped),
+            tokens,
+        )
+
+    @classmethod
+    def _get_turns(cls, messages: list) -> List[List[int]]:
+        turns: List[List[int]] = []
+
+        for index, message in enumerate(messages):
+            if message.role == MessageRole.SYSTEM.value:
+                continue
+            if message.role == MessageRole.USER.value or not turns:
+                turns.append([])
+            turns[-1].append(index)
+
+        return turns
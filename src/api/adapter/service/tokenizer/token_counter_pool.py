@@ -0,0 +1,151 @@
+import asyncio
+import json
+import multiprocessing
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from typing import List, Optional
+
+from src.api.adapter.http.v1.payload.request.chat_request import Message
+from src.api.adapter.service.tokenizer.chat_token_counter import ChatTokenCounter
+from src.api.adapter.service.tokenizer.tokenizer_service import TokenizerService
+
+TokenCount = namedtuple(
+    "TokenCount", ["prompt_tokens", "completion_tokens", "custom_id", "error"]
+)
+
+
+class TokenItemType(str, Enum):
+    TEXT = "text"
+    PROMPT = "prompt"
+    JSONL = "jsonl"
+
+
+class TokenCounterPool:
+    _DATA_URL_SEPARATOR = ";base64,"
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _processes: int = int(os.getenv("TOKENIZER_PROCESSES", str(os.cpu_count() or 1)))
+    _chunk_size: int = int(os.getenv("TOKENIZER_PROCESS_CHUNK_SIZE", "2000"))
+    _min_items: int = int(os.getenv("TOKENIZER_PROCESS_MIN_ITEMS", "2000"))
+
+    @classmethod
+    async def count(
+        cls, model_name: str, item_type: TokenItemType, items: list
+    ) -> List[TokenCount]:
+        if cls._processes <= 1 or len(items) < cls._min_items:
+            return await asyncio.to_thread(
+                cls._count_chunk, model_name, item_type, items
+            )
+
+        loop = asyncio.get_running_loop()
+        executor = cls._get_executor()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    cls._count_chunk,
+                    model_name,
+                    item_type,
+                    items[index : index + cls._chunk_size],
+                )
+                for index in range(0, len(items), cls._chunk_size)
+            )
+        )
+        return [count for counts in results for count in counts]
+
+    @classmethod
+    def close(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(cancel_futures=True)
+            cls._executor = None
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor(
+                max_workers=cls._processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return cls._executor
+
+    @classmethod
+    def _count_chunk(
+        cls, model_name: str, item_type: TokenItemType, items: list
+    ) -> List[TokenCount]:
+        if item_type == TokenItemType.TEXT:
+            return [
+                TokenCount(count, None, None, None)
+                for count in TokenizerService.count_many(model_name, items)
+            ]
+        if item_type == TokenItemType.PROMPT:
+            return [cls._count_prompt(model_name, item) for item in items]
+        return [cls._count_line(model_name, item) for item in items]
+
+    @classmethod
+    def _count_prompt(cls, model_name: str, prompt: dict) -> TokenCount:
+        try:
+            messages = [Message.model_validate(item) for item in prompt["messages"]]
+        except Exception:
+            return TokenCount(0, None, None, "Invalid prompt messages")
+
+        return TokenCount(
+            ChatTokenCounter.count(model_name, messages, None),
+            prompt.get("max_tokens"),
+            None,
+            None,
+        )
+
+    @classmethod
+    def _count_line(cls, model_name: str, line: str) -> TokenCount:
+        try:
+            data = json.loads(line)
+            body = data["body"]
+            messages = [cls._to_message(item) for item in body["messages"]]
+        except Exception:
+            return TokenCount(0, None, None, "Invalid JSONL line")
+
+        return TokenCount(
+            ChatTokenCounter.count(model_name, messages, None),
+            body.get("max_tokens") or None,
+            data.get("custom_id"),
+            None,
+        )
+
+    @classmethod
+    def _to_message(cls, message: dict) -> Message:
+        content = message.get("content") or ""
+        if isinstance(content, list):
+            content = [
+                {
+                    "type": item["type"],
+                    "text": item.get("text"),
+                    "imageUrl": (
+                        {
+                            "url": item["image_url"]["url"].split(
+                                cls._DATA_URL_SEPARATOR, 1
+                            )[-1]
+                        }
+                        if "image_url" in item
+                        else None
+                    ),
+                    "detail": item.get("image_url", {}).get("detail"),
+                }
+                for item in content
+            ]
+
+        return Message.model_validate(
+            {
+                "role": "function" if message["role"] == "tool" else message["role"],
+                "content": content,
+                "tool": (
+                    {
+                        "id": message.get("tool_call_id", ""),
+                        "name": message.get("name", ""),
+                    }
+                    if message["role"] == "tool"
+                    else None
+                ),
+            }
+        )
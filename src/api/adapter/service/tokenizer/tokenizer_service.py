@@ -0,0 +1,105 @@
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import tiktoken
+
+from src.api.core.log.config.log_config import LogConfig
+
+
+class TokenizerService:
+    _ESTIMATE_LOG_SECONDS = 60
+
+    _encodings: Dict[str, Optional[tiktoken.Encoding]] = {}
+    _estimate_logged_at: Dict[str, float] = {}
+    _threads: int = int(
+        os.getenv("TOKENIZER_THREADS", str(min(os.cpu_count() or 4, 8)))
+    )
+    _parallel_min_chars: int = int(os.getenv("TOKENIZER_PARALLEL_MIN_CHARS", "200000"))
+    _executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=_threads, thread_name_prefix="tokenizer"
+    )
+
+    @classmethod
+    def preload(cls, model_names: List[str]) -> None:
+        for model_name in model_names:
+            cls.get_encoding(model_name)
+
+    @classmethod
+    def get_encoding(cls, model_name: str) -> Optional[tiktoken.Encoding]:
+        if model_name not in cls._encodings:
+            try:
+                cls._encodings[model_name] = cls._load_encoding(model_name)
+            except Exception as exception:
+                cls._log_unavailable(model_name, str(exception))
+                cls._encodings[model_name] = None
+        return cls._encodings[model_name]
+
+    @classmethod
+    def count(cls, model_name: str, text: str) -> int:
+        encoding = cls.get_encoding(model_name)
+        if encoding is None:
+            cls._log_estimate(model_name)
+            return cls._estimate(text)
+        return len(encoding.encode_ordinary(text))
+
+    @classmethod
+    def count_many(cls, model_name: str, texts: List[str]) -> List[int]:
+        encoding = cls.get_encoding(model_name)
+        if encoding is None:
+            cls._log_estimate(model_name)
+            return [cls._estimate(text) for text in texts]
+
+        if len(texts) < 2 or sum(map(len, texts)) < cls._parallel_min_chars:
+            return [len(encoding.encode_ordinary(text)) for text in texts]
+
+        size = math.ceil(len(texts) / cls._threads)
+        chunks = [texts[index : index + size] for index in range(0, len(texts), size)]
+        return [
+            count
+            for counts in cls._executor.map(
+                lambda chunk: [len(encoding.encode_ordinary(text)) for text in chunk],
+                chunks,
+            )
+            for count in counts
+        ]
+
+    @classmethod
+    def _load_encoding(cls, model_name: str) -> Optional[tiktoken.Encoding]:
+        try:
+            encoding_name = tiktoken.encoding_name_for_model(model_name)
+        except KeyError:
+            cls._log_unavailable(model_name, "unknown model")
+            return None
+
+        return tiktoken.get_encoding(encoding_name)
+
+    @classmethod
+    def _log_unavailable(cls, model_name: str, reason: str) -> None:
+        LogConfig().get_logger().warning(
+            "TOKENIZER LOG: encoding unavailable, using estimates",
+            model=model_name,
+            reason=reason,
+            cache_dir=os.getenv("TIKTOKEN_CACHE_DIR"),
+        )
+
+    @classmethod
+    def _log_estimate(cls, model_name: str) -> None:
+        now = time.monotonic()
+        if (
+            now - cls._estimate_logged_at.get(model_name, -math.inf)
+            < cls._ESTIMATE_LOG_SECONDS
+        ):
+            return
+
+        cls._estimate_logged_at[model_name] = now
+        LogConfig().get_logger().warning(
+            "TOKENIZER LOG: counting tokens with len/4 estimate",
+            model=model_name,
+        )
+
+    @classmethod
+    def _estimate(cls, text: str) -> int:
+        return math.ceil(len(text) / 4)
@@ -1,3 +1,4 @@
+from typing import List
 from fastapi import Query
 from src.api.adapter.cache.simple.provider_cache import ProviderCache
 from src.api.core.exception.not_found_exception import NotFoundException
@@ -43,6 +44,26 @@ class ModelValidation:
                 ]
             )
 
+    @staticmethod
+    def validate_prompt_tokens(
+        prompt_tokens: int, max_tokens: int, context_window: int, model_name: str
+    ):
+        if context_window and prompt_tokens + (max_tokens or 0) > context_window:
+            raise BadRequestException(
+                params=[
+                    f"The prompt has {prompt_tokens} tokens, which plus maxTokens '{max_tokens or 0}' exceeds the context window '{context_window}' for the model '{model_name}'"
+                ]
+            )
+
+    @staticmethod
+    def validate_input_tokens(token_counts: List[int], max_input: int):
+        if max_input and any(count > max_input for count in token_counts):
+            raise BadRequestException(
+                params=[
+                    f"The number of the tokens in the text cannot be bigger than {max_input}"
+                ]
+            )
+
     @staticmethod
     def validate_model_existence(model_name: str = Query(..., alias="modelName")):
         if not model_name or model_name.strip() == "":
@@ -56,8 +77,9 @@ class ModelValidation:
     @staticmethod
     def validate_batch_purpose(purpose_name: str, model_name: str):
         if purpose_name == "batch":
-            model = ProviderCache.get_provider_model(model_name)
-            if not any(pt == ProcessType.BATCH for pt in model.process_type):
+            if model_name not in ProviderCache.get_model_by_process_type(
+                ProcessType.BATCH
+            ):
                 raise BadRequestException(
                     params=[
                         f"The model_name '{model_name}'does not support batch processing."
@@ -15,8 +15,7 @@ class ProviderValidation:
                 params=["Provider name cannot be empty or blank."]
             )
 
-        providers = ProviderCache.get_providers()
-        if provider_name not in [provider.name for provider in providers]:
+        if provider_name not in ProviderCache.get_valid_provider_names():
             raise NotFoundException(f"Provider {provider_name}")
 
         return provider_name
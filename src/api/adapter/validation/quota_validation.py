@@ -0,0 +1,70 @@
+import os
+
+from fastapi import Depends, Request
+
+from src.api.adapter.http.v1.payload.request.chat_request import ChatRequest
+from src.api.adapter.http.v1.payload.request.common_request import Provider
+from src.api.adapter.http.v1.payload.request.embedding_request import EmbeddingRequest
+from src.api.adapter.http.v1.payload.request.similarity_request import (
+    SimilarityRequest,
+)
+
+
+class QuotaValidation:
+    _default_completion_tokens: int = int(
+        os.getenv("QUOTA_DEFAULT_COMPLETION_TOKENS", "1024")
+    )
+
+    @classmethod
+    async def reserve_chat(
+        cls,
+        request: Request,
+        chat_request: ChatRequest = Depends(ChatRequest.validate),
+    ) -> ChatRequest:
+        max_tokens = (
+            chat_request.prompt.parameter.max_tokens or cls._default_completion_tokens
+        )
+        await cls._reserve(
+            request=request,
+            provider=chat_request.provider,
+            tokens=chat_request.prompt_tokens + max_tokens,
+        )
+        return chat_request
+
+    @classmethod
+    async def reserve_embedding(
+        cls,
+        request: Request,
+        embedding_request: EmbeddingRequest = Depends(EmbeddingRequest.validate),
+    ) -> EmbeddingRequest:
+        await cls._reserve(
+            request=request,
+            provider=embedding_request.provider,
+            tokens=sum(embedding_request.token_counts),
+        )
+        return embedding_request
+
+    @classmethod
+    async def reserve_similarity(
+        cls,
+        request: Request,
+        similarity_request: SimilarityRequest = Depends(SimilarityRequest.validate),
+    ) -> SimilarityRequest:
+        await cls._reserve(
+            request=request,
+            provider=similarity_request.provider,
+            tokens=sum(similarity_request.token_counts),
+        )
+        return similarity_request
+
+    @classmethod
+    async def _reserve(cls, request: Request, provider: Provider, tokens: int) -> None:
+        reservation = getattr(request.state, "quota_reservation", None)
+        if reservation is None:
+            return
+
+        await reservation.reserve(
+            provider_name=provider.name,
+            model_name=provider.model.name,
+            tokens=max(tokens, 1),
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
@@ -7,8 +8,20 @@ from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 
 from src.api.adapter.database.mongodb.client.mongodb import MongoDB
+from src.api.adapter.service.provider.http.http_client_pool import HttpClientPool
+from src.api.adapter.cache.response.chat_response_cache import ChatResponseCache
+from src.api.adapter.cache.embedding.embedding_cache import EmbeddingCache
+from src.api.adapter.cache.simple.provider_cache import ProviderCache
+from src.api.adapter.cache.simple.provider_catalog_sync import ProviderCatalogSync
+from src.api.adapter.cache.simple.quota_cache import QuotaCache
+from src.api.adapter.cache.simple.quota_lease import QuotaLease
+from src.api.adapter.service.tokenizer.tokenizer_service import TokenizerService
+from src.api.adapter.service.tokenizer.token_counter_pool import TokenCounterPool
 from src.api.core.exception.not_found_exception import NotFoundException
 from src.api.core.exception.unauthorized_exception import UnauthorizedException
+from src.api.core.exception.service_unavailable_exception import (
+    ServiceUnavailableException,
+)
 from src.api.adapter.http.v1.handle.route_handle import router
 from src.api.adapter.http.v1.handle.exception_handle import (
     bad_request_exception,
@@ -17,6 +30,7 @@ from src.api.adapter.http.v1.handle.exception_handle import (
     rate_limit_exception,
     not_found_exception,
     unauthorized_exception,
+    service_unavailable_exception,
 )
 from src.api.core.exception.bad_request_exception import (
     BadRequestException,
@@ -31,6 +45,7 @@ from src.api.core.exception.rate_limit_exeception import (
 from src.api.adapter.http.v1.middleware.log_middleware import LogMiddleware
 from src.api.adapter.http.v1.middleware.header_middleware import HeaderMiddleware
 from src.api.adapter.http.v1.middleware.quota_middleware import QuotaMiddleware
+from src.api.adapter.http.v1.middleware.quota_reservation import QuotaReservation
 
 load_dotenv()
 
@@ -39,7 +54,28 @@ load_dotenv()
 async def lifespan(app: FastAPI):
     app.state.mongo_client = MongoDB.initialize_mongo()
     app.state.db = MongoDB.get_database(app.state.mongo_client)
+    ChatResponseCache.initialize(app.state.db)
+    EmbeddingCache.initialize(app.state.db)
+    await ProviderCatalogSync.initialize(app.state.db)
+    QuotaCache.initialize(app.state.db)
+    QuotaLease.initialize(app.state.db)
+    await asyncio.to_thread(
+        TokenizerService.preload,
+        [
+            model.name
+            for provider in ProviderCache.get_providers()
+            for model in provider.models
+        ],
+    )
     yield
+    await ChatResponseCache.close()
+    await EmbeddingCache.close()
+    await ProviderCatalogSync.close()
+    await QuotaReservation.close()
+    await QuotaCache.close()
+    await QuotaLease.close()
+    await HttpClientPool.close()
+    TokenCounterPool.close()
     app.state.mongo_client.close()
 
 
@@ -61,6 +97,9 @@ def api():
     app.add_exception_handler(RateLimitException, rate_limit_exception)
     app.add_exception_handler(NotFoundException, not_found_exception)
     app.add_exception_handler(UnauthorizedException, unauthorized_exception)
+    app.add_exception_handler(
+        ServiceUnavailableException, service_unavailable_exception
+    )
 
     if os.getenv("TOGGLE_QUOTA_MIDDLEWARE", "false").lower() == "true":
         app.add_middleware(QuotaMiddleware)
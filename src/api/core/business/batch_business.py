@@ -13,14 +13,14 @@ class BatchBusiness:
         self.service_provider = ServiceProvider()
         self.cost_client = CostClient()
 
-    def generate_batch(self, batch_request: BatchRequest) -> BatchPort:
-        return self.service_provider.generate_batch(
+    async def generate_batch(self, batch_request: BatchRequest) -> BatchPort:
+        return await self.service_provider.generate_batch(
             provider_name=batch_request.provider.name,
             batch_request=batch_request,
         )
 
-    def get_batch(self, provider_name, model_name, batch_id: str):
-        batch_response = self.service_provider.get_batch(
+    async def get_batch(self, provider_name, model_name, batch_id: str):
+        batch_response = await self.service_provider.get_batch(
             provider_name, model_name, batch_id
         )
         if batch_response.status == BatchStatusResponse.completed:
@@ -9,8 +9,8 @@ class ChatBusiness:
     def __init__(self):
         self.service_provider = ServiceProvider()
 
-    def generate_text(self, chat_request: ChatRequest) -> ChatPort:
-        return self.service_provider.generate_text(
+    async def generate_text(self, chat_request: ChatRequest) -> ChatPort:
+        return await self.service_provider.generate_text(
             provider_name=chat_request.provider.name,
             chat_request=chat_request,
         )
@@ -21,8 +21,8 @@ class ChatBusiness:
             chat_request=chat_request_stream,
         )
 
-    def generate_image(self, image_request: ImageRequest) -> ChatPort:
-        return self.service_provider.generate_image(
+    async def generate_image(self, image_request: ImageRequest) -> ChatPort:
+        return await self.service_provider.generate_image(
             provider_name=image_request.provider.name,
             image_request=image_request,
         )
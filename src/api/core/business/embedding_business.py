@@ -1,15 +1,17 @@
-import tiktoken
-
-from src.api.adapter.http.v1.payload.request.embedding_request import EmbeddingRequest
+from typing import List
+from src.api.adapter.http.v1.payload.request.embedding_request import (
+    Content,
+    EmbeddingRequest,
+)
+from src.api.adapter.http.v1.payload.response.embedding_response import (
+    EmbeddingResponse,
+)
+from src.api.adapter.http.v1.payload.response.cost_response import Usage
+from src.api.adapter.cache.embedding.embedding_cache import EmbeddingCache
 
 from src.api.adapter.service.provider.port.embedding_port import EmbeddingPort
 from src.api.adapter.service.provider.service_provider import ServiceProvider
 from src.api.core.cost.cost_client import CostClient, CostType
-from src.api.adapter.cache.simple.provider_cache import ProviderCache
-
-from src.api.core.exception.bad_request_exception import (
-    BadRequestException,
-)
 
 
 class EmbeddingBusiness:
@@ -18,12 +20,14 @@ class EmbeddingBusiness:
         self.service_provider = ServiceProvider()
         self.cost_client = CostClient()
 
-    def generate_embedding(self, embedding_request: EmbeddingRequest) -> EmbeddingPort:
+    async def generate_embedding(
+        self, embedding_request: EmbeddingRequest
+    ) -> EmbeddingPort:
         model_name = embedding_request.provider.model.name
-        self.check_num_tokens_from_texts(model_name, embedding_request.content.texts)
-        embedding_response = self.service_provider.generate_embedding(
-            provider_name=embedding_request.provider.name,
-            embedding_request=embedding_request,
+        embedding_response = (
+            await self.__generate_with_cache(embedding_request)
+            if EmbeddingCache.is_enabled()
+            else await self.__generate(embedding_request)
         )
         embedding_response.cost = self.cost_client.add(
             model_name=model_name,
@@ -32,18 +36,72 @@ class EmbeddingBusiness:
         )
         return embedding_response
 
-    def check_num_tokens_from_texts(self, model_name: str, texts: list):
-        encoding = tiktoken.encoding_for_model(model_name)
-        max_input_model = ProviderCache.get_provider_model(model_name).max_input
+    async def __generate_with_cache(
+        self, embedding_request: EmbeddingRequest
+    ) -> EmbeddingResponse:
+        model_name = embedding_request.provider.model.name
+        keys = [
+            EmbeddingCache.get_key(model_name, text)
+            for text in embedding_request.content.texts
+        ]
+        cached_vectors = await EmbeddingCache.get_many(keys)
+        missing_indexes = {
+            key: index for index, key in enumerate(keys) if key not in cached_vectors
+        }
 
-        for text in texts:
-            num_tokens = len(encoding.encode(text))
-            self.__check_num_tokens(num_tokens, max_input_model)
+        if not missing_indexes:
+            return EmbeddingResponse(
+                data=[cached_vectors[key].tolist() for key in keys],
+                usage=Usage(prompt_tokens=0, total_tokens=0, cached=True),
+            )
+
+        embedding_response = await self.__generate(
+            self.__select(embedding_request, list(missing_indexes.values()))
+        )
+        new_vectors = dict(zip(missing_indexes.keys(), embedding_response.data))
+        EmbeddingCache.set_many(new_vectors)
 
-    def __check_num_tokens(self, num_tokens: int, max_input_model: int):
-        if num_tokens > max_input_model:
-            raise BadRequestException(
-                params=[
-                    f"The number of the tokens in the text cannot be bigger than {max_input_model}"
-                ]
+        return EmbeddingResponse(
+            data=[
+                new_vectors[key] if key in new_vectors else cached_vectors[key].tolist()
+                for key in keys
+            ],
+            usage=embedding_response.usage,
+        )
+
+    def __select(
+        self, embedding_request: EmbeddingRequest, indexes: List[int]
+    ) -> EmbeddingRequest:
+        texts = embedding_request.content.texts
+        if len(indexes) == len(texts):
+            return embedding_request
+
+        token_counts = embedding_request.token_counts
+        return embedding_request.model_copy(
+            update={
+                "content": Content(texts=[texts[index] for index in indexes]),
+                "token_counts": (
+                    None
+                    if token_counts is None
+                    else [token_counts[index] for index in indexes]
+                ),
+            }
+        )
+
+    async def __generate(
+        self, embedding_request: EmbeddingRequest
+    ) -> EmbeddingResponse:
+        if embedding_request.token_counts is None:
+            embedding_request = embedding_request.model_copy(
+                update={
+                    "token_counts": await EmbeddingRequest.count_tokens(
+                        provider=embedding_request.provider,
+                        texts=embedding_request.content.texts,
+                    )
+                }
             )
+
+        return await self.service_provider.generate_embedding(
+            provider_name=embedding_request.provider.name,
+            embedding_request=embedding_request,
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 
@@ -27,21 +28,15 @@ class FileBusiness:
             "jsonl": JsonlFiles(),
         }
 
-    def generate_file(self, file_request: FileRequest) -> FilePort:
-        provider = next(
-            provider
-            for provider in ProviderCache.get_providers()
-            if provider.name == file_request.provider.name
+    async def generate_file(self, file_request: FileRequest) -> FilePort:
+        provider = ProviderCache.get_provider(file_request.provider.name)
+        provider_model = ProviderCache.get_provider_model(
+            file_request.provider.model.name
         )
-        provider_model = next(
-            model
-            for model in provider.models
-            if model.name == file_request.provider.model.name
+        file_path = await asyncio.to_thread(
+            self.extension[file_request.extension.name.value].create, file_request
         )
-        file_path = self.extension[file_request.extension.name.value].create(
-            file_request
-        )
-        new_file = self.service_provider.generate_file(
+        new_file = await self.service_provider.generate_file(
             provider_name=file_request.provider.name,
             file_object=File(
                 file_path=file_path,
@@ -72,8 +67,8 @@ class FileBusiness:
         self.__delete(file_path)
         return new_file
 
-    def get_file(self, provider_name, model_name, file_id: str):
-        return self.service_provider.get_file(provider_name, model_name, file_id)
+    async def get_file(self, provider_name, model_name, file_id: str):
+        return await self.service_provider.get_file(provider_name, model_name, file_id)
 
     def __delete(self, temp_file_path: str):
         if os.path.exists(temp_file_path):
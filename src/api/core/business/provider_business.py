@@ -3,6 +3,8 @@ from src.api.domain.provider import (
     Endpoint,
     EndpointName,
     Model,
+    ModelDeployment,
+    Fallback,
     Category,
     GenerationType,
     ModalType,
@@ -102,6 +104,11 @@ class ProviderBusiness:
                         ),
                         enabled=True,
                         process_type=[ProcessType.REALTIME],
+                        deployment=ModelDeployment(
+                            name="dalle2",
+                            api_version="2024-05-01-preview",
+                            region="east_us",
+                        ),
                     ),
                     Model(
                         name="dall-e-3",
@@ -153,6 +160,9 @@ class ProviderBusiness:
                         ),
                         enabled=True,
                         process_type=[ProcessType.REALTIME, ProcessType.STREAM],
+                        deployment=ModelDeployment(
+                            name="dalle3", api_version="2024-02-01", region="east_us"
+                        ),
                     ),
                     Model(
                         name="gpt-4o",
@@ -186,6 +196,10 @@ class ProviderBusiness:
                         ),
                         enabled=True,
                         process_type=[ProcessType.REALTIME, ProcessType.STREAM],
+                        fallback=Fallback(models=["gpt-4o-mini"], max_wait_ms=10000),
+                        deployment=ModelDeployment(
+                            name="gpt-4o-pg", api_version="2024-10-21", region="west_us"
+                        ),
                     ),
                     Model(
                         name="gpt-4o-mini",
@@ -219,6 +233,11 @@ class ProviderBusiness:
                         ),
                         enabled=True,
                         process_type=[ProcessType.REALTIME],
+                        deployment=ModelDeployment(
+                            name="gpt-4o-mini",
+                            api_version="2024-10-01-preview",
+                            region="east_us",
+                        ),
                     ),
                     Model(
                         name="text-embedding-ada-002",
@@ -239,6 +258,11 @@ class ProviderBusiness:
                         ),
                         enabled=True,
                         process_type=[ProcessType.REALTIME],
+                        deployment=ModelDeployment(
+                            name="text-embedding-ada-002",
+                            api_version="2023-03-15-preview",
+                            region="west_us",
+                        ),
                     ),
                     Model(
                         name="gpt-4o-batch",
@@ -261,6 +285,9 @@ class ProviderBusiness:
                         ],
                         enabled=True,
                         process_type=[ProcessType.BATCH],
+                        deployment=ModelDeployment(
+                            api_version="2024-07-01-preview", region="west_us"
+                        ),
                     ),
                     Model(
                         name="gpt-4o-mini-batch",
@@ -283,6 +310,9 @@ class ProviderBusiness:
                         ],
                         enabled=True,
                         process_type=[ProcessType.BATCH],
+                        deployment=ModelDeployment(
+                            api_version="2024-07-01-preview", region="west_us"
+                        ),
                     ),
                 ],
             ),
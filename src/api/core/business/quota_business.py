@@ -1,4 +1,7 @@
+from typing import Dict, Tuple
+
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
 
 from src.api.adapter.database.mongodb.client.mongodb_client import MongoDBClient
 from src.api.adapter.http.v1.mapper.quota_mapper import QuotaMapper
@@ -62,6 +65,105 @@ class QuotaBusiness:
 
         await self.mongo_client.update_many(filter=filter, update={"$set": update})
 
+    async def reserve(
+        self, use_case_id: str, provider_name: str, model_name: str, tokens: int
+    ) -> QuotaResponse | None:
+        filter = {
+            "use_case.id": use_case_id,
+            "provider.name": provider_name,
+            "provider.model.name": model_name,
+            "enabled": True,
+            "balance": {"$gte": tokens},
+        }
+        update = {"$inc": {"balance": -tokens}}
+
+        result = await self.mongo_client.find_one_and_update(
+            filter=filter, update=update
+        )
+
+        if result is None:
+            return None
+
+        return QuotaMapper.to_quota_response_from_dict(result)
+
+    async def claim(
+        self,
+        use_case_id: str,
+        provider_name: str,
+        model_name: str,
+        tokens: int,
+        min_tokens: int = 0,
+    ) -> Tuple[QuotaResponse, int]:
+        quota = await self.reserve(
+            use_case_id=use_case_id,
+            provider_name=provider_name,
+            model_name=model_name,
+            tokens=tokens,
+        )
+        if quota is not None:
+            return quota, tokens
+
+        quota = (
+            await self.retrieve(
+                use_case_id=use_case_id,
+                provider_name=provider_name,
+                model_name=model_name,
+                enabled=True,
+            )
+        )[0]
+
+        for claim_tokens in (max(quota.balance // 2, min_tokens), min_tokens):
+            if claim_tokens <= 0 or claim_tokens > quota.balance:
+                continue
+
+            claimed = await self.reserve(
+                use_case_id=use_case_id,
+                provider_name=provider_name,
+                model_name=model_name,
+                tokens=claim_tokens,
+            )
+            if claimed is not None:
+                return claimed, claim_tokens
+
+        return quota, 0
+
+    async def settle(
+        self,
+        quota_id: str,
+        use_case_id: str,
+        provider_name: str,
+        model_name: str,
+        tokens: int,
+    ) -> None:
+        if tokens == 0:
+            return
+
+        filter = {
+            "_id": quota_id,
+            "use_case.id": use_case_id,
+            "provider.name": provider_name,
+            "provider.model.name": model_name,
+        }
+        update = {"$inc": {"balance": tokens}}
+
+        await self.mongo_client.update_one(filter=filter, update=update)
+
+    async def debit_many(self, debits: Dict[Tuple[str, str, str], int]) -> None:
+        operations = [
+            UpdateOne(
+                {
+                    "use_case.id": use_case_id,
+                    "provider.name": provider_name,
+                    "provider.model.name": model_name,
+                    "enabled": True,
+                },
+                {"$inc": {"balance": -tokens}},
+            )
+            for (use_case_id, provider_name, model_name), tokens in debits.items()
+        ]
+
+        await self.mongo_client.bulk_write(operations=operations)
+
     async def update(
         self,
         use_case_id: str,
@@ -81,7 +183,9 @@ class QuotaBusiness:
         }
         update = {"$set": {"enabled": quota.enabled}}
 
-        result = await self.mongo_client.find_one_and_update(filter=filter, update=update)
+        result = await self.mongo_client.find_one_and_update(
+            filter=filter, update=update
+        )
 
         if result is None:
             raise NotFoundException("quota")
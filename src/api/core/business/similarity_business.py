@@ -30,8 +30,8 @@ class SimilarityBusiness:
         self.service_provider = ServiceProvider()
         self.embedding_business = EmbeddingBusiness()
 
-    def generate_similarity(self, similarity_request: SimilarityRequest):
-        embedding_response = self.__get_embedding_response(similarity_request)
+    async def generate_similarity(self, similarity_request: SimilarityRequest):
+        embedding_response = await self.__get_embedding_response(similarity_request)
         embeddings = embedding_response.data
 
         return SimilarityResponse(
@@ -48,13 +48,14 @@ class SimilarityBusiness:
             cost=embedding_response.cost,
         )
 
-    def __get_embedding_response(
+    async def __get_embedding_response(
         self, similarity_request: SimilarityRequest
     ) -> EmbeddingResponse:
-        return self.embedding_business.generate_embedding(
+        return await self.embedding_business.generate_embedding(
             embedding_request=EmbeddingRequest(
                 content=Content(texts=similarity_request.evaluation.texts),
                 provider=similarity_request.provider,
+                tokenCounts=similarity_request.token_counts,
             )
         )
 
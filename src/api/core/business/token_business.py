@@ -0,0 +1,76 @@
+from typing import List
+from src.api.adapter.http.v1.payload.request.token_request import TokenRequest
+from src.api.adapter.http.v1.payload.response.token_response import (
+    TokenItem,
+    TokenResponse,
+)
+from src.api.adapter.http.v1.payload.response.cost_response import Usage
+from src.api.adapter.service.tokenizer.token_counter_pool import (
+    TokenCounterPool,
+    TokenItemType,
+)
+from src.api.core.cost.cost_client import CostClient, CostType
+
+
+class TokenBusiness:
+
+    def __init__(self):
+        self.cost_client = CostClient()
+
+    async def count_tokens(self, token_request: TokenRequest) -> TokenResponse:
+        model_name = token_request.provider.model.name
+        inputs = {
+            TokenItemType.TEXT: token_request.texts or [],
+            TokenItemType.PROMPT: [
+                {
+                    "messages": [
+                        message.model_dump(by_alias=True, exclude_none=True)
+                        for message in prompt.messages
+                    ],
+                    "max_tokens": (
+                        prompt.parameter.max_tokens if prompt.parameter else None
+                    ),
+                }
+                for prompt in token_request.prompts or []
+            ],
+            TokenItemType.JSONL: [
+                line
+                for line in (token_request.jsonl or "").splitlines()
+                if line.strip()
+            ],
+        }
+
+        items: List[TokenItem] = []
+        for item_type, values in inputs.items():
+            if not values:
+                continue
+
+            counts = await TokenCounterPool.count(model_name, item_type, values)
+            items.extend(
+                TokenItem(
+                    index=index,
+                    type=item_type.value,
+                    customId=count.custom_id,
+                    promptTokens=count.prompt_tokens,
+                    completionTokens=count.completion_tokens,
+                    error=count.error,
+                )
+                for index, count in enumerate(counts)
+            )
+
+        prompt_tokens = sum(item.prompt_tokens for item in items)
+        completion_tokens = sum(item.completion_tokens or 0 for item in items)
+        usage = Usage(
+            promptTokens=prompt_tokens,
+            completionTokens=completion_tokens or None,
+            totalTokens=prompt_tokens + completion_tokens,
+        )
+
+        return TokenResponse(
+            model=model_name,
+            items=items,
+            usage=usage,
+            cost=self.cost_client.add(
+                model_name=model_name, usage=usage, cost_type=CostType.TEXT
+            ),
+        )
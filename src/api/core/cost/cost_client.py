@@ -23,9 +23,7 @@ class CostClient:
         usage: Usage,
         cost_type: CostType,
     ) -> Cost | None:
-        model = ProviderCache.get_provider_model(model_name)
-        if model.prices:
-            for price in model.prices:
-                if cost_type in self.calculators:
-                    return self.calculators[cost_type].calculate_cost(price, usage)
+        price = ProviderCache.get_price(model_name)
+        if price is not None and cost_type in self.calculators:
+            return self.calculators[cost_type].calculate_cost(price, usage)
         return None
@@ -3,6 +3,6 @@ import openai
 
 class RateLimitException(Exception):
 
-    def __init__(self, exception: openai.RateLimitError) -> None:
+    def __init__(self, exception: openai.RateLimitError = None) -> None:
         self.exception = exception
         super().__init__(str(exception))
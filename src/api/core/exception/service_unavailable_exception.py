@@ -0,0 +1,5 @@
+class ServiceUnavailableException(Exception):
+    def __init__(self, message: str, retry_after: int = None):
+        self.message = message
+        self.retry_after = retry_after
+        super().__init__(self.message)
@@ -7,12 +7,15 @@ from typing import Optional, List, Any
 
 class OperatorUpdateLogging(Enum):
     SET = "$set"
+    INC = "$inc"
 
 
 class OperationNameLogging(Enum):
     INSERT_ONE = "insert_one"
     FIND_ONE_AND_UPDATE = "find_one_and_update"
+    UPDATE_ONE = "update_one"
     UPDATE_MANY = "update_many"
+    BULK_WRITE = "bulk_write"
     FIND = "find"
 
 
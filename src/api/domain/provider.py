@@ -2,7 +2,7 @@ from collections import namedtuple
 from enum import Enum
 from uuid import UUID, uuid4
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from src.api.domain.price import Price
 
@@ -43,6 +43,17 @@ class ProcessType(str, Enum):
     STREAM = "stream"
 
 
+class Fallback(BaseModel):
+    models: List[str]
+    max_wait_ms: Optional[int] = None
+
+
+class ModelDeployment(BaseModel):
+    name: Optional[str] = None
+    api_version: Optional[str] = None
+    region: Optional[str] = None
+
+
 class Model(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     name: str
@@ -56,6 +67,8 @@ class Model(BaseModel):
     enabled: bool
     endpoints: Optional[List[Endpoint]] = None
     process_type: Optional[List[ProcessType]] = None
+    fallback: Optional[Fallback] = None
+    deployment: Optional[ModelDeployment] = None
 
 
 class Provider(BaseModel):
@@ -64,3 +77,78 @@ class Provider(BaseModel):
     label: str
     description: str
     models: List[Model]
+
+    def to_dict(self) -> dict:
+        data = self.model_dump(mode="json")
+        for model, document in zip(self.models, data["models"]):
+            document["category"] = {
+                "generation_type": model.category.generation_type.name,
+                "modal_type": model.category.modal_type.name,
+            }
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Provider":
+        return cls.model_validate(
+            {
+                **data,
+                "models": [
+                    {
+                        **model,
+                        "category": Category(
+                            generation_type=GenerationType[
+                                model["category"]["generation_type"]
+                            ],
+                            modal_type=ModalType[model["category"]["modal_type"]],
+                        ),
+                    }
+                    for model in data["models"]
+                ],
+            }
+        )
+
+
+class ProviderCatalog(BaseModel):
+    version: int
+    providers: Tuple[Provider, ...]
+    provider_names: Tuple[str, ...]
+    providers_by_name: Dict[str, Provider]
+    models: Dict[str, Model]
+    models_by_generation_type: Dict[int, FrozenSet[str]]
+    models_by_process_type: Dict[ProcessType, FrozenSet[str]]
+    prices: Dict[str, Price]
+
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def build(cls, providers: List[Provider], version: int = 1) -> "ProviderCatalog":
+        models = {
+            model.name: model for provider in providers for model in provider.models
+        }
+
+        return cls(
+            version=version,
+            providers=tuple(providers),
+            provider_names=tuple(provider.name for provider in providers),
+            providers_by_name={provider.name: provider for provider in providers},
+            models=models,
+            models_by_generation_type={
+                generation_type.value.id: frozenset(
+                    name
+                    for name, model in models.items()
+                    if model.category.generation_type == generation_type
+                )
+                for generation_type in GenerationType
+            },
+            models_by_process_type={
+                process_type: frozenset(
+                    name
+                    for name, model in models.items()
+                    if process_type in (model.process_type or [])
+                )
+                for process_type in ProcessType
+            },
+            prices={
+                name: model.prices[0] for name, model in models.items() if model.prices
+            },
+        )